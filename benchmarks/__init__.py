@@ -0,0 +1,17 @@
+"""
+Benchmarks for the import, export and report pipelines.
+
+Benchmark modules are named bench_*.py so they are not collected with the tests.
+Run them with:
+
+    make benchmark
+
+or, choosing the row counts to benchmark with:
+
+    pytest benchmarks -o python_files="bench_*.py" --no-cov --benchmark-rows=10k,100k
+
+Results are saved as JSON in benchmarks/results/ unless --benchmark-json is
+given. Compare two result files with:
+
+    python -m benchmarks.compare old.json new.json
+"""
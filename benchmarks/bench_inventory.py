@@ -0,0 +1,23 @@
+import pytest
+
+from benchmarks.data import Catalogue
+from inventory.forms import ProductSearchForm
+
+
+@pytest.fixture
+def catalogue(rows):
+    return Catalogue(rows)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("search_term", ["", "BENCH-0000", "zzzz"])
+def test_product_search_form_get_queryset(benchmark, catalogue, rows, search_term):
+    form = ProductSearchForm(
+        {"search_term": search_term, "archived": ProductSearchForm.EXCLUDE_ARCHIVED}
+    )
+    assert form.is_valid()
+
+    def search():
+        return list(form.get_queryset())
+
+    benchmark(f"ProductSearchForm.get_queryset({search_term!r})", rows, search)
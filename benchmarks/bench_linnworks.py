@@ -0,0 +1,31 @@
+import pytest
+
+from benchmarks.data import Catalogue, create_linnworks_config, write_stock_level_export
+from linnworks.models import LinnworksProductImportFile, StockLevelExportUpdate
+
+
+@pytest.fixture
+def catalogue(rows):
+    return Catalogue(rows)
+
+
+@pytest.mark.django_db
+def test_stock_level_export_create_update(benchmark, catalogue, rows, tmp_path):
+    export = write_stock_level_export(tmp_path, catalogue.products)
+    update = benchmark(
+        "StockLevelExportManager.create_update",
+        rows,
+        StockLevelExportUpdate.objects.create_update,
+        export,
+    )
+    assert update.stock_level_records.count() == rows
+
+
+@pytest.mark.django_db
+def test_linnworks_product_import_file_create(benchmark, catalogue, rows):
+    create_linnworks_config()
+    csv_file = benchmark(
+        "LinnworksProductImportFile.create", rows, LinnworksProductImportFile.create
+    )
+    skus = {product.sku for product in catalogue.products}
+    assert len([row for row in csv_file.rows if row[0] in skus]) == rows
@@ -0,0 +1,76 @@
+import datetime as dt
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from benchmarks.data import LINES_PER_ORDER, ORDER_DATE, Catalogue, OrderHistory
+from linnworks.models import LinnworksOrder, OrderUpdater
+from orders.models import Order, OrderExporter
+from reports.models import ReorderReportGenerator
+
+
+@pytest.fixture
+def order_history(rows):
+    return OrderHistory(Catalogue(max(rows // 10, 1)))
+
+
+@pytest.mark.django_db
+def test_update_orders(benchmark, order_history, rows, tmp_path):
+    export = order_history.write_processed_orders_export(
+        tmp_path / "processed_orders.csv", rows // LINES_PER_ORDER
+    )
+    benchmark("OrderUpdater.update_orders", rows, OrderUpdater().update_orders, export)
+    assert Order.objects.count() == rows // LINES_PER_ORDER
+
+
+@pytest.mark.django_db
+def test_order_exporter_make_csv(benchmark, order_history, rows):
+    order_count = rows // LINES_PER_ORDER
+    order_history.create_orders(order_count)
+    orders = Order.objects.filter(id__in=Order.objects.values_list("id", flat=True))
+    data = benchmark("OrderExporter.make_csv", rows, OrderExporter().make_csv, orders)
+    assert len(data.splitlines()) == order_count + 1
+
+
+@pytest.fixture
+def dispatched_orders(order_history, rows):
+    order_history.create_orders(rows // LINES_PER_ORDER)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE orders_order, orders_productsale")
+    return order_history
+
+
+@pytest.mark.django_db
+def test_undispatched_orders(benchmark, dispatched_orders, rows):
+    count = benchmark(
+        "Order.objects.undispatched", rows, Order.objects.undispatched().count
+    )
+    assert count == 0
+
+
+@pytest.mark.django_db
+def test_recent_orders(benchmark, dispatched_orders, rows):
+    orders_since = timezone.make_aware(ORDER_DATE - dt.timedelta(days=30))
+    count = benchmark(
+        "LinnworksOrderManager.get_recent_orders",
+        rows,
+        LinnworksOrder.objects.get_recent_orders(orders_since).count,
+    )
+    assert count == rows // LINES_PER_ORDER
+
+
+@pytest.mark.django_db
+def test_sold_counts(benchmark, dispatched_orders, rows):
+    products = dispatched_orders.catalogue.products[:100]
+    date_from = ORDER_DATE.date() - dt.timedelta(days=30)
+    date_to = ORDER_DATE.date() + dt.timedelta(days=1)
+
+    def sold_counts():
+        return [
+            ReorderReportGenerator._get_sold_count(product, date_from, date_to)
+            for product in products
+        ]
+
+    counts = benchmark("ReorderReportGenerator._get_sold_count", rows, sold_counts)
+    assert len(counts) == len(products)
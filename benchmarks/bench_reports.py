@@ -0,0 +1,30 @@
+import datetime as dt
+
+import pytest
+
+from benchmarks.data import (
+    LINES_PER_ORDER,
+    ORDER_DATE,
+    Catalogue,
+    OrderHistory,
+    create_stock_level_update,
+)
+from reports.models import ReorderReportDownload, ReorderReportGenerator
+
+
+@pytest.mark.django_db
+def test_reorder_report_generator(benchmark, rows):
+    catalogue = Catalogue(max(rows // 10, 1))
+    OrderHistory(catalogue).create_orders(rows // LINES_PER_ORDER)
+    create_stock_level_update(catalogue.products)
+    download = ReorderReportDownload(
+        supplier=catalogue.supplier,
+        date_from=ORDER_DATE.date() - dt.timedelta(days=30),
+        date_to=ORDER_DATE.date() + dt.timedelta(days=1),
+    )
+
+    def generate_report():
+        return ReorderReportGenerator(download).generate_csv()
+
+    data = benchmark("ReorderReportGenerator", rows, generate_report)
+    assert len(data.splitlines()) == len(catalogue.products) + 1
@@ -0,0 +1,53 @@
+"""Compare two benchmark result files."""
+
+import argparse
+import json
+
+METRICS = ("wall_time", "queries", "peak_memory")
+
+
+def load_results(path):
+    """Return the commit and the results, keyed by name and rows, of a results file."""
+    with open(path) as f:
+        data = json.load(f)
+    return data["commit"], {
+        (result["name"], result["rows"]): result for result in data["results"]
+    }
+
+
+def change(old, new):
+    """Return the percentage change from old to new as a string."""
+    if not old:
+        return "-"
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def compare(old_path, new_path):
+    """Return lines comparing the benchmarks in two results files."""
+    old_commit, old_results = load_results(old_path)
+    new_commit, new_results = load_results(new_path)
+    lines = [f"{old_commit[:10]} -> {new_commit[:10]}"]
+    for key in sorted(old_results.keys() & new_results.keys()):
+        name, rows = key
+        old, new = old_results[key], new_results[key]
+        changes = ", ".join(
+            f"{metric} {old[metric]} -> {new[metric]} "
+            f"({change(old[metric], new[metric])})"
+            for metric in METRICS
+        )
+        lines.append(f"{name} [{rows} rows]: {changes}")
+    return lines
+
+
+def main():
+    """Print a comparison of two benchmark results files."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("old", help="Results file to compare against.")
+    parser.add_argument("new", help="Results file to compare.")
+    args = parser.parse_args()
+    for line in compare(args.old, args.new):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import datetime as dt
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from django.db import connection
+
+from home import profiling
+
+RESULTS_DIR = Path(__file__).parent / "results"
+results_key = pytest.StashKey[list]()
+
+
+def parse_rows(value):
+    multipliers = {"k": 1_000, "m": 1_000_000}
+    rows = []
+    for item in value.split(","):
+        item = item.strip().lower()
+        if item[-1] in multipliers:
+            rows.append(int(float(item[:-1]) * multipliers[item[-1]]))
+        else:
+            rows.append(int(item))
+    return rows
+
+
+def pytest_configure(config):
+    config.stash[results_key] = []
+
+
+def pytest_generate_tests(metafunc):
+    if "rows" in metafunc.fixturenames:
+        rows = parse_rows(metafunc.config.getoption("benchmark_rows"))
+        metafunc.parametrize("rows", rows, ids=[f"{count}_rows" for count in rows])
+
+
+def current_commit():
+    result = subprocess.run(
+        ["git", "rev-parse", "HEAD"], stdout=subprocess.PIPE, text=True
+    )
+    return result.stdout.strip()
+
+
+def pytest_sessionfinish(session):
+    results = session.config.stash.get(results_key, [])
+    if not results:
+        return
+    commit = current_commit()
+    path = session.config.getoption("benchmark_json")
+    if path is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        timestamp = dt.datetime.now().strftime("%Y%m%d%H%M%S")
+        path = RESULTS_DIR / f"{timestamp}_{commit[:10]}.json"
+    data = {
+        "commit": commit,
+        "created_at": dt.datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+@pytest.fixture
+def benchmark(request):
+    """
+    Return a function running a callable once and recording its performance.
+
+    Records the wall time, the number and duration of database queries and the peak
+    memory allocated by Python while the callable runs. Memory is traced with
+    tracemalloc, which adds overhead to the wall time of every benchmark.
+    """
+
+    def _benchmark(name, rows, func, *args, **kwargs):
+        tracemalloc.start()
+        with profiling.profile_request(name) as profile:
+            with connection.execute_wrapper(profile.query_wrapper):
+                start = time.perf_counter()
+                value = func(*args, **kwargs)
+                wall_time = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        request.config.stash[results_key].append(
+            {
+                "name": name,
+                "rows": rows,
+                "wall_time": round(wall_time, 4),
+                "sql_time": round(profile.sql_time, 4),
+                "queries": profile.query_count,
+                "peak_memory": peak_memory,
+            }
+        )
+        return value
+
+    return _benchmark
@@ -0,0 +1,247 @@
+"""Synthetic data generators for benchmarks."""
+
+import csv
+import datetime as dt
+
+from django.utils import timezone
+
+from home.factories import StaffFactory, UserFactory
+from inventory import factories as inventory_factories
+from inventory import models as inventory_models
+from linnworks.models import (
+    LinnworksChannel,
+    LinnworksConfig,
+    LinnworksShippingService,
+    ProcessedOrdersExport,
+    StockLevelExport,
+    StockLevelExportRecord,
+    StockLevelExportUpdate,
+)
+from orders import factories as order_factories
+from orders import models as order_models
+from shipping import factories as shipping_factories
+
+BATCH_SIZE = 1000
+PRODUCTS_PER_RANGE = 10
+LINES_PER_ORDER = 2
+ORDER_DATE = dt.datetime(2024, 1, 15, 10, 30)
+
+
+def batches(count, batch_size=BATCH_SIZE):
+    """Yield the sizes of batches needed to make count objects."""
+    for start in range(0, count, batch_size):
+        yield min(batch_size, count - start)
+
+
+class Catalogue:
+    """
+    A synthetic product catalogue.
+
+    Products are created in ranges of PRODUCTS_PER_RANGE products sharing a single
+    supplier, brand, manufacturer, VAT rate and package type. Objects are built with
+    the model factories and bulk inserted.
+    """
+
+    def __init__(self, product_count):
+        """Create product_count products."""
+        self.user = UserFactory.create()
+        self.supplier = inventory_factories.SupplierFactory.create()
+        self.brand = inventory_factories.BrandFactory.create()
+        self.manufacturer = inventory_factories.ManufacturerFactory.create()
+        self.vat_rate = inventory_factories.VATRateFactory.create()
+        self.package_type = inventory_factories.PackageTypeFactory.create()
+        self.products = []
+        for batch_size in batches(product_count):
+            self.products.extend(self._create_batch(batch_size))
+
+    def _create_batch(self, batch_size):
+        range_count = -(-batch_size // PRODUCTS_PER_RANGE)
+        product_ranges = inventory_models.ProductRange.objects.bulk_create(
+            inventory_factories.ProductRangeFactory.build_batch(
+                range_count, managed_by=self.user
+            )
+        )
+        products = inventory_factories.ProductFactory.build_batch(
+            batch_size,
+            supplier=self.supplier,
+            brand=self.brand,
+            manufacturer=self.manufacturer,
+            vat_rate=self.vat_rate,
+            package_type=self.package_type,
+        )
+        offset = len(self.products)
+        for i, product in enumerate(products):
+            product.product_range = product_ranges[i // PRODUCTS_PER_RANGE]
+            product.sku = f"BENCH-{offset + i:07d}"
+        return inventory_models.Product.objects.bulk_create_products(products)
+
+
+class OrderHistory:
+    """
+    A synthetic history of dispatched orders with LINES_PER_ORDER sales each.
+
+    Orders are received from a single channel and shipped to a single country with
+    a single shipping service, which have matching Linnworks channel and shipping
+    service records and a shipping price.
+    """
+
+    def __init__(self, catalogue):
+        """Create the shared objects for orders of products in catalogue."""
+        self.catalogue = catalogue
+        self.channel = order_factories.ChannelFactory.create()
+        self.currency = shipping_factories.CurrencyFactory.create(code="GBP")
+        shipping_factories.ExchangeRateFactory.create(
+            currency=self.currency, date=ORDER_DATE.date(), rate=1
+        )
+        self.country = shipping_factories.CountryFactory.create(currency=self.currency)
+        self.shipping_service = shipping_factories.ShippingServiceFactory.create()
+        shipping_factories.ShippingPriceFactory.create(
+            country=self.country, shipping_service=self.shipping_service
+        )
+        self.linnworks_channel = LinnworksChannel.objects.create(
+            source="AMAZON", sub_source="Benchmark", channel=self.channel
+        )
+        self.linnworks_shipping_service = LinnworksShippingService.objects.create(
+            name="Benchmark Shipping", shipping_service=self.shipping_service
+        )
+        self.packed_by = StaffFactory.create()
+
+    def order_product(self, order_number, line):
+        """Return the product sold on a line of an order."""
+        products = self.catalogue.products
+        return products[(order_number * LINES_PER_ORDER + line) % len(products)]
+
+    def create_orders(self, order_count):
+        """Create order_count orders with their product sales."""
+        dispatched_at = timezone.make_aware(ORDER_DATE)
+        for batch_size in batches(order_count):
+            orders = order_models.Order.objects.bulk_create(
+                order_factories.OrderFactory.build_batch(
+                    batch_size,
+                    recieved_at=dispatched_at,
+                    dispatched_at=dispatched_at,
+                    channel=self.channel,
+                    country=self.country,
+                    shipping_service=self.shipping_service,
+                    currency=self.currency,
+                    packed_by=self.packed_by,
+                )
+            )
+            sales = []
+            for i, order in enumerate(orders):
+                for line in range(LINES_PER_ORDER):
+                    product = self.order_product(i, line)
+                    sales.append(
+                        order_factories.ProductSaleFactory.build(
+                            order=order,
+                            sku=product.sku,
+                            supplier=self.catalogue.supplier,
+                        )
+                    )
+            order_models.ProductSale.objects.bulk_create(sales)
+
+    def write_processed_orders_export(self, path, order_count):
+        """Write a Linnworks processed orders export for new orders to path."""
+        cols = ProcessedOrdersExport
+        date = ORDER_DATE.strftime("%Y-%m-%d %H:%M:%S")
+        header = (
+            cols.ORDER_ID,
+            cols.REFERENCE_NUMBER,
+            cols.EXTERNAL_REFERENCE,
+            cols.SHIPPING_COUNTRY_CODE,
+            cols.RECEIVED_DATE,
+            cols.PROCESSED_DATE,
+            cols.SHIPPING_COST,
+            cols.ORDER_TAX,
+            cols.ORDER_TOTAL,
+            cols.CURRENCY,
+            cols.SOURCE,
+            cols.SUBSOURCE,
+            cols.SHIPPING_SERVICE_NAME,
+            cols.TRACKING_NUMBER,
+            cols.SKU,
+            cols.ITEM_TITLE,
+            cols.QUANTITY,
+            cols.UNIT_COST,
+            cols.LINE_TAX,
+            cols.LINE_TOTAL_EXCLUDING_TAX,
+            cols.LINE_TOTAL,
+            cols.COMPOSITE_PARENT_SKU,
+        )
+        with open(path, "w", encoding="utf8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=header)
+            writer.writeheader()
+            for order_number in range(order_count):
+                for line in range(LINES_PER_ORDER):
+                    product = self.order_product(order_number, line)
+                    writer.writerow(
+                        {
+                            cols.ORDER_ID: f"BENCH{order_number}",
+                            cols.REFERENCE_NUMBER: f"REF{order_number}",
+                            cols.EXTERNAL_REFERENCE: f"EXT{order_number}",
+                            cols.SHIPPING_COUNTRY_CODE: self.country.ISO_code,
+                            cols.RECEIVED_DATE: date,
+                            cols.PROCESSED_DATE: date,
+                            cols.SHIPPING_COST: "2.99",
+                            cols.ORDER_TAX: "3.50",
+                            cols.ORDER_TOTAL: "20.99",
+                            cols.CURRENCY: self.currency.code,
+                            cols.SOURCE: self.linnworks_channel.source,
+                            cols.SUBSOURCE: self.linnworks_channel.sub_source,
+                            cols.SHIPPING_SERVICE_NAME: (
+                                self.linnworks_shipping_service.name
+                            ),
+                            cols.TRACKING_NUMBER: f"TRACK{order_number}",
+                            cols.SKU: product.sku,
+                            cols.ITEM_TITLE: product.sku,
+                            cols.QUANTITY: "1",
+                            cols.UNIT_COST: "9.00",
+                            cols.LINE_TAX: "1.50",
+                            cols.LINE_TOTAL_EXCLUDING_TAX: "7.50",
+                            cols.LINE_TOTAL: "9.00",
+                            cols.COMPOSITE_PARENT_SKU: "",
+                        }
+                    )
+        return ProcessedOrdersExport(file_path=path)
+
+
+def write_stock_level_export(directory, products):
+    """Write a Linnworks stock level export for products to directory."""
+    export_time = timezone.now().strftime("%Y%m%d%H%M%S")
+    path = directory / f"stock_level_export_{export_time}.csv"
+    header = (
+        StockLevelExport.SKU,
+        StockLevelExport.QUANTITY,
+        StockLevelExport.IN_ORDER_BOOK,
+        StockLevelExport.IS_COMPOSITE_PARENT,
+    )
+    with open(path, "w", encoding="utf8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for i, product in enumerate(products):
+            writer.writerow((product.sku, i % 50 + 1, i % 3, StockLevelExport.FALSE))
+    return StockLevelExport(file_path=path)
+
+
+def create_stock_level_update(products):
+    """Create a stock level export update recording a stock level for products."""
+    update = StockLevelExportUpdate.objects.create(export_time=timezone.now())
+    records = []
+    for i, product in enumerate(products):
+        record = StockLevelExportRecord(
+            stock_level_update=update,
+            product=product,
+            in_order_book=0,
+            stock_level=i % 50,
+            purchase_price=product.purchase_price,
+            _order=i,
+        )
+        record.stock_value = record.purchase_price * record.stock_level
+        records.append(record)
+    StockLevelExportRecord.objects.bulk_create(records, batch_size=BATCH_SIZE)
+    return update
+
+
+def create_linnworks_config():
+    """Create the Linnworks config used by the Linnworks import files."""
+    return LinnworksConfig.objects.create(last_image_update=timezone.now())
@@ -87,9 +87,7 @@ class ProductSearchForm(forms.Form):
         """Search for product ranges matching the search parameters."""
         products = self._query_products()
         range_queryset = self._filter_listed(self._query_ranges(products))
-        self.ranges = range_queryset.order_by("name").annotate(
-            variation_count=Count("products")
-        )
+        self.ranges = range_queryset.annotate(variation_count=Count("products"))
 
     def _query_products(self):
         search_term = self.cleaned_data["search_term"]
@@ -97,21 +95,11 @@ class ProductSearchForm(forms.Form):
             qs = BaseProduct.objects.text_search(search_term)
         else:
             qs = BaseProduct.objects.all()
-        qs = qs.variations().active()
-        qs = qs.select_related("product_range", "supplier")
-        qs = qs.prefetch_related(
-            "variation_option_values",
-            "variation_option_values__variation_option",
-            "shopify_listing",
-        ).order_by("product_range__name")
-        return qs
+        return qs.variations().active()
 
     def _query_ranges(self, products):
-        range_pks = (
-            products.values_list("product_range", flat=True).order_by().distinct()
-        )
-        return ProductRange.ranges.filter(
-            pk__in=range_pks, status=ProductRange.COMPLETE
+        return ProductRange.ranges.containing(
+            products, ranked=bool(self.cleaned_data["search_term"])
         )
 
     def _filter_listed(self, ranges):
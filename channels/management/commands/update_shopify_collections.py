@@ -1,12 +1,8 @@
 """Update Shopify Collections management command."""
 
-import logging
-
 from django.core.management.base import BaseCommand
 
-from channels.models.shopify_models import ShopifyCollection
-
-logger = logging.getLogger("management_commands")
+from channels import tasks
 
 
 class Command(BaseCommand):
@@ -16,8 +12,4 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         """Update the list of Shopify collections."""
-        try:
-            ShopifyCollection.objects.update_collections()
-        except Exception as e:
-            logger.exception("Error updating shopify collections.")
-            raise e
+        tasks.update_shopify_collections()
@@ -1,12 +1,8 @@
 """Update Shopify Stock management command."""
 
-import logging
-
 from django.core.management.base import BaseCommand
 
-from channels.models.shopify_models import ShopifyStockManager
-
-logger = logging.getLogger("management_commands")
+from channels import tasks
 
 
 class Command(BaseCommand):
@@ -16,8 +12,4 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         """Hide out of stock products on Shopify."""
-        try:
-            ShopifyStockManager.update_out_of_stock()
-        except Exception as e:
-            logger.exception("Error updating shopify stock.")
-            raise e
+        tasks.update_shopify_stock()
@@ -8,6 +8,7 @@ from django.utils import timezone
 from shopify_api_py import products, session
 
 from channels import tasks
+from home import instrumentation
 from inventory.models import (
     BaseProduct,
     ProductImageLink,
@@ -232,6 +233,7 @@ class ShopifyListingManager:
     """Provides methods for managing Shopify listings."""
 
     @classmethod
+    @instrumentation.instrument(instrumentation.SHOPIFY)
     @session.shopify_api_session
     def create_listing(cls, shopify_listing_object):
         """Create a new Shopify product based on a ShopifyListing instance.
@@ -278,6 +280,7 @@ class ShopifyListingManager:
                 shopify_variation_object.save()
 
     @classmethod
+    @instrumentation.instrument(instrumentation.SHOPIFY)
     @session.shopify_api_session
     def update_listing(cls, shopify_listing_object):
         """Update a Shopify product listing.
@@ -367,10 +370,12 @@ class ShopifyListingManager:
             shopify_product=shopify_product, product_range=product_range
         )
         for image in images:
+            image.ensure_renditions()
             products.add_product_image(
                 product_id=shopify_product.id, image_url=image.square_image.url
             )
         for variant_image, variant_ids in variant_images.items():
+            variant_image.ensure_renditions()
             products.add_product_image(
                 product_id=shopify_product.id,
                 image_url=variant_image.square_image.url,
@@ -5,6 +5,8 @@ import time
 import shopify_api_py
 from shopify_api_py.exceptions import ProductNotFoundError
 
+from home import instrumentation
+
 
 class ShopifyManager:
     """Methods for updating Shopify inventory information."""
@@ -32,12 +34,14 @@ class ShopifyManager:
             return True
 
     @classmethod
+    @instrumentation.instrument(instrumentation.SHOPIFY)
     @shopify_api_py.shopify_api_session
     def get_collections(cls):
         """Return a list of all Shopify custom collections."""
         return shopify_api_py.products.get_all_custom_collections()
 
     @classmethod
+    @instrumentation.instrument(instrumentation.SHOPIFY)
     @shopify_api_py.shopify_api_session
     def add_product_to_collection(cls, product_id, collection_id):
         """Add a Shopify product to a collection.
@@ -51,6 +55,7 @@ class ShopifyManager:
         )
 
     @classmethod
+    @instrumentation.instrument(instrumentation.SHOPIFY)
     @shopify_api_py.shopify_api_session
     def remove_product_from_collection(cls, product_id, collection_id):
         """Remove a Shopify product from a collection.
@@ -64,6 +69,7 @@ class ShopifyManager:
         )
 
     @classmethod
+    @instrumentation.instrument(instrumentation.SHOPIFY)
     @shopify_api_py.shopify_api_session
     def remove_product_from_all_collections(cls, product_id):
         """Remove a Shopify product from all collections.
@@ -77,16 +83,19 @@ class ShopifyManager:
             collect.destroy()
 
     @classmethod
+    @instrumentation.instrument(instrumentation.SHOPIFY)
     @shopify_api_py.shopify_api_session
     def _get_product(cls, product_id):
         return shopify_api_py.products.get_product_by_id(product_id=product_id)
 
     @classmethod
+    @instrumentation.instrument(instrumentation.SHOPIFY)
     @shopify_api_py.shopify_api_session
     def _get_variant(cls, variant_id):
         return shopify_api_py.products.get_variant_by_id(variant_id=variant_id)
 
     @classmethod
+    @instrumentation.instrument(instrumentation.SHOPIFY)
     @shopify_api_py.shopify_api_session
     def _get_inventory_item(cls, inventory_item_id):
         return shopify_api_py.products.get_inventory_item_by_id(
@@ -94,11 +103,13 @@ class ShopifyManager:
         )
 
     @classmethod
+    @instrumentation.instrument(instrumentation.SHOPIFY)
     @shopify_api_py.shopify_api_session
     def _get_products(cls):
         return shopify_api_py.products.get_all_products()
 
     @classmethod
+    @instrumentation.instrument(instrumentation.SHOPIFY)
     @shopify_api_py.shopify_api_session
     def _get_location_id(cls):
         locations = shopify_api_py.locations.get_inventory_locations()
@@ -109,12 +120,18 @@ class ShopifyManager:
         new_stock_level = stock_levels[variant.sku]
         current_stock_level = variant.inventory_quantity
         if current_stock_level != new_stock_level:
-            shopify_api_py.products.update_variant_stock(
-                variant=variant,
-                new_stock_level=new_stock_level,
-                location_id=location_id,
-            )
-            time.sleep(cls.REQUEST_PAUSE)
+            with instrumentation.api_call(
+                instrumentation.SHOPIFY, "ShopifyManager._update_variant_stock"
+            ):
+                shopify_api_py.products.update_variant_stock(
+                    variant=variant,
+                    new_stock_level=new_stock_level,
+                    location_id=location_id,
+                )
+            with instrumentation.rate_limit_wait(
+                instrumentation.SHOPIFY, "ShopifyManager._update_variant_stock"
+            ):
+                time.sleep(cls.REQUEST_PAUSE)
 
     @classmethod
     def _update_product_status(cls, product):
@@ -127,16 +144,24 @@ class ShopifyManager:
     @classmethod
     def _set_product_status(cls, product, status):
         product.status = status
-        product.save()
-        time.sleep(cls.REQUEST_PAUSE)
+        with instrumentation.api_call(
+            instrumentation.SHOPIFY, "ShopifyManager._set_product_status"
+        ):
+            product.save()
+        with instrumentation.rate_limit_wait(
+            instrumentation.SHOPIFY, "ShopifyManager._set_product_status"
+        ):
+            time.sleep(cls.REQUEST_PAUSE)
 
     @classmethod
+    @instrumentation.instrument(instrumentation.SHOPIFY)
     @shopify_api_py.shopify_api_session
     def _hide_product(cls, product):
         product.status = cls.DRAFT
         product.save()
 
     @classmethod
+    @instrumentation.instrument(instrumentation.SHOPIFY)
     @shopify_api_py.shopify_api_session
     def _unhide_product(cls, product):
         product.status = cls.ACTIVE
@@ -3,6 +3,7 @@
 from celery import shared_task
 
 from channels import models
+from home.jobs import scheduled_job
 
 
 @shared_task
@@ -41,3 +42,17 @@ def update_shopify_product(listing_pk, update_pk):
         raise
     else:
         update.set_complete()
+
+
+@shared_task
+@scheduled_job("update_shopify_stock")
+def update_shopify_stock():
+    """Hide out of stock products on Shopify."""
+    models.shopify_models.ShopifyStockManager.update_out_of_stock()
+
+
+@shared_task
+@scheduled_job("update_shopify_collections")
+def update_shopify_collections():
+    """Update the list of Shopify collections."""
+    models.shopify_models.ShopifyCollection.objects.update_collections()
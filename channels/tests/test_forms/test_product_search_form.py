@@ -27,13 +27,19 @@ def test_has_list_filter_default_attribute():
 def test_query_ranges_method(mock_product_range):
     products = mock.Mock()
     form = ProductSearchForm()
+    form.cleaned_data = {"search_term": None}
     value = form._query_ranges(products)
-    products.values_list.assert_called_once_with("product_range", flat=True)
-    mock_product_range.ranges.filter.assert_called_once_with(
-        pk__in=products.values_list.return_value.order_by.return_value.distinct.return_value,
-        status=mock_product_range.COMPLETE,
-    )
-    assert value == mock_product_range.ranges.filter.return_value
+    mock_product_range.ranges.containing.assert_called_once_with(products, ranked=False)
+    assert value == mock_product_range.ranges.containing.return_value
+
+
+@mock.patch("channels.forms.ProductRange")
+def test_query_ranges_method_ranks_search_results(mock_product_range):
+    products = mock.Mock()
+    form = ProductSearchForm()
+    form.cleaned_data = {"search_term": "text"}
+    form._query_ranges(products)
+    mock_product_range.ranges.containing.assert_called_once_with(products, ranked=True)
 
 
 def test_filter_listed_method_with_created():
@@ -73,20 +79,7 @@ def test_query_products_method(
     qs = mock_base_product.objects.all.return_value
     qs.variations.assert_called_once_with()
     qs.variations.return_value.active.assert_called_once_with()
-    active = qs.variations.return_value.active.return_value
-    active.select_related.assert_called_once_with("product_range", "supplier")
-    active.select_related.return_value.prefetch_related.assert_called_once_with(
-        "variation_option_values",
-        "variation_option_values__variation_option",
-        "shopify_listing",
-    )
-    active.select_related.return_value.prefetch_related.return_value.order_by.assert_called_once_with(
-        "product_range__name"
-    )
-    assert (
-        value
-        == active.select_related.return_value.prefetch_related.return_value.order_by.return_value
-    )
+    assert value == qs.variations.return_value.active.return_value
 
 
 @mock.patch("channels.forms.BaseProduct")
@@ -121,12 +114,8 @@ def test_save_method(
     mock_query_products.assert_called_once_with()
     mock_query_ranges.assert_called_once_with(mock_query_products.return_value)
     mock_filter_listed.assert_called_once_with(mock_query_ranges.return_value)
-    mock_filter_listed.return_value.order_by.assert_called_once_with("name")
     mock_count.assert_called_once_with("products")
-    mock_filter_listed.return_value.order_by.return_value.annotate.assert_called_once_with(
+    mock_filter_listed.return_value.annotate.assert_called_once_with(
         variation_count=mock_count.return_value
     )
-    assert (
-        form.ranges
-        == mock_filter_listed.return_value.order_by.return_value.annotate.return_value
-    )
+    assert form.ranges == mock_filter_listed.return_value.annotate.return_value
@@ -3,30 +3,29 @@ from unittest import mock
 import pytest
 
 from channels.management import commands
+from home.jobs import JobLock, JobLockedError
 
 
 @pytest.fixture
 def mock_shopify_collection():
-    with mock.patch(
-        "channels.management.commands.update_shopify_collections.ShopifyCollection"
-    ) as m:
+    with mock.patch("channels.tasks.models.shopify_models.ShopifyCollection") as m:
         yield m
 
 
 @pytest.fixture
 def mock_logger():
-    with mock.patch(
-        "channels.management.commands.update_shopify_collections.logger"
-    ) as m:
+    with mock.patch("home.jobs.logger") as m:
         yield m
 
 
+@pytest.mark.django_db
 def test_update_shopify_collection_command(mock_logger, mock_shopify_collection):
     commands.update_shopify_collections.Command().handle()
     mock_shopify_collection.objects.update_collections.assert_called_once_with()
     mock_logger.exception.assert_not_called()
 
 
+@pytest.mark.django_db
 def test_update_shopify_collection_command_handles_error(
     mock_logger, mock_shopify_collection
 ):
@@ -34,4 +33,14 @@ def test_update_shopify_collection_command_handles_error(
     with pytest.raises(Exception):
         commands.update_shopify_collections.Command().handle()
     mock_shopify_collection.objects.update_collections.assert_called_once_with()
-    mock_logger.exception.assert_called_once_with("Error updating shopify collections.")
+    mock_logger.exception.assert_called_once_with(
+        "Error running update_shopify_collections."
+    )
+
+
+@pytest.mark.django_db
+def test_update_shopify_collection_command_takes_job_lock(mock_shopify_collection):
+    JobLock("update_shopify_collections", timeout=60).acquire()
+    with pytest.raises(JobLockedError):
+        commands.update_shopify_collections.Command().handle()
+    mock_shopify_collection.objects.update_collections.assert_not_called()
@@ -3,28 +3,29 @@ from unittest import mock
 import pytest
 
 from channels.management import commands
+from home.jobs import JobLock, JobLockedError
 
 
 @pytest.fixture
 def mock_shopify_stock_manager():
-    with mock.patch(
-        "channels.management.commands.update_shopify_stock.ShopifyStockManager"
-    ) as m:
+    with mock.patch("channels.tasks.models.shopify_models.ShopifyStockManager") as m:
         yield m
 
 
 @pytest.fixture
 def mock_logger():
-    with mock.patch("channels.management.commands.update_shopify_stock.logger") as m:
+    with mock.patch("home.jobs.logger") as m:
         yield m
 
 
+@pytest.mark.django_db
 def test_update_shopify_collection_command(mock_logger, mock_shopify_stock_manager):
     commands.update_shopify_stock.Command().handle()
     mock_shopify_stock_manager.update_out_of_stock.assert_called_once_with()
     mock_logger.exception.assert_not_called()
 
 
+@pytest.mark.django_db
 def test_update_shopify_collection_command_handles_error(
     mock_logger, mock_shopify_stock_manager
 ):
@@ -32,4 +33,12 @@ def test_update_shopify_collection_command_handles_error(
     with pytest.raises(Exception):
         commands.update_shopify_stock.Command().handle()
     mock_shopify_stock_manager.update_out_of_stock.assert_called_once_with()
-    mock_logger.exception.assert_called_once_with("Error updating shopify stock.")
+    mock_logger.exception.assert_called_once_with("Error running update_shopify_stock.")
+
+
+@pytest.mark.django_db
+def test_update_shopify_stock_command_takes_job_lock(mock_shopify_stock_manager):
+    JobLock("update_shopify_stock", timeout=60).acquire()
+    with pytest.raises(JobLockedError):
+        commands.update_shopify_stock.Command().handle()
+    mock_shopify_stock_manager.update_out_of_stock.assert_not_called()
@@ -195,6 +195,8 @@ def test_set_listing_images_method(
     mock_products.add_product_image.assert_has_calls(
         product_images_calls + variation_image_calls
     )
+    for image in images:
+        image.ensure_renditions.assert_called()
 
 
 @mock.patch(
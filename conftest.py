@@ -1,3 +1,168 @@
+from unittest import mock
+
 import factory.random
+import pytest
+from django.core.cache import caches
+
+from home.locks import CacheLock
 
 factory.random.reseed_random("stcadmin")
+
+
+def _encode(value):
+    return value if isinstance(value, bytes) else str(value).encode()
+
+
+def _slice(start, end):
+    return slice(start, None if end == -1 else end + 1)
+
+
+class FakeRedis:
+    """
+    An in memory stand in for the Redis connection of a django_redis cache.
+
+    Implements the commands used with django_redis.get_redis_connection, returning
+    bytes as Redis does. Expiry times are ignored.
+    """
+
+    def __init__(self):
+        """Create an empty server."""
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        """Return a pipeline queueing commands until it is executed."""
+        return FakePipeline(self)
+
+    def delete(self, *keys):
+        """Delete keys."""
+        return sum(self.data.pop(_encode(key), None) is not None for key in keys)
+
+    def get(self, key):
+        """Return the value of a string key."""
+        return self.data.get(_encode(key))
+
+    def set(self, key, value, nx=False, ex=None):
+        """Set a string key, only if it does not exist when nx is True."""
+        if nx and _encode(key) in self.data:
+            return None
+        self.data[_encode(key)] = _encode(value)
+        return True
+
+    def expire(self, key, seconds):
+        """Set an expiry time on key."""
+        return _encode(key) in self.data
+
+    def hincrby(self, key, field, amount=1):
+        """Increment an integer field of a hash."""
+        values = self.data.setdefault(_encode(key), {})
+        value = int(values.get(_encode(field), 0)) + amount
+        values[_encode(field)] = _encode(value)
+        return value
+
+    def hincrbyfloat(self, key, field, amount=1.0):
+        """Increment a float field of a hash."""
+        values = self.data.setdefault(_encode(key), {})
+        value = float(values.get(_encode(field), 0)) + amount
+        values[_encode(field)] = _encode(value)
+        return value
+
+    def hgetall(self, key):
+        """Return the fields of a hash."""
+        return dict(self.data.get(_encode(key), {}))
+
+    def sadd(self, key, *members):
+        """Add members to a set."""
+        values = self.data.setdefault(_encode(key), set())
+        added = {_encode(member) for member in members} - values
+        values.update(added)
+        return len(added)
+
+    def smembers(self, key):
+        """Return the members of a set."""
+        return set(self.data.get(_encode(key), set()))
+
+    def lpush(self, key, *values):
+        """Add values to the start of a list."""
+        items = self.data.setdefault(_encode(key), [])
+        for value in values:
+            items.insert(0, _encode(value))
+        return len(items)
+
+    def ltrim(self, key, start, end):
+        """Trim a list to the items from start to end inclusive."""
+        items = self.data.get(_encode(key), [])
+        items[:] = items[_slice(start, end)]
+        return True
+
+    def lrange(self, key, start, end):
+        """Return the items of a list from start to end inclusive."""
+        return list(self.data.get(_encode(key), [])[_slice(start, end)])
+
+    def register_script(self, script):
+        """Return a callable running a Python version of a known Lua script."""
+        scripts = {CacheLock.RELEASE_SCRIPT: self._compare_and_delete}
+        function = scripts[script]
+
+        def run(keys=(), args=(), client=None):
+            return function(*keys, *args)
+
+        return run
+
+    def _compare_and_delete(self, key, value):
+        if self.get(key) != _encode(value):
+            return 0
+        return self.delete(key)
+
+
+class FakePipeline:
+    """A pipeline for FakeRedis."""
+
+    def __init__(self, redis):
+        """Create a pipeline for redis."""
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        command = getattr(self.redis, name)
+
+        def queue(*args, **kwargs):
+            self.commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        """Run the queued commands and return their results."""
+        results = [command(*args, **kwargs) for command, args, kwargs in self.commands]
+        self.commands = []
+        return results
+
+
+@pytest.fixture(autouse=True)
+def fake_redis():
+    redis = FakeRedis()
+    with mock.patch("django_redis.get_redis_connection", return_value=redis):
+        yield redis
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    yield
+    caches["default"].clear()
+    caches["product_lookup"].clear()
+    caches["profiling"].clear()
+    caches["locks"].clear()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark-rows",
+        default="10k",
+        help="Comma separated row counts to run benchmarks with, eg. 10k,100k,1m.",
+    )
+    group.addoption(
+        "--benchmark-json",
+        default=None,
+        help="Path to save benchmark results to.",
+    )
@@ -12,7 +12,7 @@ from django.utils.timezone import make_aware, now
 from fba import models
 from home.models import Staff
 from inventory.forms.fieldtypes import SelectizeModelChoiceField
-from inventory.models import BaseProduct, ProductRange, Supplier
+from inventory.models import BaseProduct, ProductCodeLookup, ProductRange, Supplier
 
 
 class SelectFBAOrderProductForm(forms.Form):
@@ -21,15 +21,20 @@ class SelectFBAOrderProductForm(forms.Form):
     product_SKU = forms.CharField()
 
     def clean(self):
-        """Add product ID to cleaned data."""
+        """Add the product matching the SKU, supplier SKU or barcode."""
         cleaned_data = super().clean()
-        try:
-            cleaned_data["product"] = BaseProduct.objects.get(
-                sku=cleaned_data["product_SKU"],
+        products = list(
+            BaseProduct.objects.filter(
+                id__in=ProductCodeLookup.product_ids([cleaned_data["product_SKU"]]),
                 product_range__status=ProductRange.COMPLETE,
-            )
-        except BaseProduct.DoesNotExist:
+            )[:2]
+        )
+        if not products:
             self.add_error("product_SKU", "Product not found")
+        elif len(products) > 1:
+            self.add_error("product_SKU", "Multiple products found")
+        else:
+            cleaned_data["product"] = products[0]
 
 
 class CurrencyWidget(forms.TextInput):
@@ -282,7 +287,6 @@ class FBAOrderFilter(forms.Form):
                 "tracking_numbers",
                 "product__variation_option_values",
             )
-            .distinct()
         )
         return qs
 
@@ -295,7 +299,7 @@ class FBAOrderFilter(forms.Form):
                 | Q(tracking_numbers__tracking_number=search_text)
                 | Q(product_asin__icontains=search_text)
             )
-        )
+        ).distinct()
         return qs
 
     def filter_priority(self, qs):
@@ -698,10 +702,8 @@ class FBAShipmentFilter(forms.Form):
         )
         if search_text := self.cleaned_data["search"]:
             qs = self.text_search(search_text, qs)
-        qs = qs.prefetch_related(
-            "parcelhub_shipment",
-            "shipment_package",
-            "shipment_package__shipment_item",
+        qs = qs.with_totals().select_related(
+            "parcelhub_shipment", "destination", "user"
         )
         return qs.distinct()
 
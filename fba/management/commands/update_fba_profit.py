@@ -1,12 +1,8 @@
 """Update FBA profit calculations."""
 
-import logging
-
 from django.core.management.base import BaseCommand
 
-from fba.models import FBAProfitFile
-
-logger = logging.getLogger("management_commands")
+from fba import tasks
 
 
 class Command(BaseCommand):
@@ -16,8 +12,4 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         """Create a linnworks channel linking file."""
-        try:
-            FBAProfitFile.objects.update_from_exports()
-        except Exception as e:
-            logger.exception("Error updating FBA profit.")
-            raise e
+        tasks.update_fba_profit()
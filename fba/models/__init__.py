@@ -2,7 +2,12 @@
 
 from .fba import FBARegion, FBATrackingNumber
 from .fba_order import FBAOrder
-from .parcelhub import ParcelhubAPIConfig, ParcelhubShipment, ParcelhubShipmentFiling
+from .parcelhub import (
+    ParcelhubAPIConfig,
+    ParcelhubSessionPool,
+    ParcelhubShipment,
+    ParcelhubShipmentFiling,
+)
 from .price_calculator import FBAPriceCalculator
 from .profit import FBAProfit, FBAProfitFile
 from .shipments import (
@@ -19,6 +24,7 @@ __all__ = [
     "FBAPriceCalculator",
     "FBAOrder",
     "ParcelhubAPIConfig",
+    "ParcelhubSessionPool",
     "ParcelhubShipment",
     "ParcelhubShipmentFiling",
     "FBARegion",
@@ -1,11 +1,16 @@
 """Models for managing Parcelhub API shipments."""
 
+import threading
+from datetime import timedelta
+
 from django.conf import settings
 from django.db import models
 from django.utils import timezone
 from parcelhubapi import CreateShipmentRequest, ParcelhubAPISession, ShipmentRequest
 from solo.models import SingletonModel
 
+from home import instrumentation
+
 
 class ParcelhubAPIConfig(SingletonModel):
     """Model for Parcelhub API configuration."""
@@ -34,6 +39,51 @@ class ParcelhubAPIConfig(SingletonModel):
         verbose_name = "Parcelhub API Config"
 
 
+class ParcelhubSessionPool:
+    """
+    Share an authorised Parcelhub API session between filings.
+
+    The session is authorised once and reused by every filing made in the same
+    process until SESSION_LIFETIME has passed, at which point it is authorised
+    again. Reusing the session object also reuses its HTTP connections.
+    """
+
+    SESSION_LIFETIME = timedelta(minutes=50)
+
+    _lock = threading.Lock()
+    _session = None
+    _authorised_at = None
+
+    @classmethod
+    def get_session(cls):
+        """Return an authorised Parcelhub API session."""
+        with cls._lock:
+            if cls._session is None or cls._has_expired():
+                session = ParcelhubAPISession(
+                    username=settings.PARCELHUB_API_USERNAME,
+                    password=settings.PARCELHUB_API_PASSWORD,
+                    account_id=settings.PARCELHUB_API_ACCOUNT_ID,
+                )
+                with instrumentation.api_call(
+                    instrumentation.PARCELHUB, "authorise_session"
+                ):
+                    session.authorise_session()
+                cls._session = session
+                cls._authorised_at = timezone.now()
+            return cls._session
+
+    @classmethod
+    def clear(cls):
+        """Discard the current session so the next filing authorises again."""
+        with cls._lock:
+            cls._session = None
+            cls._authorised_at = None
+
+    @classmethod
+    def _has_expired(cls):
+        return timezone.now() - cls._authorised_at >= cls.SESSION_LIFETIME
+
+
 class ParcelhubShipment(models.Model):
     """Model for recording Parcelhub shipments."""
 
@@ -56,7 +106,12 @@ class ParcelhubShipment(models.Model):
         """Manager for the ParcelhubShipment model."""
 
         def create_shipment(self, shipment_order):
-            """Create a Parcelhub API shipment."""
+            """
+            Create a Parcelhub API shipment.
+
+            Args:
+                shipment_order (fba.models.FBAShipmentOrder): The order to file.
+            """
             if self.filter(shipment_order=shipment_order).exists():
                 raise Exception("Shipment already filed.")
             shipment_creator = self._ParcelhubAPIShipmentCreator(
@@ -87,12 +142,7 @@ class ParcelhubShipment(models.Model):
             def create_shipment(self):
                 """Create a Parcelhub API shipment."""
                 self.config = ParcelhubAPIConfig.get_solo()
-                self.session = ParcelhubAPISession(
-                    username=settings.PARCELHUB_API_USERNAME,
-                    password=settings.PARCELHUB_API_PASSWORD,
-                    account_id=settings.PARCELHUB_API_ACCOUNT_ID,
-                )
-                self.session.authorise_session()
+                self.session = ParcelhubSessionPool.get_session()
                 self.request_data = ShipmentRequest(
                     session=self.session,
                     reference=self.shipment_order.order_number,
@@ -202,9 +252,12 @@ class ParcelhubShipment(models.Model):
 
             def make_create_shipment_request(self):
                 """Register the shipment with the Parcelhub API."""
-                return CreateShipmentRequest(session=self.session).call(
-                    shipment_request=self.request_data
-                )
+                with instrumentation.api_call(
+                    instrumentation.PARCELHUB, "CreateShipmentRequest"
+                ):
+                    return CreateShipmentRequest(session=self.session).call(
+                        shipment_request=self.request_data
+                    )
 
             def as_currency(self, value):
                 """Return pence as pounds and pence."""
@@ -10,6 +10,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db import models, transaction
 from django.utils import timezone
 
+from home import instrumentation
 from inventory.models import BaseProduct
 from stcadmin import settings
 
@@ -298,14 +299,28 @@ class BaseFeeEstimateFile:
 
     def get_file(self):
         """Download and return a report file."""
+        name = type(self).__name__
         with self.session() as s:
-            report_id = request.request_generate_report(
-                session=s, report_type=self.REPORT_TYPE
-            )
-            time.sleep(self.timeout)
-            document_id = request.request_document_id(s, report_id=report_id)
-            document_url = request.request_document_url(s, document_id=document_id)
-        document = requests.get(document_url).text
+            with instrumentation.api_call(
+                instrumentation.AMAZON, f"{name}.request_generate_report"
+            ):
+                report_id = request.request_generate_report(
+                    session=s, report_type=self.REPORT_TYPE
+                )
+            with instrumentation.rate_limit_wait(
+                instrumentation.AMAZON, f"{name}.request_generate_report"
+            ):
+                time.sleep(self.timeout)
+            with instrumentation.api_call(
+                instrumentation.AMAZON, f"{name}.request_document_id"
+            ):
+                document_id = request.request_document_id(s, report_id=report_id)
+            with instrumentation.api_call(
+                instrumentation.AMAZON, f"{name}.request_document_url"
+            ):
+                document_url = request.request_document_url(s, document_id=document_id)
+        with instrumentation.api_call(instrumentation.AMAZON, f"{name}.get_document"):
+            document = requests.get(document_url).text
         return document
 
     def read_file(self, document):
@@ -2,8 +2,18 @@
 
 from django.conf import settings
 from django.db import models
-from django.db.models import Case, Count, F, Sum, Value, When
-from django.db.models.functions import Concat, Left, Length
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    Min,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Concat, Left, Length
 from django.utils import timezone
 from solo.models import SingletonModel
 
@@ -22,10 +32,19 @@ def shortened_description_list(descriptions, max_length=30):
     descriptions = sorted(set(descriptions))
     if len(descriptions) == 0:
         return ""
-    description_text = shortened_description(descriptions[0], max_length=max_length)
+    return shortened_description_summary(
+        descriptions[0], len(descriptions), max_length=max_length
+    )
+
+
+def shortened_description_summary(first_description, description_count, max_length=30):
+    """Return a shortened description from the first of a number of descriptions."""
+    if not description_count:
+        return ""
+    description_text = shortened_description(first_description, max_length=max_length)
     description = (
-        f"{description_text} + {len(descriptions) - 1} other items"
-        if len(descriptions) > 1
+        f"{description_text} + {description_count - 1} other items"
+        if description_count > 1
         else description_text
     )
     return description
@@ -136,6 +155,68 @@ class FBAShipmentExport(models.Model):
         return f"FBA Shipment Export {self.created_at.strftime('%Y-%m-%d')}"
 
 
+class FBAShipmentOrderQueryset(models.QuerySet):
+    """Custom queryset for FBA shipment orders."""
+
+    def with_totals(self):
+        """
+        Annotate shipment totals.
+
+        Adds total_weight_kg, total_value, total_item_count, package_count,
+        first_description and description_count, which are used by the
+        corresponding FBAShipmentOrder properties in place of per-order queries.
+        """
+        return self.annotate(
+            total_weight_kg=Coalesce(
+                self._item_aggregate(
+                    Sum(
+                        F("weight_kg") * F("quantity"),
+                        output_field=models.FloatField(),
+                    )
+                ),
+                0.0,
+            ),
+            total_value=Coalesce(
+                self._item_aggregate(
+                    Sum(
+                        F("value") * F("quantity"),
+                        output_field=models.IntegerField(),
+                    )
+                ),
+                0,
+            ),
+            total_item_count=self._item_aggregate(Sum("quantity")),
+            first_description=self._item_aggregate(Min("description")),
+            description_count=Coalesce(
+                self._item_aggregate(Count("description", distinct=True)), 0
+            ),
+            package_count=Coalesce(
+                Subquery(
+                    FBAShipmentPackage._base_manager.filter(
+                        shipment_order=OuterRef("pk")
+                    )
+                    .order_by()
+                    .values("shipment_order")
+                    .annotate(count=Count("pk"))
+                    .values("count")
+                ),
+                0,
+            ),
+        )
+
+    @staticmethod
+    def _item_aggregate(aggregate):
+        return Subquery(
+            FBAShipmentItem._base_manager.filter(
+                package__shipment_order=OuterRef("pk")
+            )
+            .order_by()
+            .values("package__shipment_order")
+            .annotate(aggregate=aggregate)
+            .values("aggregate")
+        )
+
+
 class FBAShipmentOrder(models.Model):
     """View for FBA Shipment orders."""
 
@@ -159,6 +240,8 @@ class FBAShipmentOrder(models.Model):
     planned_shipment_date = models.DateField(blank=True, null=True)
     at_risk = models.BooleanField(default=False)
 
+    objects = FBAShipmentOrderQueryset.as_manager()
+
     class Meta:
         """Meta class for FBAShipmentOrder."""
 
@@ -176,21 +259,21 @@ class FBAShipmentOrder(models.Model):
     @property
     def description(self, max_length=30):
         """Return a text description of the shipment."""
-        descriptions = self.shipment_package.values_list(
-            "shipment_item__description", flat=True
-        )
+        if hasattr(self, "description_count"):
+            return shortened_description_summary(
+                self.first_description, self.description_count, max_length=max_length
+            )
+        descriptions = self.items().values_list("description", flat=True)
         return shortened_description_list(descriptions, max_length=max_length)
 
     @property
     def is_shippable(self):
         """Return True if shipment is ready for completion, otherwise False."""
-        return all(
-            (
-                self.export is None,
-                self.is_on_hold is False,
-                self.shipment_package.count() > 0,
-            )
-        )
+        if hasattr(self, "package_count"):
+            has_packages = self.package_count > 0
+        else:
+            has_packages = self.shipment_package.exists()
+        return all((self.export_id is None, self.is_on_hold is False, has_packages))
 
     def items(self):
         """Return a queryset of items in this shipment."""
@@ -199,23 +282,29 @@ class FBAShipmentOrder(models.Model):
     @property
     def item_count(self):
         """Return the number of items in this shipment."""
+        if hasattr(self, "total_item_count"):
+            return self.total_item_count
         return self.items().aggregate(Sum("quantity"))["quantity__sum"]
 
     @property
     def weight_kg(self):
         """Return the total calculated weight of the shipment."""
-        weight = 0
-        for item in self.items():
-            weight += item.weight_kg * item.quantity
-        return round(weight, 2)
+        if hasattr(self, "total_weight_kg"):
+            return round(self.total_weight_kg, 2)
+        weight = self.items().aggregate(
+            weight=Sum(F("weight_kg") * F("quantity"), output_field=models.FloatField())
+        )["weight"]
+        return round(weight or 0, 2)
 
     @property
     def value(self):
         """Return the total calculated value of the shipment."""
-        value = 0
-        for item in self.items():
-            value += item.value * item.quantity
-        return value
+        if hasattr(self, "total_value"):
+            return self.total_value
+        value = self.items().aggregate(
+            value=Sum(F("value") * F("quantity"), output_field=models.IntegerField())
+        )["value"]
+        return value or 0
 
     def close_shipment_order(self):
         """Create a shipment export for this order."""
@@ -1,8 +1,33 @@
 """Tasks for the fba app."""
 
-from celery import shared_task
+from celery import group, shared_task
 
 from fba import models
+from home.jobs import scheduled_job
+
+AUTH_ERROR_STATUS_CODES = (401, 403)
+
+
+def _is_auth_error(error):
+    """Return True if error is a rejection of the Parcelhub session's token."""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) in AUTH_ERROR_STATUS_CODES
+
+
+def _create_shipment(shipment_order):
+    """
+    Create a Parcelhub shipment, authorising a new session if it is rejected.
+
+    The shared session can be revoked before it expires, so an authorisation error
+    clears the pool and the shipment is filed once more with a new session.
+    """
+    try:
+        return models.ParcelhubShipment.objects.create_shipment(shipment_order)
+    except Exception as e:
+        if not _is_auth_error(e):
+            raise
+    models.ParcelhubSessionPool.clear()
+    return models.ParcelhubShipment.objects.create_shipment(shipment_order)
 
 
 @shared_task
@@ -11,15 +36,40 @@ def file_parcelhub_shipment(filing_pk):
     File a Parcelhub shipment.
 
     Args:
-        shipment_order_pk (int): ID of the shipment to file.
+        filing_pk (int): ID of the filing to complete.
     """
-    filing = models.ParcelhubShipmentFiling.objects.get(pk=filing_pk)
+    filing = models.ParcelhubShipmentFiling.objects.select_related(
+        "shipment_order", "shipment_order__destination"
+    ).get(pk=filing_pk)
     try:
-        shipment = models.ParcelhubShipment.objects.create_shipment(
-            filing.shipment_order
-        )
+        shipment = _create_shipment(filing.shipment_order)
     except Exception as e:
+        if _is_auth_error(e):
+            models.ParcelhubSessionPool.clear()
         filing.set_error(str(e))
         raise
     else:
         filing.set_complete(shipment)
+
+
+@shared_task
+def file_parcelhub_shipments(filing_pks):
+    """
+    File multiple Parcelhub shipments in parallel.
+
+    Each filing is run as a separate file_parcelhub_shipment task so that filings
+    are spread across workers and each records its own status.
+
+    Args:
+        filing_pks (list[int]): IDs of the filings to complete.
+    """
+    group(
+        file_parcelhub_shipment.s(filing_pk) for filing_pk in filing_pks
+    ).apply_async()
+
+
+@shared_task
+@scheduled_job("update_fba_profit")
+def update_fba_profit():
+    """Update FBA profit calculations."""
+    models.FBAProfitFile.objects.update_from_exports()
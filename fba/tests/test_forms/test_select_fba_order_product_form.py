@@ -23,6 +23,13 @@ def test_clean_method(product):
     assert form.cleaned_data["product"] == product
 
 
+@pytest.mark.django_db
+def test_clean_method_with_barcode(product):
+    form = SelectFBAOrderProductForm({"product_SKU": product.barcode})
+    assert form.is_valid() is True
+    assert form.cleaned_data["product"] == product
+
+
 @pytest.mark.django_db
 def test_clean_method_with_invalid_product(invalid_product):
     form_data = {"product_SKU": invalid_product.sku}
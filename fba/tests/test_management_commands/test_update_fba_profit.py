@@ -3,27 +3,38 @@ from unittest import mock
 import pytest
 
 from fba.management import commands
+from home.jobs import JobLock, JobLockedError
 
 
 @pytest.fixture
 def mock_fba_profit_file_model():
-    with mock.patch("fba.management.commands.update_fba_profit.FBAProfitFile") as m:
+    with mock.patch("fba.tasks.models.FBAProfitFile") as m:
         yield m
 
 
 @pytest.fixture
 def mock_logger():
-    with mock.patch("fba.management.commands.update_fba_profit.logger") as m:
+    with mock.patch("home.jobs.logger") as m:
         yield m
 
 
+@pytest.mark.django_db
 def test_update_fba_profit(mock_fba_profit_file_model):
     commands.update_fba_profit.Command().handle()
     mock_fba_profit_file_model.objects.update_from_exports.assert_called_once_with()
 
 
+@pytest.mark.django_db
 def test_update_fba_profit_handles_error(mock_fba_profit_file_model, mock_logger):
     mock_fba_profit_file_model.objects.update_from_exports.side_effect = Exception
     with pytest.raises(Exception):
         commands.update_fba_profit.Command().handle()
-    mock_logger.exception.assert_called_with("Error updating FBA profit.")
+    mock_logger.exception.assert_called_with("Error running update_fba_profit.")
+
+
+@pytest.mark.django_db
+def test_update_fba_profit_takes_job_lock(mock_fba_profit_file_model):
+    JobLock("update_fba_profit", timeout=60).acquire()
+    with pytest.raises(JobLockedError):
+        commands.update_fba_profit.Command().handle()
+    mock_fba_profit_file_model.objects.update_from_exports.assert_not_called()
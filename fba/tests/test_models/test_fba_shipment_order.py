@@ -161,3 +161,86 @@ def test_item_count_annotation(
     fba_shipment_item_factory.create(package=packages[1], quantity=1)
     fba_shipment_item_factory.create(package=packages[1], quantity=4)
     assert models.FBAShipmentOrder.objects.get(pk=shipment_order.pk).item_count == 10
+
+
+@pytest.fixture
+def shipment_order_with_items(
+    shipment_order, fba_shipment_item_factory, fba_shipment_package_factory
+):
+    packages = fba_shipment_package_factory.create_batch(
+        2, shipment_order=shipment_order
+    )
+    fba_shipment_item_factory.create(
+        package=packages[0], weight_kg=5, value=5, quantity=3, description="B"
+    )
+    fba_shipment_item_factory.create(
+        package=packages[0], weight_kg=23, value=23, quantity=2, description="A"
+    )
+    fba_shipment_item_factory.create(
+        package=packages[1], weight_kg=42, value=42, quantity=1, description="C"
+    )
+    return shipment_order
+
+
+@pytest.mark.django_db
+def test_with_totals_weight_kg(shipment_order_with_items):
+    order = models.FBAShipmentOrder.objects.with_totals().get(
+        pk=shipment_order_with_items.pk
+    )
+    assert order.total_weight_kg == 103
+    assert order.weight_kg == shipment_order_with_items.weight_kg == 103
+
+
+@pytest.mark.django_db
+def test_with_totals_value(shipment_order_with_items):
+    order = models.FBAShipmentOrder.objects.with_totals().get(
+        pk=shipment_order_with_items.pk
+    )
+    assert order.total_value == 103
+    assert order.value == shipment_order_with_items.value == 103
+
+
+@pytest.mark.django_db
+def test_with_totals_item_count(shipment_order_with_items):
+    order = models.FBAShipmentOrder.objects.with_totals().get(
+        pk=shipment_order_with_items.pk
+    )
+    assert order.item_count == shipment_order_with_items.item_count == 6
+
+
+@pytest.mark.django_db
+def test_with_totals_package_count(shipment_order_with_items):
+    order = models.FBAShipmentOrder.objects.with_totals().get(
+        pk=shipment_order_with_items.pk
+    )
+    assert order.package_count == 2
+
+
+@pytest.mark.django_db
+def test_with_totals_description(shipment_order_with_items):
+    order = models.FBAShipmentOrder.objects.with_totals().get(
+        pk=shipment_order_with_items.pk
+    )
+    assert order.description == shipment_order_with_items.description
+    assert order.description == "A + 2 other items"
+
+
+@pytest.mark.django_db
+def test_with_totals_empty_order(shipment_order):
+    order = models.FBAShipmentOrder.objects.with_totals().get(pk=shipment_order.pk)
+    assert order.weight_kg == 0
+    assert order.value == 0
+    assert order.item_count is None
+    assert order.package_count == 0
+    assert order.description == ""
+    assert order.is_shippable is False
+
+
+@pytest.mark.django_db
+def test_with_totals_does_not_query_per_order(
+    shipment_order_with_items, django_assert_num_queries
+):
+    with django_assert_num_queries(1):
+        for order in models.FBAShipmentOrder.objects.with_totals():
+            order.weight_kg, order.value, order.item_count
+            order.description, order.is_shippable
@@ -0,0 +1,49 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+
+from fba.models import ParcelhubSessionPool
+
+
+@pytest.fixture(autouse=True)
+def clear_pool():
+    ParcelhubSessionPool.clear()
+    yield
+    ParcelhubSessionPool.clear()
+
+
+@pytest.fixture
+def mock_session():
+    with mock.patch("fba.models.parcelhub.ParcelhubAPISession") as mock_session:
+        yield mock_session
+
+
+def test_get_session_authorises_session(mock_session):
+    session = ParcelhubSessionPool.get_session()
+    assert session == mock_session.return_value
+    session.authorise_session.assert_called_once_with()
+
+
+def test_get_session_reuses_session(mock_session):
+    session = ParcelhubSessionPool.get_session()
+    assert ParcelhubSessionPool.get_session() is session
+    mock_session.assert_called_once()
+    session.authorise_session.assert_called_once_with()
+
+
+def test_get_session_reauthorises_expired_session(mock_session):
+    ParcelhubSessionPool.get_session()
+    ParcelhubSessionPool._authorised_at = (
+        timezone.now() - ParcelhubSessionPool.SESSION_LIFETIME - timedelta(seconds=1)
+    )
+    ParcelhubSessionPool.get_session()
+    assert mock_session.call_count == 2
+
+
+def test_clear(mock_session):
+    ParcelhubSessionPool.get_session()
+    ParcelhubSessionPool.clear()
+    ParcelhubSessionPool.get_session()
+    assert mock_session.call_count == 2
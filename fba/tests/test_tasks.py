@@ -0,0 +1,85 @@
+from unittest import mock
+
+import pytest
+
+from fba import models, tasks
+
+
+class AuthError(Exception):
+    def __init__(self, status_code):
+        super().__init__("Unauthorised")
+        self.response = mock.Mock(status_code=status_code)
+
+
+@pytest.fixture
+def filing(fba_shipment_order):
+    return models.ParcelhubShipmentFiling.objects.create_filing(fba_shipment_order)
+
+
+@pytest.fixture
+def mock_create_shipment():
+    with mock.patch(
+        "fba.tasks.models.ParcelhubShipment.objects.create_shipment"
+    ) as mock_create_shipment:
+        yield mock_create_shipment
+
+
+@pytest.fixture
+def mock_clear():
+    with mock.patch("fba.tasks.models.ParcelhubSessionPool.clear") as mock_clear:
+        yield mock_clear
+
+
+@pytest.mark.django_db
+def test_file_parcelhub_shipment(
+    filing, mock_create_shipment, mock_clear, parcelhub_shipment_factory
+):
+    shipment = parcelhub_shipment_factory.create()
+    mock_create_shipment.return_value = shipment
+    tasks.file_parcelhub_shipment(filing.pk)
+    filing.refresh_from_db()
+    assert filing.status() == "COMPLETE"
+    assert filing.shipment == shipment
+    mock_create_shipment.assert_called_once_with(filing.shipment_order)
+    mock_clear.assert_not_called()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("status_code", [401, 403])
+def test_file_parcelhub_shipment_retries_auth_error(
+    filing, mock_create_shipment, mock_clear, parcelhub_shipment_factory, status_code
+):
+    shipment = parcelhub_shipment_factory.create()
+    mock_create_shipment.side_effect = [AuthError(status_code), shipment]
+    tasks.file_parcelhub_shipment(filing.pk)
+    filing.refresh_from_db()
+    assert filing.status() == "COMPLETE"
+    assert mock_create_shipment.call_count == 2
+    mock_clear.assert_called_once_with()
+
+
+@pytest.mark.django_db
+def test_file_parcelhub_shipment_retries_auth_error_once(
+    filing, mock_create_shipment, mock_clear
+):
+    mock_create_shipment.side_effect = AuthError(401)
+    with pytest.raises(AuthError):
+        tasks.file_parcelhub_shipment(filing.pk)
+    filing.refresh_from_db()
+    assert filing.status() == "ERROR"
+    assert mock_create_shipment.call_count == 2
+    assert mock_clear.call_count == 2
+
+
+@pytest.mark.django_db
+def test_file_parcelhub_shipment_does_not_retry_other_errors(
+    filing, mock_create_shipment, mock_clear
+):
+    mock_create_shipment.side_effect = Exception("Invalid postcode")
+    with pytest.raises(Exception):
+        tasks.file_parcelhub_shipment(filing.pk)
+    filing.refresh_from_db()
+    assert filing.status() == "ERROR"
+    assert filing.error_message == "Invalid postcode"
+    mock_create_shipment.assert_called_once()
+    mock_clear.assert_not_called()
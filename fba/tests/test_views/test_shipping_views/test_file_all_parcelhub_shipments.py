@@ -0,0 +1,85 @@
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+
+from fba import models
+
+
+@pytest.fixture
+def mock_task():
+    with mock.patch("fba.views.shipping.tasks.file_parcelhub_shipments") as mock_task:
+        yield mock_task
+
+
+@pytest.fixture
+def shippable_order(fba_shipment_order_factory, fba_shipment_package_factory):
+    order = fba_shipment_order_factory.create(export=None, is_on_hold=False)
+    fba_shipment_package_factory.create(shipment_order=order)
+    return order
+
+
+@pytest.fixture
+def url():
+    return reverse("fba:file_all_parcelhub_shipments")
+
+
+@pytest.mark.django_db
+def test_request_without_group(logged_in_client, url):
+    assert logged_in_client.post(url).status_code == 403
+
+
+@pytest.mark.django_db
+def test_get_is_not_allowed(mock_task, shippable_order, group_logged_in_client, url):
+    assert group_logged_in_client.get(url).status_code == 405
+    assert models.ParcelhubShipmentFiling.objects.exists() is False
+    mock_task.delay.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_creates_filing(mock_task, shippable_order, group_logged_in_client, url):
+    group_logged_in_client.post(url)
+    filing = models.ParcelhubShipmentFiling.objects.get(shipment_order=shippable_order)
+    mock_task.delay.assert_called_once_with([filing.pk])
+
+
+@pytest.mark.django_db
+def test_does_not_file_held_shipments(
+    mock_task, shippable_order, group_logged_in_client, url
+):
+    shippable_order.is_on_hold = True
+    shippable_order.save()
+    group_logged_in_client.post(url)
+    assert models.ParcelhubShipmentFiling.objects.exists() is False
+    mock_task.delay.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_does_not_file_shipments_without_packages(
+    mock_task, fba_shipment_order_factory, group_logged_in_client, url
+):
+    fba_shipment_order_factory.create(export=None, is_on_hold=False)
+    group_logged_in_client.post(url)
+    assert models.ParcelhubShipmentFiling.objects.exists() is False
+
+
+@pytest.mark.django_db
+def test_does_not_refile_shipments(
+    mock_task, shippable_order, group_logged_in_client, url
+):
+    models.ParcelhubShipmentFiling.objects.create_filing(shippable_order)
+    group_logged_in_client.post(url)
+    assert (
+        models.ParcelhubShipmentFiling.objects.filter(
+            shipment_order=shippable_order
+        ).count()
+        == 1
+    )
+    mock_task.delay.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_redirect(mock_task, group_logged_in_client, url):
+    response = group_logged_in_client.post(url)
+    assert response.status_code == 302
+    assert response["Location"] == reverse("fba:shipments")
@@ -160,6 +160,11 @@ urlpatterns = [
         views.shipping.FileParcelhubShipment.as_view(),
         name="file_parcelhub_shipment",
     ),
+    path(
+        "shipments/file_all_parcelhub_shipments",
+        views.FileAllParcelhubShipments.as_view(),
+        name="file_all_parcelhub_shipments",
+    ),
     path(
         "shipments/file_parcelhub_shipment_status/<int:pk>",
         views.shipping.FileParcelhubShipmentStatus.as_view(),
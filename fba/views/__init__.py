@@ -31,6 +31,7 @@ from .shipping import (
     DeletePackage,
     DeleteShipment,
     DisableDestination,
+    FileAllParcelhubShipments,
     HistoricShipments,
     ShipmentDestinations,
     Shipments,
@@ -69,6 +70,7 @@ __all__ = [
     "DeletePackage",
     "DeleteShipment",
     "DisableDestination",
+    "FileAllParcelhubShipments",
     "HistoricShipments",
     "ShipmentDestinations",
     "Shipments",
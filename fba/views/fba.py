@@ -18,6 +18,7 @@ from django.views.generic.base import RedirectView
 from django.views.generic.edit import CreateView, DeleteView, FormView, UpdateView
 
 from fba import forms, models
+from home.pagination import KeysetPaginationMixin
 from home.views import UserInGroupMixin
 from inventory.models import (
     BaseProduct,
@@ -181,13 +182,12 @@ class RepeatFBAOrder(FBAUserMixin, RedirectView):
         )
 
 
-class OrderList(FBAUserMixin, ListView):
+class OrderList(FBAUserMixin, KeysetPaginationMixin, ListView):
     """Display a filterable list of orders."""
 
     template_name = "fba/fba_order_list.html"
     model = models.FBAOrder
     paginate_by = 50
-    orphans = 3
     form_class = forms.FBAOrderFilter
 
     def get(self, *args, **kwargs):
@@ -199,22 +199,14 @@ class OrderList(FBAUserMixin, ListView):
         """Return a queryset of orders based on GET data."""
         if self.form.is_valid():
             return self.form.get_queryset()
-        return []
+        return self.model.objects.none()
 
     def get_context_data(self, *args, **kwargs):
         """Return the template context."""
         context = super().get_context_data(*args, **kwargs)
         context["form"] = self.form
-        context["page_range"] = self.get_page_range(context["paginator"])
         return context
 
-    def get_page_range(self, paginator):
-        """Return a list of pages to link to."""
-        if paginator.num_pages < 11:
-            return list(range(1, paginator.num_pages + 1))
-        else:
-            return list(range(1, 11)) + [paginator.num_pages]
-
 
 class OnHold(FBAUserMixin, ListView):
     """Display a filterable list of orders."""
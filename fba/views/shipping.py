@@ -2,9 +2,11 @@
 
 from django.contrib import messages
 from django.db import transaction
+from django.db.models import Prefetch
+from django.http import HttpResponseRedirect
 from django.shortcuts import get_object_or_404
 from django.urls import reverse, reverse_lazy
-from django.views.generic import FormView, ListView, TemplateView
+from django.views.generic import FormView, ListView, TemplateView, View
 from django.views.generic.base import RedirectView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 
@@ -21,12 +23,19 @@ class Shipments(FBAUserMixin, TemplateView):
     def get_context_data(self, **kwargs):
         """Return context data for the template."""
         context = super().get_context_data(**kwargs)
-        unfiled_shipments = models.FBAShipmentOrder.objects.filter(
+        shipment_orders = models.FBAShipmentOrder.objects.with_totals().select_related(
+            "destination", "user"
+        )
+        unfiled_shipments = shipment_orders.filter(
             export__isnull=True, parcelhub_shipment__isnull=True
         )
         context["current_shipments"] = unfiled_shipments.filter(is_on_hold=False)
         context["held_shipments"] = unfiled_shipments.filter(is_on_hold=True)
-        context["previous_shipments"] = models.ParcelhubShipment.objects.all()[:50]
+        context["previous_shipments"] = (
+            models.ParcelhubShipment.objects.prefetch_related(
+                Prefetch("shipment_order", queryset=shipment_orders)
+            )
+        )[:50]
         return context
 
 
@@ -336,6 +345,33 @@ class FileParcelhubShipment(FBAUserMixin, RedirectView):
         return reverse("fba:parcelhub_shipment_status", args=[filing.pk])
 
 
+class FileAllParcelhubShipments(FBAUserMixin, View):
+    """View for filing every shippable shipment with Parcelhub."""
+
+    def post(self, *args, **kwargs):
+        """File Parcelhub shipments for all shippable shipment orders."""
+        shipment_orders = models.FBAShipmentOrder.objects.filter(
+            export__isnull=True,
+            is_on_hold=False,
+            shipment_package__isnull=False,
+            parcelhub_shipment__isnull=True,
+            parcelhub_shipment_filings__isnull=True,
+        ).distinct()
+        with transaction.atomic():
+            filings = [
+                models.ParcelhubShipmentFiling.objects.create_filing(shipment_order)
+                for shipment_order in shipment_orders
+            ]
+        if filings:
+            tasks.file_parcelhub_shipments.delay([filing.pk for filing in filings])
+        messages.add_message(
+            self.request,
+            messages.SUCCESS,
+            f"Filing {len(filings)} shipments with Parcelhub.",
+        )
+        return HttpResponseRedirect(reverse("fba:shipments"))
+
+
 class FileParcelhubShipmentStatus(FBAUserMixin, TemplateView):
     """View for displaying the status of an inprogress Parcelhub filing."""
 
@@ -45,3 +45,26 @@ class ExternalLinkAdmin(admin.ModelAdmin):
     exclude = ()
     list_display = ("__str__", "name", "url", "ordering")
     list_editable = ("name", "url", "ordering")
+
+
+@admin.register(models.JobRun)
+class JobRunAdmin(admin.ModelAdmin):
+    """Model admin for the JobRun model."""
+
+    list_display = ("name", "status", "started_at", "finished_at", "duration")
+    list_filter = ("status", "name")
+    search_fields = ("name", "task_id")
+    date_hierarchy = "started_at"
+    readonly_fields = (
+        "name",
+        "task_id",
+        "status",
+        "started_at",
+        "finished_at",
+        "duration",
+        "error",
+    )
+
+    def has_add_permission(self, request):
+        """Prevent job runs being created in the admin."""
+        return False
@@ -8,3 +8,13 @@ class HomeConfig(AppConfig):
 
     name = "home"
     verbose_name = "Home"
+
+    def ready(self):
+        """Attribute API calls made by Celery tasks to the task."""
+        from celery import signals
+
+        from home import instrumentation
+
+        signals.task_prerun.connect(instrumentation.task_prerun_handler)
+        signals.task_postrun.connect(instrumentation.task_postrun_handler)
+        signals.task_retry.connect(instrumentation.task_retry_handler)
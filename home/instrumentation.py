@@ -0,0 +1,367 @@
+"""Instrumentation of calls to external APIs."""
+
+import functools
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+import django_redis
+
+from home import profiling
+
+logger = logging.getLogger("api_calls")
+
+LINNWORKS = "linnworks"
+SHOPIFY = "shopify"
+AMAZON = "amazon"
+PARCELHUB = "parcelhub"
+
+_current_job = ContextVar("current_job", default=None)
+
+
+def current_job():
+    """
+    Return the name of the job making API calls.
+
+    Celery tasks are named "task:<task name>" and management commands run with
+    manage.py "command:<command name>". Anything else, such as a web request, is
+    named "web".
+    """
+    job_name = _current_job.get()
+    if job_name is not None:
+        return job_name
+    if os.path.basename(sys.argv[0]) == "manage.py" and len(sys.argv) > 1:
+        return f"command:{sys.argv[1]}"
+    return "web"
+
+
+@contextmanager
+def job(name):
+    """Attribute API calls made inside the block to the job name."""
+    token = _current_job.set(name)
+    try:
+        yield
+    finally:
+        _current_job.reset(token)
+
+
+def task_prerun_handler(task_id=None, task=None, **kwargs):
+    """Attribute API calls made by a Celery task to the task."""
+    task.request.instrumentation_token = _current_job.set(f"task:{task.name}")
+
+
+def task_postrun_handler(task_id=None, task=None, **kwargs):
+    """Stop attributing API calls to a finished Celery task."""
+    token = getattr(task.request, "instrumentation_token", None)
+    if token is not None:
+        _current_job.reset(token)
+
+
+def task_retry_handler(sender=None, **kwargs):
+    """Record the retry of a Celery task."""
+    record_retry(service="celery", endpoint=sender.name)
+
+
+def _log(**record):
+    logger.info(json.dumps(record))
+
+
+@contextmanager
+def api_call(service, endpoint):
+    """Record the duration and outcome of an API call made inside the block."""
+    start = time.perf_counter()
+    error = None
+    try:
+        with profiling.external_call(service):
+            yield
+    except Exception as e:
+        error = type(e).__name__
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        job_name = current_job()
+        APICallStore.record_call(
+            service=service,
+            endpoint=endpoint,
+            duration=duration,
+            error=error is not None,
+            job_name=job_name,
+        )
+        _log(
+            event="api_call",
+            service=service,
+            endpoint=endpoint,
+            job=job_name,
+            duration_ms=round(duration * 1000, 1),
+            error=error,
+        )
+
+
+def instrument(service, endpoint=None):
+    """
+    Decorate a function making API calls to record its calls.
+
+    Args:
+        service (str): The API the function calls.
+        endpoint (str): The name to record calls under. Defaults to the function's
+            qualified name.
+    """
+
+    def decorator(func):
+        name = endpoint or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with api_call(service, name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def rate_limit_wait(service, endpoint):
+    """Record the time spent inside the block waiting to respect an API rate limit."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        job_name = current_job()
+        APICallStore.record_wait(
+            service=service, endpoint=endpoint, duration=duration, job_name=job_name
+        )
+        _log(
+            event="rate_limit_wait",
+            service=service,
+            endpoint=endpoint,
+            job=job_name,
+            duration_ms=round(duration * 1000, 1),
+        )
+
+
+def record_retry(service, endpoint):
+    """Record the retry of an API call."""
+    job_name = current_job()
+    APICallStore.record_retry(service=service, endpoint=endpoint, job_name=job_name)
+    _log(event="retry", service=service, endpoint=endpoint, job=job_name)
+
+
+@dataclass
+class EndpointStats:
+    """Statistics for calls to an API endpoint made by a job."""
+
+    job_name: str
+    service: str
+    endpoint: str
+    calls: int
+    errors: int
+    retries: int
+    waits: int
+    total_ms: float
+    wait_ms: float
+    histogram: list
+
+    @property
+    def mean_ms(self):
+        """Return the mean call duration."""
+        if not self.calls:
+            return None
+        return round(self.total_ms / self.calls, 1)
+
+    @property
+    def p50_ms(self):
+        """Return the upper bound of the bucket containing the median call."""
+        return APICallStore.histogram_percentile(self.histogram, 50)
+
+    @property
+    def p95_ms(self):
+        """Return the upper bound of the bucket containing the 95th percentile."""
+        return APICallStore.histogram_percentile(self.histogram, 95)
+
+
+class APICallStore:
+    """
+    Store aggregated API call statistics in Redis.
+
+    Statistics are kept in a hash for each combination of job, service and
+    endpoint, and are updated with HINCRBY and HINCRBYFLOAT so concurrent updates
+    are not lost. Call durations are counted in a histogram with the upper bounds,
+    in milliseconds, in LATENCY_BUCKETS, the last bucket counting slower calls.
+
+    Recording statistics never raises, so a Redis error cannot change the outcome
+    of the API call being recorded.
+    """
+
+    CACHE_NAME = "profiling"
+    INDEX_KEY = "profiling:api_calls"
+    TIMEOUT = 60 * 60 * 24 * 7
+    LATENCY_BUCKETS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+    COUNT_FIELDS = ("calls", "errors", "retries", "waits")
+    TIME_FIELDS = ("total_ms", "wait_ms")
+
+    @classmethod
+    def redis(cls):
+        """Return a connection to the Redis server of the profiling cache."""
+        return django_redis.get_redis_connection(cls.CACHE_NAME)
+
+    @classmethod
+    def key(cls, job_name, service, endpoint):
+        """Return the Redis key for an endpoint's statistics."""
+        return f"profiling:api_calls:{job_name}:{service}:{endpoint}"
+
+    @classmethod
+    def empty_stats(cls):
+        """Return a dict of statistics for an endpoint with no calls."""
+        return {
+            "calls": 0,
+            "errors": 0,
+            "retries": 0,
+            "waits": 0,
+            "total_ms": 0.0,
+            "wait_ms": 0.0,
+            "histogram": [0] * (len(cls.LATENCY_BUCKETS) + 1),
+        }
+
+    @classmethod
+    def bucket(cls, duration_ms):
+        """Return the index of the histogram bucket for a duration."""
+        for i, upper_bound in enumerate(cls.LATENCY_BUCKETS):
+            if duration_ms <= upper_bound:
+                return i
+        return len(cls.LATENCY_BUCKETS)
+
+    @classmethod
+    def histogram_percentile(cls, histogram, percent):
+        """
+        Return the upper bound of the bucket containing a percentile.
+
+        Returns None for an empty histogram and for percentiles in the last bucket,
+        which has no upper bound.
+        """
+        total = sum(histogram)
+        if not total:
+            return None
+        rank = percent / 100 * total
+        count = 0
+        for i, bucket_count in enumerate(histogram):
+            count += bucket_count
+            if count >= rank:
+                break
+        if i < len(cls.LATENCY_BUCKETS):
+            return cls.LATENCY_BUCKETS[i]
+        return None
+
+    @classmethod
+    def _record(cls, job_name, service, endpoint, counts, times=None):
+        key = cls.key(job_name, service, endpoint)
+        try:
+            pipeline = cls.redis().pipeline()
+            for field, amount in counts.items():
+                pipeline.hincrby(key, field, amount)
+            for field, duration_ms in (times or {}).items():
+                pipeline.hincrbyfloat(key, field, duration_ms)
+            pipeline.expire(key, cls.TIMEOUT)
+            pipeline.sadd(cls.INDEX_KEY, json.dumps([job_name, service, endpoint]))
+            pipeline.expire(cls.INDEX_KEY, cls.TIMEOUT)
+            pipeline.execute()
+        except Exception:
+            logger.exception(f"Could not record API call statistics for {key}.")
+
+    @classmethod
+    def record_call(cls, service, endpoint, duration, error=False, job_name=None):
+        """Record an API call."""
+        duration_ms = duration * 1000
+        cls._record(
+            job_name or current_job(),
+            service,
+            endpoint,
+            counts={
+                "calls": 1,
+                "errors": int(error),
+                f"histogram:{cls.bucket(duration_ms)}": 1,
+            },
+            times={"total_ms": duration_ms},
+        )
+
+    @classmethod
+    def record_wait(cls, service, endpoint, duration, job_name=None):
+        """Record a wait to respect an API rate limit."""
+        cls._record(
+            job_name or current_job(),
+            service,
+            endpoint,
+            counts={"waits": 1},
+            times={"wait_ms": duration * 1000},
+        )
+
+    @classmethod
+    def record_retry(cls, service, endpoint, job_name=None):
+        """Record the retry of an API call."""
+        cls._record(job_name or current_job(), service, endpoint, counts={"retries": 1})
+
+    @classmethod
+    def _index(cls):
+        return sorted(
+            json.loads(member) for member in cls.redis().smembers(cls.INDEX_KEY)
+        )
+
+    @classmethod
+    def clear(cls):
+        """Remove all statistics."""
+        keys = [cls.key(*entry) for entry in cls._index()]
+        cls.redis().delete(cls.INDEX_KEY, *keys)
+
+    @classmethod
+    def _parse_stats(cls, values):
+        values = {field.decode(): value for field, value in values.items()}
+        stats = cls.empty_stats()
+        for field in cls.COUNT_FIELDS:
+            stats[field] = int(values.get(field, 0))
+        for field in cls.TIME_FIELDS:
+            stats[field] = float(values.get(field, 0))
+        stats["histogram"] = [
+            int(values.get(f"histogram:{i}", 0)) for i in range(len(stats["histogram"]))
+        ]
+        return stats
+
+    @classmethod
+    def stats(cls):
+        """
+        Return statistics for each endpoint.
+
+        Returns:
+            list[EndpointStats]: Statistics ordered by job and by the total time
+                spent on the endpoint, including rate limit waits, longest first.
+        """
+        index = cls._index()
+        pipeline = cls.redis().pipeline()
+        for entry in index:
+            pipeline.hgetall(cls.key(*entry))
+        stats = [
+            EndpointStats(
+                job_name=job_name,
+                service=service,
+                endpoint=endpoint,
+                **cls._parse_stats(values),
+            )
+            for (job_name, service, endpoint), values in zip(index, pipeline.execute())
+            if values
+        ]
+        return sorted(stats, key=lambda s: (s.job_name, -(s.total_ms + s.wait_ms)))
+
+    @classmethod
+    def job_totals(cls):
+        """Return a list of (job name, total ms) tuples, longest first."""
+        totals = {}
+        for stats in cls.stats():
+            totals[stats.job_name] = (
+                totals.get(stats.job_name, 0) + stats.total_ms + stats.wait_ms
+            )
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)
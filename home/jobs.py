@@ -0,0 +1,69 @@
+"""Locking and run records for scheduled jobs."""
+
+import functools
+import logging
+
+from celery import current_task
+
+from home.locks import CacheLock
+from home.models import JobRun
+
+logger = logging.getLogger("management_commands")
+
+
+class JobLockedError(Exception):
+    """Exception raised when a job is started while a previous run holds its lock."""
+
+
+class JobLock(CacheLock):
+    """A lock preventing overlapping runs of a job."""
+
+    KEY_PREFIX = "job"
+
+    def __init__(self, name, timeout):
+        """Create a lock for the job name."""
+        super().__init__(key=f"{self.KEY_PREFIX}:{name}", timeout=timeout)
+
+
+def scheduled_job(name, lock_timeout=60 * 60 * 6):
+    """
+    Decorate a Celery task function to lock and record its runs.
+
+    A JobRun is saved for every run. If a previous run of the job is still running
+    the run is recorded as skipped and JobLockedError is raised, so tasks depending
+    on the job in a chain do not run.
+
+    Args:
+        name (str): The name of the job.
+        lock_timeout (int): The number of seconds after which the lock expires.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return run_job(name, func, *args, lock_timeout=lock_timeout, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def run_job(name, func, *args, lock_timeout, **kwargs):
+    """Run func as the job name, recording the run in a JobRun."""
+    task_id = (current_task.request.id if current_task else None) or ""
+    lock = JobLock(name, timeout=lock_timeout)
+    if not lock.acquire():
+        JobRun(name=name, task_id=task_id).finish(JobRun.SKIPPED, "Job is locked.")
+        raise JobLockedError(f"{name} is already running.")
+    try:
+        job_run = JobRun.objects.create(name=name, task_id=task_id)
+        try:
+            value = func(*args, **kwargs)
+        except Exception as e:
+            logger.exception(f"Error running {name}.")
+            job_run.finish(JobRun.FAILED, f"{type(e).__name__}: {e}")
+            raise
+        job_run.finish(JobRun.SUCCEEDED)
+        return value
+    finally:
+        lock.release()
@@ -0,0 +1,67 @@
+"""Locks shared between web and worker processes."""
+
+import time
+import uuid
+
+import django_redis
+
+
+class CacheLock:
+    """
+    A lock held in the Redis server of the locks cache.
+
+    The locks cache is shared between web servers and workers, so a lock held by
+    one process is seen by all of them. Locks expire after timeout seconds so a
+    lock held by a process that died is eventually released.
+
+    The lock is released by a Lua script comparing the stored token and deleting
+    the key in one step, so a lock that expired and was acquired by another process
+    in the meantime is never released by this one.
+    """
+
+    CACHE_NAME = "locks"
+    KEY_PREFIX = "locks"
+    POLL_INTERVAL = 0.1
+    RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+    def __init__(self, key, timeout):
+        """Create a lock for key."""
+        self.key = key
+        self.timeout = timeout
+        self.token = str(uuid.uuid4())
+
+    @classmethod
+    def redis(cls):
+        """Return a connection to the Redis server of the locks cache."""
+        return django_redis.get_redis_connection(cls.CACHE_NAME)
+
+    @property
+    def redis_key(self):
+        """Return the Redis key holding the lock."""
+        return f"{self.KEY_PREFIX}:{self.key}"
+
+    def acquire(self, wait=0):
+        """
+        Return True if the lock was acquired, otherwise False.
+
+        Args:
+            wait (float): The number of seconds to wait for the lock to be released
+                if it is held by another process.
+        """
+        deadline = time.monotonic() + wait
+        redis = self.redis()
+        while not redis.set(self.redis_key, self.token, nx=True, ex=self.timeout):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(self.POLL_INTERVAL)
+        return True
+
+    def release(self):
+        """Release the lock if it is still held by this instance."""
+        release = self.redis().register_script(self.RELEASE_SCRIPT)
+        release(keys=[self.redis_key], args=[self.token])
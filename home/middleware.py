@@ -0,0 +1,42 @@
+"""Middleware for the home app."""
+
+import random
+
+from django.conf import settings
+from django.db import connection
+
+from home import profiling
+
+
+class ProfilingMiddleware:
+    """
+    Record query counts and timings for each request.
+
+    A warning is logged when a request runs more queries than the query budget for
+    its view. A proportion of requests set by PROFILING_SAMPLE_RATE are saved to the
+    profiling cache for the profiling report.
+    """
+
+    def __init__(self, get_response):
+        """Create the middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Profile the request."""
+        if not settings.PROFILING_ENABLED:
+            return self.get_response(request)
+        with profiling.profile_request() as profile:
+            with connection.execute_wrapper(profile.query_wrapper):
+                response = self.get_response(request)
+        if request.resolver_match is None:
+            return response
+        profile.view_name = request.resolver_match.view_name
+        if profile.over_budget():
+            profiling.logger.warning(
+                f"{profile.view_name} ran {profile.query_count} queries, "
+                f"exceeding its budget of {profile.query_budget}: "
+                f"{request.method} {request.path}"
+            )
+        if random.random() < settings.PROFILING_SAMPLE_RATE:
+            profiling.ProfileStore.add(profile)
+        return response
@@ -1,7 +1,14 @@
 """Models for the Home app."""
 
+import datetime as dt
+import hashlib
+import json
+
 from django.contrib.auth.models import User
 from django.db import models
+from django.utils import timezone
+
+from home.locks import CacheLock
 
 
 class UnHidden(models.Manager):
@@ -60,3 +67,131 @@ class ExternalLink(models.Model):
         verbose_name = "External Link"
         verbose_name_plural = "External Links"
         ordering = ("ordering",)
+
+
+class JobRun(models.Model):
+    """Model for recording runs of scheduled jobs."""
+
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+    STATUS_CHOICES = (
+        (RUNNING, "Running"),
+        (SUCCEEDED, "Succeeded"),
+        (FAILED, "Failed"),
+        (SKIPPED, "Skipped"),
+    )
+
+    name = models.CharField(max_length=255, db_index=True)
+    task_id = models.CharField(max_length=255, blank=True, default="")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=RUNNING)
+    started_at = models.DateTimeField(default=timezone.now)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    error = models.TextField(blank=True, default="")
+
+    class Meta:
+        """Meta class for the JobRun model."""
+
+        verbose_name = "Job Run"
+        verbose_name_plural = "Job Runs"
+        ordering = ("-started_at",)
+        get_latest_by = "started_at"
+
+    def __str__(self):
+        return f"{self.name} {self.started_at:%Y-%m-%d %H:%M} {self.status}"
+
+    @property
+    def duration(self):
+        """Return the time the job ran for or None if it has not finished."""
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def finish(self, status, error=""):
+        """Record the job as finished."""
+        self.status = status
+        self.error = error
+        self.finished_at = timezone.now()
+        self.save()
+
+
+class ReusableDownload(models.Model):
+    """
+    Abstract model for file downloads reused for identical requests.
+
+    Downloads are identified by a hash of the parameters they are created with. When
+    a download is requested with the same parameters as a download created within
+    REUSE_PERIOD that has not errored, the existing download is returned rather
+    than generating the file again. The lookup and creation are made while holding
+    a lock on the hash so concurrent identical requests create a single download.
+
+    Concrete models must also inherit from file_exchange.models.FileDownload.
+    """
+
+    REUSE_PERIOD = dt.timedelta(minutes=15)
+    LOCK_TIMEOUT = 10
+
+    params_hash = models.CharField(max_length=64, db_index=True, blank=True, default="")
+    requested_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        """Meta class for ReusableDownload."""
+
+        abstract = True
+
+    @staticmethod
+    def _serialise_param(value):
+        if isinstance(value, models.Model):
+            return value.pk
+        return str(value)
+
+    @classmethod
+    def hash_params(cls, **params):
+        """Return a hash identifying a download of this model created with params."""
+        content = json.dumps(
+            [cls._meta.label_lower, params],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=cls._serialise_param,
+        )
+        return hashlib.sha256(content.encode("utf8")).hexdigest()
+
+    @classmethod
+    def get_or_create_download(cls, **params):
+        """
+        Return a download created with params, creating it if necessary.
+
+        If the lock for the parameters cannot be acquired within LOCK_TIMEOUT
+        seconds the lookup is made without it.
+
+        Returns:
+            (ReusableDownload, bool): The download and whether it was created.
+        """
+        params_hash = cls.hash_params(**params)
+        lock = CacheLock(key=f"download:{params_hash}", timeout=cls.LOCK_TIMEOUT)
+        locked = lock.acquire(wait=cls.LOCK_TIMEOUT)
+        try:
+            existing = cls.get_reusable_download(params_hash)
+            if existing is not None:
+                existing.requested_at = timezone.now()
+                existing.save(update_fields=["requested_at"])
+                return existing, False
+            download = cls.objects.create_download(params_hash=params_hash, **params)
+            return download, True
+        finally:
+            if locked:
+                lock.release()
+
+    @classmethod
+    def get_reusable_download(cls, params_hash):
+        """Return a recent download that has not errored for params_hash or None."""
+        return (
+            cls.objects.filter(
+                params_hash=params_hash,
+                created_at__gte=timezone.now() - cls.REUSE_PERIOD,
+            )
+            .exclude(status=cls.ERRORED)
+            .order_by("-created_at")
+            .first()
+        )
@@ -0,0 +1,298 @@
+"""Keyset pagination for lists of large tables."""
+
+import base64
+import binascii
+import json
+from functools import cached_property, reduce
+from operator import or_
+
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import F, Q
+from django.http import Http404
+
+
+class InvalidCursor(Exception):
+    """Exception raised when a pagination cursor cannot be decoded."""
+
+
+def estimate_count(queryset):
+    """Return the query planner's estimate of the number of rows in queryset."""
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]["Plan Rows"]
+
+
+class KeysetPage:
+    """A page of objects selected by a KeysetPaginator."""
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        """Create the page."""
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return f"<KeysetPage of {len(self)} objects>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        """Return True if there are objects after this page."""
+        return self._has_next
+
+    def has_previous(self):
+        """Return True if there are objects before this page."""
+        return self._has_previous
+
+    def has_other_pages(self):
+        """Return True if there are objects on other pages."""
+        return self.has_next() or self.has_previous()
+
+    @property
+    def next_cursor(self):
+        """Return the cursor for the next page or None."""
+        if not self.has_next():
+            return None
+        return self.paginator.encode_cursor(
+            self.paginator.NEXT, self.paginator.key_values(self.object_list[-1])
+        )
+
+    @property
+    def previous_cursor(self):
+        """Return the cursor for the previous page or None."""
+        if not self.has_previous():
+            return None
+        return self.paginator.encode_cursor(
+            self.paginator.PREVIOUS, self.paginator.key_values(self.object_list[0])
+        )
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset by the values of its ordering rather than by offset.
+
+    Each page is selected with a WHERE clause on the ordering values of the last
+    object on the previous page, so later pages are as quick to load as the first.
+    The primary key is added to the ordering to make it unique. Ordering fields may
+    be nullable, but must be field names rather than expressions.
+
+    Pages are identified by opaque cursors rather than page numbers. The count uses
+    the query planner's estimate of the row count when it is over
+    EXACT_COUNT_LIMIT, rather than counting every row.
+    """
+
+    NEXT = "n"
+    PREVIOUS = "p"
+    EXACT_COUNT_LIMIT = 10000
+
+    def __init__(self, queryset, per_page, ordering=None):
+        """
+        Create a paginator for queryset.
+
+        Args:
+            queryset (QuerySet): The objects to paginate.
+            per_page (int): The number of objects on each page.
+            ordering (list[str]): The ordering of the objects. Defaults to the
+                queryset's ordering.
+        """
+        self.per_page = per_page
+        self.ordering = self.get_ordering(queryset, ordering)
+        self.aliases = [f"keyset_{i}" for i in range(len(self.ordering))]
+        self.queryset = queryset.order_by(*self.ordering).annotate(
+            **{
+                alias: F(field.lstrip("-"))
+                for alias, field in zip(self.aliases, self.ordering)
+            }
+        )
+
+    @staticmethod
+    def get_ordering(queryset, ordering=None):
+        """Return a unique ordering for queryset."""
+        ordering = list(
+            ordering or queryset.query.order_by or queryset.model._meta.ordering
+        )
+        for field in ordering:
+            if not isinstance(field, str) or field == "?":
+                raise ValueError(f"Cannot paginate by {field!r}.")
+        pk_names = ("pk", queryset.model._meta.pk.name)
+        if not any(field.lstrip("-") in pk_names for field in ordering):
+            descending = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append("-pk" if descending else "pk")
+        return ordering
+
+    @cached_property
+    def estimated_count(self):
+        """Return the estimated number of objects."""
+        return estimate_count(self.queryset)
+
+    @property
+    def is_estimated_count(self):
+        """Return True if count is an estimate."""
+        return self.estimated_count > self.EXACT_COUNT_LIMIT
+
+    @cached_property
+    def count(self):
+        """Return the number of objects, estimated for large querysets."""
+        if self.is_estimated_count:
+            return self.estimated_count
+        return self.queryset.count()
+
+    def key_values(self, obj):
+        """Return the ordering values of obj."""
+        return [getattr(obj, alias) for alias in self.aliases]
+
+    def encode_cursor(self, direction, values):
+        """Return a cursor for the page in direction from an object's values."""
+        content = json.dumps([direction, values], cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(content.encode("utf8")).decode("ascii")
+
+    def decode_cursor(self, cursor):
+        """Return the direction and ordering values encoded in a cursor."""
+        try:
+            direction, values = json.loads(base64.urlsafe_b64decode(cursor))
+            if direction not in (self.NEXT, self.PREVIOUS):
+                raise ValueError(f"Invalid direction {direction!r}.")
+            if len(values) != len(self.aliases):
+                raise ValueError("Wrong number of values.")
+            return direction, [
+                None if value is None else self._output_field(alias).to_python(value)
+                for alias, value in zip(self.aliases, values)
+            ]
+        except (binascii.Error, TypeError, ValueError, ValidationError) as e:
+            raise InvalidCursor(f"Invalid cursor {cursor!r}.") from e
+
+    def _output_field(self, alias):
+        return self.queryset.query.annotations[alias].output_field
+
+    def _nullable(self, alias, field):
+        # Fields on related models are null for rows without a related object.
+        return self._output_field(alias).null or "__" in field
+
+    def _after(self, alias, field, descending, value):
+        if value is None:
+            return Q(**{f"{alias}__isnull": False}) if descending else None
+        if descending:
+            return Q(**{f"{alias}__lt": value})
+        if self._nullable(alias, field):
+            return Q(**{f"{alias}__gt": value}) | Q(**{f"{alias}__isnull": True})
+        return Q(**{f"{alias}__gt": value})
+
+    def _equal(self, alias, value):
+        if value is None:
+            return Q(**{f"{alias}__isnull": True})
+        return Q(**{alias: value})
+
+    def _leading_bound(self, descending, value):
+        alias, field = self.aliases[0], self.ordering[0]
+        if descending:
+            return Q(**{f"{alias}__lte": value})
+        if self._nullable(alias, field):
+            return Q(**{f"{alias}__gte": value}) | Q(**{f"{alias}__isnull": True})
+        return Q(**{f"{alias}__gte": value})
+
+    def filter_after(self, values, reverse=False):
+        """
+        Return a Q object selecting the objects after an object's values.
+
+        Nulls are ordered last in ascending order and first in descending order, as
+        they are by Postgres. Postgres cannot use the OR of the conditions on each
+        ordering field as an index bound, so a redundant bound on the first field
+        is added to let it start an index scan at the cursor.
+
+        Args:
+            values (list): The ordering values of the object.
+            reverse (bool): If True select the objects before the object instead.
+        """
+        conditions = []
+        equal = Q()
+        for alias, field, value in zip(self.aliases, self.ordering, values):
+            descending = field.startswith("-") != reverse
+            after = self._after(alias, field, descending, value)
+            if after is not None:
+                conditions.append(equal & after)
+            equal &= self._equal(alias, value)
+        if not conditions:
+            return Q(pk__in=[])
+        condition = reduce(or_, conditions)
+        if values[0] is not None and len(conditions) > 1:
+            descending = self.ordering[0].startswith("-") != reverse
+            condition = self._leading_bound(descending, values[0]) & condition
+        return condition
+
+    def page_queryset(self, direction, values):
+        """
+        Return a queryset of the objects for a page and the first object after it.
+
+        Args:
+            direction (str): NEXT or PREVIOUS.
+            values (list): The ordering values of the object the page starts after,
+                or None for the first page.
+        """
+        reverse = direction == self.PREVIOUS
+        queryset = self.queryset.reverse() if reverse else self.queryset
+        if values is not None:
+            queryset = queryset.filter(self.filter_after(values, reverse=reverse))
+        return queryset[: self.per_page + 1]
+
+    def page(self, cursor=None):
+        """
+        Return the page for a cursor.
+
+        Args:
+            cursor (str): A cursor from a page's next_cursor or previous_cursor.
+                Returns the first page if cursor is empty.
+
+        Raises:
+            InvalidCursor: If the cursor cannot be decoded.
+        """
+        if not cursor:
+            direction, values = self.NEXT, None
+        else:
+            direction, values = self.decode_cursor(cursor)
+        object_list = list(self.page_queryset(direction, values))
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+        if direction == self.PREVIOUS:
+            object_list.reverse()
+            return KeysetPage(object_list, self, has_next=True, has_previous=has_more)
+        return KeysetPage(
+            object_list, self, has_next=has_more, has_previous=values is not None
+        )
+
+
+class KeysetPaginationMixin:
+    """
+    ListView mixin paginating the list with a KeysetPaginator.
+
+    The page is selected by a cursor in the GET parameter named by cursor_kwarg.
+    get_queryset must return a queryset, rather than a list.
+    """
+
+    cursor_kwarg = "cursor"
+    keyset_ordering = None
+
+    def paginate_queryset(self, queryset, page_size):
+        """Return the paginator, page, object list and if the list is paginated."""
+        paginator = KeysetPaginator(queryset, page_size, ordering=self.keyset_ordering)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            raise Http404("Invalid page.")
+        return paginator, page, page.object_list, page.has_other_pages()
@@ -0,0 +1,210 @@
+"""Lightweight profiling of request query counts and timings."""
+
+import json
+import logging
+import math
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import django_redis
+from django.conf import settings
+
+logger = logging.getLogger("profiling")
+
+_current_profile = ContextVar("current_profile", default=None)
+
+
+@dataclass
+class RequestProfile:
+    """Query counts and timings recorded while handling a request."""
+
+    view_name: str = ""
+    query_count: int = 0
+    sql_time: float = 0.0
+    external_time: dict = field(default_factory=lambda: defaultdict(float))
+    wall_time: float = 0.0
+
+    def query_wrapper(self, execute, sql, params, many, context):
+        """Database execute wrapper counting and timing queries."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.query_count += 1
+            self.sql_time += time.perf_counter() - start
+
+    @property
+    def query_budget(self):
+        """Return the maximum number of queries expected for the view."""
+        return settings.PROFILING_QUERY_BUDGETS.get(
+            self.view_name, settings.PROFILING_DEFAULT_QUERY_BUDGET
+        )
+
+    def over_budget(self):
+        """Return True if the request ran more queries than its budget."""
+        return self.query_count > self.query_budget
+
+    def as_sample(self):
+        """Return the profile as a dict of rounded millisecond values."""
+        return {
+            "wall_ms": round(self.wall_time * 1000, 1),
+            "queries": self.query_count,
+            "sql_ms": round(self.sql_time * 1000, 1),
+            "external_ms": {
+                service: round(duration * 1000, 1)
+                for service, duration in self.external_time.items()
+            },
+        }
+
+
+@contextmanager
+def profile_request(view_name=""):
+    """Record queries and external calls made inside the block as a RequestProfile."""
+    profile = RequestProfile(view_name=view_name)
+    token = _current_profile.set(profile)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.wall_time = time.perf_counter() - start
+        _current_profile.reset(token)
+
+
+def current_profile():
+    """Return the RequestProfile being recorded or None."""
+    return _current_profile.get()
+
+
+@contextmanager
+def external_call(service):
+    """Add the time spent inside the block to the current profile's external time."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile = current_profile()
+        if profile is not None:
+            profile.external_time[service] += time.perf_counter() - start
+
+
+def percentile(values, percent):
+    """Return the nearest-rank percentile of values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass
+class ViewSummary:
+    """Summary of the profiles sampled for a view."""
+
+    view_name: str
+    samples: int
+    p50_ms: float
+    p95_ms: float
+    mean_queries: float
+    p95_queries: int
+    mean_sql_ms: float
+    mean_external_ms: float
+    query_budget: int
+
+    @property
+    def over_budget(self):
+        """Return True if the 95th percentile query count exceeds the budget."""
+        return self.p95_queries > self.query_budget
+
+
+class ProfileStore:
+    """
+    Store sampled request profiles in Redis.
+
+    The most recent samples for each view are kept in a Redis list under a key for
+    the view, with LPUSH and LTRIM, and the profiled views are kept in a set.
+    Adding a sample never raises, so a Redis error cannot fail the request being
+    profiled.
+    """
+
+    CACHE_NAME = "profiling"
+    INDEX_KEY = "profiling:views"
+    SAMPLE_LIMIT = 1000
+    TIMEOUT = 60 * 60 * 24 * 7
+
+    @classmethod
+    def redis(cls):
+        """Return a connection to the Redis server of the profiling cache."""
+        return django_redis.get_redis_connection(cls.CACHE_NAME)
+
+    @classmethod
+    def key(cls, view_name):
+        """Return the Redis key for a view's samples."""
+        return f"profiling:samples:{view_name}"
+
+    @classmethod
+    def add(cls, profile):
+        """Add a sample for a request profile."""
+        key = cls.key(profile.view_name)
+        try:
+            pipeline = cls.redis().pipeline()
+            pipeline.lpush(key, json.dumps(profile.as_sample()))
+            pipeline.ltrim(key, 0, cls.SAMPLE_LIMIT - 1)
+            pipeline.expire(key, cls.TIMEOUT)
+            pipeline.sadd(cls.INDEX_KEY, profile.view_name)
+            pipeline.expire(cls.INDEX_KEY, cls.TIMEOUT)
+            pipeline.execute()
+        except Exception:
+            logger.exception(f"Could not save profile sample for {key}.")
+
+    @classmethod
+    def samples(cls, view_name):
+        """Return the samples recorded for a view, oldest first."""
+        samples = cls.redis().lrange(cls.key(view_name), 0, -1)
+        return [json.loads(sample) for sample in reversed(samples)]
+
+    @classmethod
+    def view_names(cls):
+        """Return the names of the profiled views."""
+        return sorted(
+            view_name.decode() for view_name in cls.redis().smembers(cls.INDEX_KEY)
+        )
+
+    @classmethod
+    def clear(cls):
+        """Remove all samples."""
+        keys = [cls.key(view_name) for view_name in cls.view_names()]
+        cls.redis().delete(cls.INDEX_KEY, *keys)
+
+    @classmethod
+    def summary(cls):
+        """Return a list of ViewSummary for each profiled view, slowest first."""
+        summaries = []
+        for view_name in cls.view_names():
+            samples = cls.samples(view_name)
+            if not samples:
+                continue
+            wall_times = [sample["wall_ms"] for sample in samples]
+            queries = [sample["queries"] for sample in samples]
+            summaries.append(
+                ViewSummary(
+                    view_name=view_name,
+                    samples=len(samples),
+                    p50_ms=percentile(wall_times, 50),
+                    p95_ms=percentile(wall_times, 95),
+                    mean_queries=round(sum(queries) / len(samples), 1),
+                    p95_queries=percentile(queries, 95),
+                    mean_sql_ms=round(
+                        sum(sample["sql_ms"] for sample in samples) / len(samples), 1
+                    ),
+                    mean_external_ms=round(
+                        sum(sum(sample["external_ms"].values()) for sample in samples)
+                        / len(samples),
+                        1,
+                    ),
+                    query_budget=RequestProfile(view_name=view_name).query_budget,
+                )
+            )
+        return sorted(summaries, key=lambda summary: summary.p95_ms, reverse=True)
@@ -0,0 +1,45 @@
+"""Tasks for the home app."""
+
+from celery import chain, group, shared_task
+
+from channels import tasks as channels_tasks
+from fba import tasks as fba_tasks
+from labelmaker import tasks as labelmaker_tasks
+from linnworks import tasks as linnworks_tasks
+from shipping import tasks as shipping_tasks
+
+
+def nightly_jobs():
+    """
+    Return the nightly jobs as a Celery canvas.
+
+    Jobs depending on other jobs are chained after them, so they run only if the
+    jobs they depend on succeed. Independent chains are grouped to run in parallel
+    on the workers.
+    """
+    return group(
+        chain(
+            shipping_tasks.update_exchange_rates.si(),
+            group(
+                chain(
+                    linnworks_tasks.import_processed_orders.si(),
+                    linnworks_tasks.update_order_guids.si(),
+                    linnworks_tasks.update_packing_records.si(),
+                ),
+                fba_tasks.update_fba_profit.si(),
+            ),
+        ),
+        chain(
+            linnworks_tasks.update_stock_level_records.si(),
+            channels_tasks.update_shopify_stock.si(),
+        ),
+        channels_tasks.update_shopify_collections.si(),
+        linnworks_tasks.create_linnworks_update.si(),
+        labelmaker_tasks.delete_expired_label_downloads.si(),
+    )
+
+
+@shared_task
+def run_nightly_jobs():
+    """Start the nightly jobs."""
+    nightly_jobs().apply_async()
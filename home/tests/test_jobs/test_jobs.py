@@ -0,0 +1,92 @@
+from unittest import mock
+
+import pytest
+
+from home import jobs
+from home.models import JobRun
+
+
+@pytest.fixture
+def job_func():
+    return mock.Mock(return_value="value")
+
+
+def test_lock_can_be_acquired():
+    assert jobs.JobLock("test_job", timeout=60).acquire() is True
+
+
+def test_lock_cannot_be_acquired_twice():
+    jobs.JobLock("test_job", timeout=60).acquire()
+    assert jobs.JobLock("test_job", timeout=60).acquire() is False
+
+
+def test_locks_are_per_job():
+    jobs.JobLock("test_job", timeout=60).acquire()
+    assert jobs.JobLock("other_job", timeout=60).acquire() is True
+
+
+@pytest.mark.django_db
+def test_run_job_calls_func(job_func):
+    jobs.run_job("test_job", job_func, 1, lock_timeout=60, value=2)
+    job_func.assert_called_once_with(1, value=2)
+
+
+@pytest.mark.django_db
+def test_run_job_returns_value(job_func):
+    assert jobs.run_job("test_job", job_func, lock_timeout=60) == "value"
+
+
+@pytest.mark.django_db
+def test_run_job_records_successful_run(job_func):
+    jobs.run_job("test_job", job_func, lock_timeout=60)
+    job_run = JobRun.objects.get()
+    assert job_run.name == "test_job"
+    assert job_run.status == JobRun.SUCCEEDED
+    assert job_run.finished_at is not None
+
+
+@pytest.mark.django_db
+def test_run_job_records_failed_run(job_func):
+    job_func.side_effect = ValueError("Failed")
+    with pytest.raises(ValueError):
+        jobs.run_job("test_job", job_func, lock_timeout=60)
+    job_run = JobRun.objects.get()
+    assert job_run.status == JobRun.FAILED
+    assert job_run.error == "ValueError: Failed"
+
+
+@pytest.mark.django_db
+def test_run_job_releases_lock(job_func):
+    jobs.run_job("test_job", job_func, lock_timeout=60)
+    assert jobs.JobLock("test_job", timeout=60).acquire() is True
+
+
+@pytest.mark.django_db
+def test_run_job_releases_lock_after_failure(job_func):
+    job_func.side_effect = ValueError("Failed")
+    with pytest.raises(ValueError):
+        jobs.run_job("test_job", job_func, lock_timeout=60)
+    assert jobs.JobLock("test_job", timeout=60).acquire() is True
+
+
+@pytest.mark.django_db
+def test_run_job_raises_when_locked(job_func):
+    jobs.JobLock("test_job", timeout=60).acquire()
+    with pytest.raises(jobs.JobLockedError):
+        jobs.run_job("test_job", job_func, lock_timeout=60)
+    job_func.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_run_job_records_skipped_run(job_func):
+    jobs.JobLock("test_job", timeout=60).acquire()
+    with pytest.raises(jobs.JobLockedError):
+        jobs.run_job("test_job", job_func, lock_timeout=60)
+    assert JobRun.objects.get().status == JobRun.SKIPPED
+
+
+@pytest.mark.django_db
+def test_scheduled_job_decorator(job_func):
+    decorated = jobs.scheduled_job("test_job")(job_func)
+    assert decorated() == "value"
+    assert JobRun.objects.get(name="test_job").status == JobRun.SUCCEEDED
@@ -0,0 +1,38 @@
+from unittest import mock
+
+from home import tasks
+
+
+def task_names(signature):
+    if hasattr(signature, "tasks"):
+        return [task_names(task) for task in signature.tasks]
+    return signature.task
+
+
+def test_nightly_jobs():
+    assert task_names(tasks.nightly_jobs()) == [
+        [
+            "shipping.tasks.update_exchange_rates",
+            [
+                [
+                    "linnworks.tasks.import_processed_orders",
+                    "linnworks.tasks.update_order_guids",
+                    "linnworks.tasks.update_packing_records",
+                ],
+                "fba.tasks.update_fba_profit",
+            ],
+        ],
+        [
+            "linnworks.tasks.update_stock_level_records",
+            "channels.tasks.update_shopify_stock",
+        ],
+        "channels.tasks.update_shopify_collections",
+        "linnworks.tasks.create_linnworks_update",
+        "labelmaker.tasks.delete_expired_label_downloads",
+    ]
+
+
+@mock.patch("home.tasks.nightly_jobs")
+def test_run_nightly_jobs(mock_nightly_jobs):
+    tasks.run_nightly_jobs()
+    mock_nightly_jobs.return_value.apply_async.assert_called_once_with()
@@ -0,0 +1,72 @@
+from unittest import mock
+
+from home.locks import CacheLock
+
+
+def test_lock_can_be_acquired():
+    assert CacheLock("test_lock", timeout=60).acquire() is True
+
+
+def test_lock_cannot_be_acquired_twice():
+    CacheLock("test_lock", timeout=60).acquire()
+    assert CacheLock("test_lock", timeout=60).acquire() is False
+
+
+def test_lock_can_be_acquired_after_release():
+    lock = CacheLock("test_lock", timeout=60)
+    lock.acquire()
+    lock.release()
+    assert CacheLock("test_lock", timeout=60).acquire() is True
+
+
+def test_release_does_not_release_another_instances_lock():
+    CacheLock("test_lock", timeout=60).acquire()
+    CacheLock("test_lock", timeout=60).release()
+    assert CacheLock("test_lock", timeout=60).acquire() is False
+
+
+def test_acquire_sets_expiring_key(fake_redis):
+    lock = CacheLock("test_lock", timeout=60)
+    with mock.patch.object(fake_redis, "set", wraps=fake_redis.set) as mock_set:
+        lock.acquire()
+    mock_set.assert_called_once_with("locks:test_lock", lock.token, nx=True, ex=60)
+
+
+def test_release_does_not_release_lock_acquired_after_expiry(fake_redis):
+    lock = CacheLock("test_lock", timeout=60)
+    lock.acquire()
+    fake_redis.delete("locks:test_lock")
+    other_lock = CacheLock("test_lock", timeout=60)
+    other_lock.acquire()
+    lock.release()
+    assert fake_redis.get("locks:test_lock") == other_lock.token.encode()
+
+
+def test_release_uses_compare_and_delete_script():
+    lock = CacheLock("test_lock", timeout=60)
+    with mock.patch.object(CacheLock, "redis") as mock_redis:
+        lock.release()
+    mock_redis.return_value.register_script.assert_called_once_with(
+        CacheLock.RELEASE_SCRIPT
+    )
+    mock_redis.return_value.register_script.return_value.assert_called_once_with(
+        keys=["locks:test_lock"], args=[lock.token]
+    )
+
+
+@mock.patch("home.locks.time")
+def test_acquire_waits_for_lock(mock_time):
+    mock_time.monotonic.side_effect = [0, 1, 2]
+    lock = CacheLock("test_lock", timeout=60)
+    with mock.patch.object(CacheLock, "redis") as mock_redis:
+        mock_redis.return_value.set.side_effect = [None, None, True]
+        assert lock.acquire(wait=5) is True
+    assert mock_time.sleep.call_count == 2
+
+
+@mock.patch("home.locks.time")
+def test_acquire_gives_up_after_wait(mock_time):
+    mock_time.monotonic.side_effect = [0, 3, 6]
+    CacheLock("test_lock", timeout=60).acquire()
+    assert CacheLock("test_lock", timeout=60).acquire(wait=5) is False
+    assert mock_time.sleep.call_count == 1
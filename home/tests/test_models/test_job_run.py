@@ -0,0 +1,68 @@
+import datetime as dt
+
+import pytest
+from django.utils import timezone
+
+from home import models
+
+
+@pytest.fixture
+def job_run():
+    return models.JobRun.objects.create(name="test_job")
+
+
+@pytest.mark.django_db
+def test_sets_name(job_run):
+    assert job_run.name == "test_job"
+
+
+@pytest.mark.django_db
+def test_status_defaults_to_running(job_run):
+    assert job_run.status == models.JobRun.RUNNING
+
+
+@pytest.mark.django_db
+def test_sets_started_at(job_run):
+    assert (timezone.now() - job_run.started_at) < dt.timedelta(seconds=5)
+
+
+@pytest.mark.django_db
+def test_finished_at_defaults_to_none(job_run):
+    assert job_run.finished_at is None
+
+
+@pytest.mark.django_db
+def test_duration_is_none_when_not_finished(job_run):
+    assert job_run.duration is None
+
+
+@pytest.mark.django_db
+def test_duration(job_run):
+    job_run.finished_at = job_run.started_at + dt.timedelta(minutes=5)
+    assert job_run.duration == dt.timedelta(minutes=5)
+
+
+@pytest.mark.django_db
+def test_finish_sets_status(job_run):
+    job_run.finish(models.JobRun.SUCCEEDED)
+    job_run.refresh_from_db()
+    assert job_run.status == models.JobRun.SUCCEEDED
+
+
+@pytest.mark.django_db
+def test_finish_sets_finished_at(job_run):
+    job_run.finish(models.JobRun.SUCCEEDED)
+    job_run.refresh_from_db()
+    assert job_run.finished_at is not None
+
+
+@pytest.mark.django_db
+def test_finish_sets_error(job_run):
+    job_run.finish(models.JobRun.FAILED, "ValueError: Failed")
+    job_run.refresh_from_db()
+    assert job_run.error == "ValueError: Failed"
+
+
+@pytest.mark.django_db
+def test_str(job_run):
+    assert str(job_run) == f"test_job {job_run.started_at:%Y-%m-%d %H:%M} running"
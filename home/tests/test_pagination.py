@@ -0,0 +1,187 @@
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.db.models import F
+
+from home import models
+from home.pagination import InvalidCursor, KeysetPaginator, estimate_count
+from orders.factories import OrderFactory
+from orders.models import Order
+
+
+@pytest.fixture
+def staff(staff_factory):
+    emails = [None, "a@example.com", "b@example.com", None, "c@example.com"]
+    return [
+        staff_factory.create(first_name=name, email_address=email)
+        for name in ("Alice", "Bob", "Carol")
+        for email in emails
+    ]
+
+
+def all_pages(paginator):
+    objects = []
+    page = paginator.page()
+    objects.extend(page)
+    while page.has_next():
+        page = paginator.page(page.next_cursor)
+        objects.extend(page)
+    return objects
+
+
+def test_get_ordering_appends_pk():
+    queryset = models.Staff.objects.order_by("first_name")
+    assert KeysetPaginator.get_ordering(queryset) == ["first_name", "pk"]
+
+
+def test_get_ordering_appends_descending_pk():
+    queryset = models.Staff.objects.order_by("-first_name")
+    assert KeysetPaginator.get_ordering(queryset) == ["-first_name", "-pk"]
+
+
+def test_get_ordering_does_not_append_pk_twice():
+    queryset = models.Staff.objects.order_by("first_name", "-id")
+    assert KeysetPaginator.get_ordering(queryset) == ["first_name", "-id"]
+
+
+def test_get_ordering_uses_ordering_argument():
+    queryset = models.Staff.objects.order_by("first_name")
+    assert KeysetPaginator.get_ordering(queryset, ["second_name"]) == [
+        "second_name",
+        "pk",
+    ]
+
+
+def test_get_ordering_uses_model_ordering():
+    queryset = models.ExternalLink.objects.all()
+    assert KeysetPaginator.get_ordering(queryset) == ["ordering", "pk"]
+
+
+def test_get_ordering_rejects_expressions():
+    queryset = models.Staff.objects.order_by(F("first_name").asc())
+    with pytest.raises(ValueError):
+        KeysetPaginator.get_ordering(queryset)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "ordering",
+    [
+        ("first_name",),
+        ("-first_name",),
+        ("email_address",),
+        ("-email_address",),
+        ("first_name", "-email_address"),
+        ("-email_address", "first_name"),
+        ("stcadmin_user__username",),
+    ],
+)
+def test_pages_contain_every_object_in_order(staff, ordering):
+    queryset = models.Staff.objects.order_by(*ordering)
+    paginator = KeysetPaginator(queryset, per_page=4)
+    expected = list(queryset.order_by(*paginator.ordering))
+    assert all_pages(paginator) == expected
+
+
+@pytest.mark.django_db
+def test_first_page(staff):
+    page = KeysetPaginator(models.Staff.objects.order_by("pk"), per_page=4).page()
+    assert page.object_list == staff[:4]
+    assert page.has_previous() is False
+    assert page.has_next() is True
+    assert page.previous_cursor is None
+
+
+@pytest.mark.django_db
+def test_last_page(staff):
+    paginator = KeysetPaginator(models.Staff.objects.order_by("pk"), per_page=10)
+    page = paginator.page(paginator.page().next_cursor)
+    assert page.object_list == staff[10:]
+    assert page.has_previous() is True
+    assert page.has_next() is False
+    assert page.next_cursor is None
+
+
+@pytest.mark.django_db
+def test_previous_page(staff):
+    paginator = KeysetPaginator(models.Staff.objects.order_by("pk"), per_page=4)
+    second_page = paginator.page(paginator.page().next_cursor)
+    third_page = paginator.page(second_page.next_cursor)
+    page = paginator.page(third_page.previous_cursor)
+    assert page.object_list == second_page.object_list
+    assert page.has_previous() is True
+    assert page.has_next() is True
+
+
+@pytest.mark.django_db
+def test_previous_page_to_first_page(staff):
+    paginator = KeysetPaginator(models.Staff.objects.order_by("pk"), per_page=4)
+    second_page = paginator.page(paginator.page().next_cursor)
+    page = paginator.page(second_page.previous_cursor)
+    assert page.object_list == staff[:4]
+    assert page.has_previous() is False
+
+
+@pytest.mark.django_db
+def test_empty_queryset():
+    page = KeysetPaginator(models.Staff.objects.none(), per_page=4).page()
+    assert page.object_list == []
+    assert page.has_other_pages() is False
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("cursor", ["invalid", "WzFd", "WyJ4IiwgWzFdXQ=="])
+def test_invalid_cursor(cursor):
+    paginator = KeysetPaginator(models.Staff.objects.order_by("pk"), per_page=4)
+    with pytest.raises(InvalidCursor):
+        paginator.page(cursor)
+
+
+@pytest.mark.django_db
+def test_count_counts_small_querysets(staff):
+    paginator = KeysetPaginator(models.Staff.objects.order_by("pk"), per_page=4)
+    assert paginator.count == len(staff)
+    assert paginator.is_estimated_count is False
+
+
+@pytest.mark.django_db
+@mock.patch("home.pagination.estimate_count")
+def test_count_estimates_large_querysets(mock_estimate_count, staff):
+    mock_estimate_count.return_value = KeysetPaginator.EXACT_COUNT_LIMIT + 1
+    paginator = KeysetPaginator(models.Staff.objects.order_by("pk"), per_page=4)
+    assert paginator.count == KeysetPaginator.EXACT_COUNT_LIMIT + 1
+    assert paginator.is_estimated_count is True
+
+
+@pytest.mark.django_db
+def test_estimate_count(staff):
+    assert isinstance(estimate_count(models.Staff.objects.all()), int)
+
+
+@pytest.mark.django_db
+def test_estimate_count_for_empty_queryset():
+    assert estimate_count(models.Staff.objects.none()) == 0
+
+
+@pytest.mark.django_db
+def test_filter_after_bounds_leading_field():
+    paginator = KeysetPaginator(Order.objects.order_by("-recieved_at"), per_page=2)
+    condition = paginator.filter_after([None, 5])
+    assert "keyset_0__lte" not in str(condition)
+    condition = paginator.filter_after(["2024-01-01T00:00:00Z", 5])
+    assert ("keyset_0__lte", "2024-01-01T00:00:00Z") in condition.children
+
+
+@pytest.mark.django_db
+def test_cursor_page_starts_index_scan_at_cursor():
+    OrderFactory.create_batch(5)
+    paginator = KeysetPaginator(Order.objects.order_by("-recieved_at"), per_page=2)
+    direction, values = paginator.decode_cursor(paginator.page().next_cursor)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE orders_order")
+        # The test table is too small for the planner to choose an index scan.
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    plan = paginator.page_queryset(direction, values).explain()
+    index_conditions = [line for line in plan.splitlines() if "Index Cond" in line]
+    assert any("recieved_at" in line for line in index_conditions)
@@ -0,0 +1,207 @@
+from unittest import mock
+
+import pytest
+
+from home import instrumentation, profiling
+from home.instrumentation import APICallStore
+
+
+@pytest.fixture
+def stats_for():
+    def _stats_for(endpoint, job_name="job"):
+        return next(
+            stats
+            for stats in APICallStore.stats()
+            if stats.endpoint == endpoint and stats.job_name == job_name
+        )
+
+    return _stats_for
+
+
+def test_current_job_defaults_to_web():
+    with mock.patch("home.instrumentation.sys.argv", ["pytest"]):
+        assert instrumentation.current_job() == "web"
+
+
+def test_current_job_for_management_command():
+    with mock.patch(
+        "home.instrumentation.sys.argv", ["/app/manage.py", "update_stock_levels"]
+    ):
+        assert instrumentation.current_job() == "command:update_stock_levels"
+
+
+def test_job_sets_current_job():
+    with instrumentation.job("job"):
+        assert instrumentation.current_job() == "job"
+    assert instrumentation.current_job() != "job"
+
+
+def test_task_handlers_set_current_job():
+    task = mock.Mock(request=mock.Mock(spec=[]))
+    task.name = "fba.tasks.file_parcelhub_shipment"
+    instrumentation.task_prerun_handler(task=task)
+    assert instrumentation.current_job() == "task:fba.tasks.file_parcelhub_shipment"
+    instrumentation.task_postrun_handler(task=task)
+    assert instrumentation.current_job() != "task:fba.tasks.file_parcelhub_shipment"
+
+
+def test_api_call_records_call(stats_for):
+    with instrumentation.job("job"):
+        with instrumentation.api_call("linnworks", "endpoint"):
+            pass
+    stats = stats_for("endpoint")
+    assert stats.service == "linnworks"
+    assert stats.calls == 1
+    assert stats.errors == 0
+    assert sum(stats.histogram) == 1
+
+
+def test_api_call_records_error(stats_for):
+    with instrumentation.job("job"):
+        with pytest.raises(ValueError):
+            with instrumentation.api_call("linnworks", "endpoint"):
+                raise ValueError()
+    stats = stats_for("endpoint")
+    assert stats.calls == 1
+    assert stats.errors == 1
+
+
+def test_api_call_logs_call():
+    with mock.patch("home.instrumentation.logger") as mock_logger:
+        with instrumentation.job("job"):
+            with instrumentation.api_call("linnworks", "endpoint"):
+                pass
+    message = mock_logger.info.call_args[0][0]
+    assert '"event": "api_call"' in message
+    assert '"endpoint": "endpoint"' in message
+    assert '"job": "job"' in message
+
+
+def test_api_call_adds_external_time_to_request_profile():
+    with profiling.profile_request() as profile:
+        with instrumentation.api_call("shopify", "endpoint"):
+            pass
+    assert "shopify" in profile.external_time
+
+
+def test_instrument_decorator(stats_for):
+    @instrumentation.instrument("shopify")
+    def get_products():
+        return "products"
+
+    with instrumentation.job("job"):
+        assert get_products() == "products"
+        get_products()
+    stats = stats_for("test_instrument_decorator.<locals>.get_products")
+    assert stats.calls == 2
+
+
+def test_instrument_decorator_with_endpoint(stats_for):
+    @instrumentation.instrument("shopify", endpoint="products")
+    def get_products():
+        pass
+
+    with instrumentation.job("job"):
+        get_products()
+    assert stats_for("products").calls == 1
+
+
+def test_rate_limit_wait(stats_for):
+    with instrumentation.job("job"):
+        with instrumentation.rate_limit_wait("shopify", "endpoint"):
+            pass
+    stats = stats_for("endpoint")
+    assert stats.calls == 0
+    assert stats.waits == 1
+    assert stats.wait_ms >= 0
+
+
+def test_record_retry(stats_for):
+    with instrumentation.job("job"):
+        instrumentation.record_retry("parcelhub", "endpoint")
+    assert stats_for("endpoint").retries == 1
+
+
+@pytest.mark.parametrize(
+    "duration_ms,expected", [(0, 0), (50, 0), (51, 1), (30000, 8), (30001, 9)]
+)
+def test_bucket(duration_ms, expected):
+    assert APICallStore.bucket(duration_ms) == expected
+
+
+def test_histogram_percentile():
+    histogram = [0] * 10
+    histogram[0] = 50
+    histogram[3] = 45
+    histogram[9] = 5
+    assert APICallStore.histogram_percentile(histogram, 50) == 50
+    assert APICallStore.histogram_percentile(histogram, 95) == 500
+    assert APICallStore.histogram_percentile(histogram, 99) is None
+
+
+def test_histogram_percentile_with_no_calls():
+    assert APICallStore.histogram_percentile([0] * 10, 50) is None
+
+
+def test_stats_are_separated_by_job(stats_for):
+    APICallStore.record_call("linnworks", "endpoint", 0.1, job_name="job")
+    APICallStore.record_call("linnworks", "endpoint", 0.1, job_name="other")
+    assert stats_for("endpoint", job_name="job").calls == 1
+    assert stats_for("endpoint", job_name="other").calls == 1
+
+
+def test_stats_mean_ms(stats_for):
+    APICallStore.record_call("linnworks", "endpoint", 0.1, job_name="job")
+    APICallStore.record_call("linnworks", "endpoint", 0.3, job_name="job")
+    assert stats_for("endpoint").mean_ms == 200.0
+
+
+def test_stats_ordered_by_total_time():
+    APICallStore.record_call("linnworks", "fast", 0.1, job_name="job")
+    APICallStore.record_call("linnworks", "slow", 1, job_name="job")
+    APICallStore.record_wait("linnworks", "waiting", 5, job_name="job")
+    endpoints = [stats.endpoint for stats in APICallStore.stats()]
+    assert endpoints == ["waiting", "slow", "fast"]
+
+
+def test_job_totals():
+    APICallStore.record_call("linnworks", "endpoint", 1, job_name="short")
+    APICallStore.record_call("linnworks", "endpoint", 2, job_name="long")
+    APICallStore.record_wait("linnworks", "endpoint", 1, job_name="long")
+    assert APICallStore.job_totals() == [("long", 3000), ("short", 1000)]
+
+
+def test_clear():
+    APICallStore.record_call("linnworks", "endpoint", 1, job_name="job")
+    APICallStore.clear()
+    assert APICallStore.stats() == []
+
+
+def test_concurrent_updates_are_not_lost(fake_redis, stats_for):
+    APICallStore.record_call("linnworks", "endpoint", 0.1, job_name="job")
+    fake_redis.hincrby(APICallStore.key("job", "linnworks", "endpoint"), "calls", 1)
+    APICallStore.record_call("linnworks", "endpoint", 0.1, job_name="job")
+    assert stats_for("endpoint").calls == 3
+
+
+def test_record_call_does_not_raise_redis_errors(fake_redis):
+    with mock.patch.object(fake_redis, "pipeline", side_effect=ConnectionError()):
+        with mock.patch("home.instrumentation.logger") as mock_logger:
+            APICallStore.record_call("linnworks", "endpoint", 1, job_name="job")
+    mock_logger.exception.assert_called_once()
+
+
+def test_api_call_returns_result_when_recording_fails(fake_redis):
+    @instrumentation.instrument("linnworks")
+    def get_stock():
+        return "stock"
+
+    with mock.patch.object(fake_redis, "pipeline", side_effect=ConnectionError()):
+        assert get_stock() == "stock"
+
+
+def test_api_call_raises_original_error_when_recording_fails(fake_redis):
+    with mock.patch.object(fake_redis, "pipeline", side_effect=ConnectionError()):
+        with pytest.raises(ValueError):
+            with instrumentation.api_call("linnworks", "endpoint"):
+                raise ValueError()
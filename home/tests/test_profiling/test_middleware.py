@@ -0,0 +1,72 @@
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+
+from home import profiling
+
+
+@pytest.fixture(autouse=True)
+def profiling_settings(settings):
+    settings.PROFILING_ENABLED = True
+    settings.PROFILING_SAMPLE_RATE = 1
+    settings.PROFILING_DEFAULT_QUERY_BUDGET = 50
+    settings.PROFILING_QUERY_BUDGETS = {}
+    return settings
+
+
+@pytest.mark.django_db
+def test_samples_request(client):
+    client.get(reverse("home:version"))
+    samples = profiling.ProfileStore.samples("home:version")
+    assert len(samples) == 1
+    assert samples[0]["wall_ms"] > 0
+
+
+@pytest.mark.django_db
+def test_does_not_sample_when_sample_rate_is_zero(client, profiling_settings):
+    profiling_settings.PROFILING_SAMPLE_RATE = 0
+    client.get(reverse("home:version"))
+    assert profiling.ProfileStore.samples("home:version") == []
+
+
+@pytest.mark.django_db
+def test_does_not_sample_when_disabled(client, profiling_settings):
+    profiling_settings.PROFILING_ENABLED = False
+    client.get(reverse("home:version"))
+    assert profiling.ProfileStore.samples("home:version") == []
+
+
+@pytest.mark.django_db
+def test_does_not_sample_unresolved_urls(client):
+    client.get("/does_not_exist/")
+    assert profiling.ProfileStore.summary() == []
+
+
+@pytest.mark.django_db
+def test_counts_queries(admin_client):
+    admin_client.get(reverse("home:index"))
+    assert profiling.ProfileStore.samples("home:index")[0]["queries"] > 0
+
+
+@pytest.mark.django_db
+def test_warns_when_over_budget(admin_client, profiling_settings):
+    profiling_settings.PROFILING_QUERY_BUDGETS = {"home:index": 0}
+    with mock.patch("home.profiling.logger") as mock_logger:
+        admin_client.get(reverse("home:index"))
+    mock_logger.warning.assert_called_once()
+    assert "home:index" in mock_logger.warning.call_args[0][0]
+
+
+@pytest.mark.django_db
+def test_does_not_warn_within_budget(admin_client):
+    with mock.patch("home.profiling.logger") as mock_logger:
+        admin_client.get(reverse("home:index"))
+    mock_logger.warning.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_redis_errors_do_not_fail_request(client, fake_redis):
+    with mock.patch.object(fake_redis, "pipeline", side_effect=ConnectionError()):
+        response = client.get(reverse("home:version"))
+    assert response.status_code == 200
@@ -0,0 +1,134 @@
+from unittest import mock
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+
+from home import profiling
+
+
+@pytest.fixture
+def make_profile():
+    def _make_profile(view_name="orders:order_list", wall_time=0.1, queries=5):
+        profile = profiling.RequestProfile(view_name=view_name)
+        profile.wall_time = wall_time
+        profile.query_count = queries
+        return profile
+
+    return _make_profile
+
+
+@pytest.mark.django_db
+def test_query_wrapper_counts_queries():
+    with profiling.profile_request() as profile:
+        with connection.execute_wrapper(profile.query_wrapper):
+            ContentType.objects.count()
+            ContentType.objects.count()
+    assert profile.query_count == 2
+    assert profile.sql_time > 0
+
+
+def test_profile_request_records_wall_time():
+    with profiling.profile_request("view") as profile:
+        pass
+    assert profile.view_name == "view"
+    assert profile.wall_time > 0
+
+
+def test_current_profile_is_reset():
+    with profiling.profile_request() as profile:
+        assert profiling.current_profile() is profile
+    assert profiling.current_profile() is None
+
+
+def test_external_call_records_time():
+    with profiling.profile_request() as profile:
+        with profiling.external_call("linnworks"):
+            pass
+        with profiling.external_call("linnworks"):
+            pass
+    assert list(profile.external_time.keys()) == ["linnworks"]
+    assert profile.external_time["linnworks"] > 0
+
+
+def test_external_call_outside_request():
+    with profiling.external_call("linnworks"):
+        pass
+
+
+def test_query_budget(settings):
+    settings.PROFILING_QUERY_BUDGETS = {"orders:order_list": 10}
+    settings.PROFILING_DEFAULT_QUERY_BUDGET = 20
+    assert profiling.RequestProfile("orders:order_list").query_budget == 10
+    assert profiling.RequestProfile("home:index").query_budget == 20
+
+
+def test_over_budget(settings, make_profile):
+    settings.PROFILING_QUERY_BUDGETS = {"orders:order_list": 10}
+    assert make_profile(queries=10).over_budget() is False
+    assert make_profile(queries=11).over_budget() is True
+
+
+@pytest.mark.parametrize(
+    "values,percent,expected",
+    [
+        ([], 50, None),
+        ([5], 95, 5),
+        ([1, 2, 3, 4], 50, 2),
+        (list(range(1, 101)), 95, 95),
+        ([3, 1, 2], 100, 3),
+    ],
+)
+def test_percentile(values, percent, expected):
+    assert profiling.percentile(values, percent) == expected
+
+
+def test_store_add(make_profile):
+    profiling.ProfileStore.add(make_profile(wall_time=0.25, queries=3))
+    assert profiling.ProfileStore.samples("orders:order_list") == [
+        {"wall_ms": 250.0, "queries": 3, "sql_ms": 0.0, "external_ms": {}}
+    ]
+
+
+def test_store_limits_samples(make_profile):
+    with mock.patch.object(profiling.ProfileStore, "SAMPLE_LIMIT", 3):
+        for queries in range(5):
+            profiling.ProfileStore.add(make_profile(queries=queries))
+    samples = profiling.ProfileStore.samples("orders:order_list")
+    assert [sample["queries"] for sample in samples] == [2, 3, 4]
+
+
+def test_store_clear(make_profile):
+    profiling.ProfileStore.add(make_profile())
+    profiling.ProfileStore.clear()
+    assert profiling.ProfileStore.samples("orders:order_list") == []
+    assert profiling.ProfileStore.summary() == []
+
+
+def test_summary_ranks_by_p95(make_profile):
+    for wall_time in (0.1, 0.2, 0.3):
+        profiling.ProfileStore.add(make_profile("fast", wall_time=wall_time))
+    for wall_time in (0.1, 0.9):
+        profiling.ProfileStore.add(make_profile("slow", wall_time=wall_time))
+    summaries = profiling.ProfileStore.summary()
+    assert [summary.view_name for summary in summaries] == ["slow", "fast"]
+    assert summaries[1].samples == 3
+    assert summaries[1].p50_ms == 200.0
+    assert summaries[1].p95_ms == 300.0
+
+
+def test_summary_over_budget(settings, make_profile):
+    settings.PROFILING_QUERY_BUDGETS = {"orders:order_list": 10}
+    profiling.ProfileStore.add(make_profile(queries=5))
+    profiling.ProfileStore.add(make_profile(queries=15))
+    summary = profiling.ProfileStore.summary()[0]
+    assert summary.mean_queries == 10
+    assert summary.p95_queries == 15
+    assert summary.over_budget is True
+
+
+def test_store_add_does_not_raise_redis_errors(fake_redis, make_profile):
+    with mock.patch.object(fake_redis, "pipeline", side_effect=ConnectionError()):
+        with mock.patch("home.profiling.logger") as mock_logger:
+            profiling.ProfileStore.add(make_profile())
+    mock_logger.exception.assert_called_once()
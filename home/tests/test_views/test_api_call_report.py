@@ -0,0 +1,57 @@
+import pytest
+from django.urls import reverse
+
+from home.instrumentation import APICallStore
+
+
+@pytest.fixture
+def url():
+    return reverse("api_call_report")
+
+
+@pytest.fixture
+def staff_client(client, create_user, test_password):
+    user = create_user(is_staff=True)
+    client.login(username=user.username, password=test_password)
+    return client
+
+
+@pytest.fixture
+def recorded_call():
+    APICallStore.record_call(
+        "linnworks",
+        "StockManager._get_stock_item_ids",
+        0.2,
+        job_name="command:update_stock_levels",
+    )
+
+
+@pytest.mark.django_db
+def test_logged_out_client_is_redirected(logged_out_client, url):
+    assert logged_out_client.get(url).status_code == 302
+
+
+@pytest.mark.django_db
+def test_non_staff_user_is_redirected(valid_client, url):
+    assert valid_client.get(url).status_code == 302
+
+
+@pytest.mark.django_db
+def test_staff_user_can_access(staff_client, url):
+    assert staff_client.get(url).status_code == 200
+
+
+@pytest.mark.django_db
+def test_contains_stats(staff_client, url, recorded_call):
+    response = staff_client.get(url)
+    assert [stats.endpoint for stats in response.context["stats"]] == [
+        "StockManager._get_stock_item_ids"
+    ]
+    assert response.context["job_totals"] == [("command:update_stock_levels", 200)]
+    assert "StockManager._get_stock_item_ids" in response.content.decode("utf8")
+
+
+@pytest.mark.django_db
+def test_post_clears_stats(staff_client, url, recorded_call):
+    assert staff_client.post(url).status_code == 302
+    assert APICallStore.stats() == []
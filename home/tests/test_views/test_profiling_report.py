@@ -0,0 +1,58 @@
+import pytest
+from django.urls import reverse
+
+from home import profiling
+
+
+@pytest.fixture
+def url():
+    return reverse("profiling_report")
+
+
+@pytest.fixture
+def staff_client(client, create_user, test_password):
+    user = create_user(is_staff=True)
+    client.login(username=user.username, password=test_password)
+    return client
+
+
+@pytest.fixture
+def sample():
+    profile = profiling.RequestProfile(view_name="orders:order_list")
+    profile.wall_time = 0.5
+    profile.query_count = 12
+    profiling.ProfileStore.add(profile)
+    return profile
+
+
+@pytest.mark.django_db
+def test_logged_out_client_is_redirected(logged_out_client, url):
+    response = logged_out_client.get(url)
+    assert response.status_code == 302
+
+
+@pytest.mark.django_db
+def test_non_staff_user_is_redirected(valid_client, url):
+    response = valid_client.get(url)
+    assert response.status_code == 302
+
+
+@pytest.mark.django_db
+def test_staff_user_can_access(staff_client, url):
+    response = staff_client.get(url)
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_contains_summary(staff_client, url, sample):
+    response = staff_client.get(url)
+    summaries = response.context["summaries"]
+    assert [summary.view_name for summary in summaries] == ["orders:order_list"]
+    assert "orders:order_list" in response.content.decode("utf8")
+
+
+@pytest.mark.django_db
+def test_post_clears_samples(staff_client, url, sample):
+    response = staff_client.post(url)
+    assert response.status_code == 302
+    assert profiling.ProfileStore.summary() == []
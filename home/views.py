@@ -9,10 +9,10 @@ from django.conf import settings
 from django.contrib.auth import logout
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib.auth.views import PasswordChangeView
-from django.shortcuts import reverse
+from django.shortcuts import redirect, reverse
 from django.views.generic.base import RedirectView, TemplateView
 
-from home import models
+from home import instrumentation, models, profiling
 
 
 class UserLoginMixin(LoginRequiredMixin):
@@ -99,3 +99,41 @@ class ChangePasswordDone(UserLoginMixin, RedirectView):
         """Logout user."""
         logout(self.request)
         return reverse("home:login_user")
+
+
+class ProfilingReport(TemplateView):
+    """Admin page ranking views by latency and queries per request."""
+
+    template_name = "home/profiling_report.html"
+
+    def post(self, *args, **kwargs):
+        """Clear the recorded samples."""
+        profiling.ProfileStore.clear()
+        return redirect(self.request.path)
+
+    def get_context_data(self, *args, **kwargs):
+        """Return the context for the rendered template."""
+        context = super().get_context_data(*args, **kwargs)
+        context["title"] = "Request Profiling"
+        context["summaries"] = profiling.ProfileStore.summary()
+        context["sample_rate"] = settings.PROFILING_SAMPLE_RATE
+        return context
+
+
+class APICallReport(TemplateView):
+    """Admin page showing external API call statistics by job and endpoint."""
+
+    template_name = "home/api_call_report.html"
+
+    def post(self, *args, **kwargs):
+        """Clear the recorded statistics."""
+        instrumentation.APICallStore.clear()
+        return redirect(self.request.path)
+
+    def get_context_data(self, *args, **kwargs):
+        """Return the context for the rendered template."""
+        context = super().get_context_data(*args, **kwargs)
+        context["title"] = "External API Calls"
+        context["job_totals"] = instrumentation.APICallStore.job_totals()
+        context["stats"] = instrumentation.APICallStore.stats()
+        return context
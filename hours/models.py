@@ -3,6 +3,8 @@
 import calendar
 import csv
 import datetime as dt
+from collections import defaultdict
+from functools import cached_property
 from io import StringIO
 
 from django.conf import settings
@@ -69,6 +71,34 @@ class ClockTime(models.Model):
             obj = self.create(user=user, timestamp=now)
             return obj
 
+        def by_staff_and_day(self, start_date, end_date, staff=None):
+            """
+            Return clock times between two dates grouped by staff member and day.
+
+            All clock times in the range are fetched in a single query.
+
+            Args:
+                start_date (datetime.date): The first day to include.
+                end_date (datetime.date): The last day to include.
+                staff (Iterable[Staff] | QuerySet | None): Limit the clock times
+                    to these staff members.
+
+            Returns:
+                dict[int, dict[datetime.date, list[ClockTime]]]: Clock times in
+                    order by staff ID and local date. Missing staff members and
+                    days return an empty list.
+            """
+            clock_times = self.filter(
+                timestamp__date__gte=start_date, timestamp__date__lte=end_date
+            )
+            if staff is not None:
+                clock_times = clock_times.filter(user__in=staff)
+            grouped = defaultdict(lambda: defaultdict(list))
+            for clock_time in clock_times.order_by("user_id", "timestamp"):
+                day = timezone.localtime(clock_time.timestamp).date()
+                grouped[clock_time.user_id][day].append(clock_time)
+            return grouped
+
     class ClockedTooSoonError(ValueError):
         """Error raised when two clocks are recorded for the same user in the same minute."""
 
@@ -129,8 +159,17 @@ class HoursExportReport:
             row.append(self._get_day(staff_member, date))
         return row
 
+    @cached_property
+    def clock_times(self):
+        """Return clock times for the month by staff ID and date."""
+        return ClockTime.objects.by_staff_and_day(
+            dt.date(self.year, self.month, 1),
+            dt.date(self.year, self.month, self.month_length),
+            staff=Staff.objects.filter(can_clock_in=True),
+        )
+
     def _get_day(self, staff_member, date):
-        clocks = ClockTime.objects.filter(user=staff_member, timestamp__date=date)
+        clocks = self.clock_times[staff_member.id][date]
         return "\n".join([_.timestamp.strftime("%H:%M") for _ in clocks])
 
 
@@ -77,3 +77,60 @@ def test_clock_method_raises_when_clocking_within_a_minute(
     )
     with pytest.raises(models.ClockTime.ClockedTooSoonError):
         models.ClockTime.objects.clock(user=user)
+
+
+@pytest.fixture
+def clock_times(user, staff_factory, clock_time_factory):
+    other_user = staff_factory.create()
+    return [
+        clock_time_factory.create(
+            user=user, timestamp=timezone.make_aware(dt.datetime(2024, 10, 1, 16, 0))
+        ),
+        clock_time_factory.create(
+            user=user, timestamp=timezone.make_aware(dt.datetime(2024, 10, 1, 9, 0))
+        ),
+        clock_time_factory.create(
+            user=user, timestamp=timezone.make_aware(dt.datetime(2024, 10, 2, 9, 0))
+        ),
+        clock_time_factory.create(
+            user=other_user,
+            timestamp=timezone.make_aware(dt.datetime(2024, 10, 1, 9, 0)),
+        ),
+        clock_time_factory.create(
+            user=user, timestamp=timezone.make_aware(dt.datetime(2024, 11, 1, 9, 0))
+        ),
+    ]
+
+
+@pytest.mark.django_db
+def test_by_staff_and_day(user, clock_times):
+    grouped = models.ClockTime.objects.by_staff_and_day(
+        dt.date(2024, 10, 1), dt.date(2024, 10, 31)
+    )
+    assert grouped[user.id][dt.date(2024, 10, 1)] == [clock_times[1], clock_times[0]]
+    assert grouped[user.id][dt.date(2024, 10, 2)] == [clock_times[2]]
+    assert grouped[clock_times[3].user_id][dt.date(2024, 10, 1)] == [clock_times[3]]
+
+
+@pytest.mark.django_db
+def test_by_staff_and_day_excludes_times_outside_range(user, clock_times):
+    grouped = models.ClockTime.objects.by_staff_and_day(
+        dt.date(2024, 10, 1), dt.date(2024, 10, 31)
+    )
+    assert grouped[user.id][dt.date(2024, 11, 1)] == []
+
+
+@pytest.mark.django_db
+def test_by_staff_and_day_filters_staff(user, clock_times):
+    grouped = models.ClockTime.objects.by_staff_and_day(
+        dt.date(2024, 10, 1), dt.date(2024, 10, 31), staff=[user]
+    )
+    assert list(grouped.keys()) == [user.id]
+
+
+@pytest.mark.django_db
+def test_by_staff_and_day_uses_one_query(user, clock_times, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        models.ClockTime.objects.by_staff_and_day(
+            dt.date(2024, 10, 1), dt.date(2024, 10, 31)
+        )
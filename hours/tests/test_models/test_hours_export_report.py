@@ -2,6 +2,7 @@ import datetime as dt
 from unittest import mock
 
 import pytest
+from django.utils import timezone
 
 from hours.models import HoursExportReport
 
@@ -52,23 +53,50 @@ def test_header():
     ]
 
 
-@mock.patch("hours.models.ClockTime")
-def test_get_day(mock_clock_time, report_generator):
-    staff_member = mock.Mock()
+def test_get_day(report_generator):
+    staff_member = mock.Mock(id=5)
     date = dt.date(2024, 10, 10)
-    mock_clock_time.objects.filter.return_value = [
-        mock.Mock(timestamp=dt.datetime(2024, 10, 10, 10, 0)),
-        mock.Mock(timestamp=dt.datetime(2024, 10, 10, 13, 0)),
-        mock.Mock(timestamp=dt.datetime(2024, 10, 10, 13, 30)),
-        mock.Mock(timestamp=dt.datetime(2024, 10, 10, 16, 0)),
-    ]
+    report_generator.clock_times = {
+        staff_member.id: {
+            date: [
+                mock.Mock(timestamp=dt.datetime(2024, 10, 10, 10, 0)),
+                mock.Mock(timestamp=dt.datetime(2024, 10, 10, 13, 0)),
+                mock.Mock(timestamp=dt.datetime(2024, 10, 10, 13, 30)),
+                mock.Mock(timestamp=dt.datetime(2024, 10, 10, 16, 0)),
+            ]
+        }
+    }
     return_value = report_generator._get_day(staff_member, date)
-    mock_clock_time.objects.filter.assert_called_once_with(
-        user=staff_member, timestamp__date=date
-    )
     assert return_value == "10:00\n13:00\n13:30\n16:00"
 
 
+@mock.patch("hours.models.Staff")
+@mock.patch("hours.models.ClockTime")
+def test_clock_times(mock_clock_time, mock_staff_model, report_generator):
+    return_value = report_generator.clock_times
+    mock_staff_model.objects.filter.assert_called_once_with(can_clock_in=True)
+    mock_clock_time.objects.by_staff_and_day.assert_called_once_with(
+        dt.date(2024, 10, 1),
+        dt.date(2024, 10, 31),
+        staff=mock_staff_model.objects.filter.return_value,
+    )
+    assert return_value == mock_clock_time.objects.by_staff_and_day.return_value
+
+
+@pytest.mark.django_db
+def test_get_report_data_query_count(
+    staff_factory, clock_time_factory, report_generator, django_assert_num_queries
+):
+    for staff_member in staff_factory.create_batch(3, can_clock_in=True):
+        for day in range(1, 10):
+            clock_time_factory.create(
+                user=staff_member,
+                timestamp=timezone.make_aware(dt.datetime(2024, 10, day, 9, 0)),
+            )
+    with django_assert_num_queries(2):
+        report_generator._get_report_data()
+
+
 @mock.patch("hours.models.HoursExportReport._get_day")
 def test_get_row(mock_get_day, report_generator):
     staff_member = mock.Mock(full_name=mock.Mock(return_value="Jeremy Glog"))
@@ -42,10 +42,17 @@ class Hours(UserCanClockInMixin, TemplateView):
         """Return a dict of clock times."""
         calendar = Calendar()
         now = timezone.now()
-        days = {}
+        staff_member = self.request.user.staff_member
+        months = []
         month = now.replace(day=1)
         for i in range(3):
             month = month.replace(day=1) - dt.timedelta(days=i)
+            months.append(month)
+        clock_times = models.ClockTime.objects.by_staff_and_day(
+            dt.date(month.year, month.month, 1), now.date(), staff=[staff_member]
+        )[staff_member.id]
+        days = {}
+        for month in months:
             days[month] = {}
             for day in (
                 _
@@ -53,13 +60,7 @@ class Hours(UserCanClockInMixin, TemplateView):
                 if _.month == month.month and _ <= now.date()
             ):
                 days[month][day] = list(
-                    itertools.batched(
-                        models.ClockTime.objects.filter(
-                            user=self.request.user.staff_member, timestamp__date=day
-                        ),
-                        2,
-                        strict=True,
-                    )
+                    itertools.batched(clock_times[day], 2, strict=True)
                 )
         return days
 
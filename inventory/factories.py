@@ -55,6 +55,14 @@ class ManufacturerFactory(DjangoModelFactory):
     active = True
 
 
+class PackingRequirementFactory(DjangoModelFactory):
+    class Meta:
+        model = models.PackingRequirement
+
+    name = factory.Faker("text", max_nb_chars=50)
+    ordering = 0
+
+
 class VATRateFactory(DjangoModelFactory):
     class Meta:
         model = models.VATRate
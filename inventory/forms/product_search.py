@@ -32,12 +32,15 @@ class ProductSearchForm(forms.Form):
     )
 
     def get_queryset(self):
-        """Search for product ranges matching the search parameters."""
+        """
+        Search for product ranges matching the search parameters.
+
+        When searching, ranges are ordered by the best search rank of their
+        products, otherwise by name.
+        """
         products = self._filter_products(self._query_products())
         range_queryset = self._query_ranges(products)
-        return range_queryset.order_by("name").annotate(
-            variation_count=Count("products")
-        )
+        return range_queryset.annotate(variation_count=Count("products"))
 
     def _query_products(self):
         archived = self.get_archived()
@@ -45,18 +48,11 @@ class ProductSearchForm(forms.Form):
             qs = models.BaseProduct.objects.text_search(search_term, archived=archived)
         else:
             qs = models.Product.objects.filter(is_archived=archived)
-        qs = qs.variations().select_related("product_range", "supplier")
-        qs = qs.prefetch_related(
-            "variation_option_values", "variation_option_values__variation_option"
-        ).order_by("product_range__name")
-        return qs
+        return qs.variations()
 
     def _query_ranges(self, products):
-        range_pks = (
-            products.values_list("product_range", flat=True).order_by().distinct()
-        )
-        return models.ProductRange.ranges.filter(
-            pk__in=range_pks, status=models.ProductRange.COMPLETE
+        return models.ProductRange.ranges.containing(
+            products, ranked=bool(self.cleaned_data["search_term"])
         )
 
     def _filter_products(self, products):
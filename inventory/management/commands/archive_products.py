@@ -23,7 +23,8 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         """Update archivable products."""
         try:
-            Archiver.archive_products()
+            summary = Archiver.archive_products()
         except Exception as e:
             logger.exception("Error archiving products.")
             raise e
+        self.stdout.write(str(summary))
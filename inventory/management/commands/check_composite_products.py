@@ -0,0 +1,54 @@
+"""Check values stored on multipack and combination products are up to date."""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from inventory.models import CombinationProduct, MultipackProduct
+
+logger = logging.getLogger("management_commands")
+
+
+class Command(BaseCommand):
+    """Check values stored on multipack and combination products are up to date."""
+
+    help = """
+    Compare the weight, purchase price, VAT rate, brand, manufacturer, HS code and
+    flammability stored on multipack and combination products with the values of
+    their component products.
+    """
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Refresh the stored values of out of date products.",
+        )
+
+    def handle(self, *args, **options):
+        """Check values stored on multipack and combination products are up to date."""
+        try:
+            out_of_date = self.check_products(fix=options.get("fix", False))
+        except Exception as e:
+            logger.exception("Error checking composite products.")
+            raise e
+        for sku in out_of_date:
+            logger.warning(f"Composite product {sku} has out of date values.")
+        action = "Refreshed" if options.get("fix") else "Found"
+        self.stdout.write(
+            f"{action} {len(out_of_date)} out of date composite products."
+        )
+
+    @staticmethod
+    def check_products(fix=False):
+        """Return the SKUs of composite products with out of date values."""
+        out_of_date = []
+        for model in (MultipackProduct, CombinationProduct):
+            for product in model.objects.order_by("pk").iterator():
+                if product.composite_values_are_current():
+                    continue
+                out_of_date.append(product.sku)
+                if fix:
+                    product.refresh_composite_values()
+        return out_of_date
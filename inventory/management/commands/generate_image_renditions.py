@@ -0,0 +1,80 @@
+"""Generate missing square images and thumbnails for product images."""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from inventory.models import ProductImage
+
+logger = logging.getLogger("management_commands")
+
+
+def generate_renditions(image_pk):
+    """Generate renditions for an image, returning an error message on failure."""
+    try:
+        ProductImage.objects.get(pk=image_pk).generate_renditions()
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return None
+
+
+class Command(BaseCommand):
+    """Generate missing square images and thumbnails for product images."""
+
+    help = "Generate square images and thumbnails for product images missing them."
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of processes used to generate renditions.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Regenerate renditions for every image.",
+        )
+
+    def handle(self, *args, **options):
+        """Generate missing square images and thumbnails for product images."""
+        if options.get("all"):
+            images = ProductImage.objects.all()
+        else:
+            images = ProductImage.objects.missing_renditions()
+        image_ids = list(images.order_by("id").values_list("id", flat=True))
+        workers = max(1, options.get("workers") or 1)
+        try:
+            errors = self.generate(image_ids, workers)
+        except Exception as e:
+            logger.exception("Error generating image renditions.")
+            raise e
+        for image_pk, error in errors.items():
+            logger.error(f"Error generating renditions for image {image_pk}: {error}")
+        self.stdout.write(
+            f"Generated renditions for {len(image_ids) - len(errors)} of "
+            f"{len(image_ids)} images."
+        )
+
+    @staticmethod
+    def generate(image_ids, workers):
+        """Return a dict of errors from generating renditions for image_ids."""
+        if workers == 1:
+            results = map(generate_renditions, image_ids)
+        else:
+            # Worker processes must open their own database connections.
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=django.setup
+            ) as executor:
+                results = list(executor.map(generate_renditions, image_ids))
+        return {
+            image_pk: error
+            for image_pk, error in zip(image_ids, results)
+            if error is not None
+        }
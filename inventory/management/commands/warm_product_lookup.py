@@ -0,0 +1,23 @@
+"""Load all product codes into the product lookup index."""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from inventory.models import ProductCodeLookup
+
+logger = logging.getLogger("management_commands")
+
+
+class Command(BaseCommand):
+    """Load all product codes into the product lookup index."""
+
+    help = "Load all product SKUs, supplier SKUs and barcodes into the lookup index."
+
+    def handle(self, *args, **options):
+        """Load all product codes into the product lookup index."""
+        try:
+            ProductCodeLookup.warm()
+        except Exception as e:
+            logger.exception("Error warming product lookup index.")
+            raise e
@@ -0,0 +1,68 @@
+# Generated by Django 5.1.1 on 2026-10-19 10:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+def populate_search_documents(apps, schema_editor):
+    BaseProduct = apps.get_model("inventory", "BaseProduct")
+    ProductRange = apps.get_model("inventory", "ProductRange")
+    SearchVector = django.contrib.postgres.search.SearchVector
+    product_range = ProductRange.objects.filter(pk=models.OuterRef("product_range"))
+    BaseProduct.objects.update(
+        search_document=SearchVector("sku", "barcode", weight="A", config="simple")
+        + SearchVector(
+            models.Subquery(product_range.values("sku")),
+            "supplier_sku",
+            weight="B",
+            config="simple",
+        )
+        + SearchVector(
+            models.Subquery(product_range.values("name")),
+            weight="C",
+            config="simple",
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0030_baseproduct_notes_productrange_notes"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="baseproduct",
+            name="search_document",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(populate_search_documents, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="baseproduct",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"], name="baseproduct_search_doc_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="baseproduct",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["sku"],
+                name="baseproduct_sku_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="baseproduct",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["barcode"],
+                name="baseproduct_barcode_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.1 on 2026-10-19 14:03
+
+from django.db import migrations, models
+
+
+def mark_existing_renditions(apps, schema_editor):
+    # Renditions for existing images were generated when they were uploaded.
+    ProductImage = apps.get_model("inventory", "ProductImage")
+    ProductImage.objects.update(renditions_generated_at=models.F("modified_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0031_baseproduct_search_document"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productimage",
+            name="renditions_generated_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(mark_existing_renditions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,144 @@
+# Generated by Django 5.1.1 on 2026-10-19 15:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0032_productimage_renditions_generated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="combinationproduct",
+            name="cached_brand",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="inventory.brand",
+            ),
+        ),
+        migrations.AddField(
+            model_name="combinationproduct",
+            name="cached_hs_code",
+            field=models.CharField(
+                blank=True, editable=False, max_length=50, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="combinationproduct",
+            name="cached_is_flammable",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="combinationproduct",
+            name="cached_manufacturer",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="inventory.manufacturer",
+            ),
+        ),
+        migrations.AddField(
+            model_name="combinationproduct",
+            name="cached_purchase_price",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, editable=False, max_digits=8, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="combinationproduct",
+            name="cached_values_updated_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="combinationproduct",
+            name="cached_vat_rate",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="inventory.vatrate",
+            ),
+        ),
+        migrations.AddField(
+            model_name="combinationproduct",
+            name="cached_weight_grams",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="multipackproduct",
+            name="cached_brand",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="inventory.brand",
+            ),
+        ),
+        migrations.AddField(
+            model_name="multipackproduct",
+            name="cached_hs_code",
+            field=models.CharField(
+                blank=True, editable=False, max_length=50, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="multipackproduct",
+            name="cached_is_flammable",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="multipackproduct",
+            name="cached_manufacturer",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="inventory.manufacturer",
+            ),
+        ),
+        migrations.AddField(
+            model_name="multipackproduct",
+            name="cached_purchase_price",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, editable=False, max_digits=8, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="multipackproduct",
+            name="cached_values_updated_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="multipackproduct",
+            name="cached_vat_rate",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="inventory.vatrate",
+            ),
+        ),
+        migrations.AddField(
+            model_name="multipackproduct",
+            name="cached_weight_grams",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.1 on 2026-10-19 16:40
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def populate_display_names(apps, schema_editor):
+    BaseProduct = apps.get_model("inventory", "BaseProduct")
+    Product = apps.get_model("inventory", "Product")
+    VariationOptionValue = apps.get_model("inventory", "VariationOptionValue")
+    product_ids = set(Product.objects.values_list("pk", flat=True))
+    variation_values = defaultdict(list)
+    for product_id, value in VariationOptionValue.objects.order_by(
+        "variation_option__ordering", "variation_option_id"
+    ).values_list("product_id", "value"):
+        variation_values[product_id].append(value)
+    products = []
+    for product in BaseProduct.objects.select_related("product_range").only(
+        "pk", "supplier_sku", "product_range__name"
+    ):
+        extensions = variation_values[product.pk]
+        if product.pk in product_ids and product.supplier_sku:
+            extensions = extensions + [product.supplier_sku]
+        product.display_name = " - ".join([product.product_range.name] + extensions)
+        products.append(product)
+    BaseProduct.objects.bulk_update(products, ["display_name"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0033_composite_product_cached_values"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="baseproduct",
+            name="display_name",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(populate_display_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.1.1 on 2026-10-19 17:25
+
+from django.db import migrations
+from django.utils import timezone
+
+CACHED_FIELDS = [
+    "cached_weight_grams",
+    "cached_purchase_price",
+    "cached_vat_rate",
+    "cached_brand",
+    "cached_manufacturer",
+    "cached_hs_code",
+    "cached_is_flammable",
+    "cached_values_updated_at",
+]
+
+
+def populate_multipack_values(apps, updated_at):
+    MultipackProduct = apps.get_model("inventory", "MultipackProduct")
+    multipacks = []
+    for multipack in MultipackProduct.objects.select_related("base_product"):
+        base_product = multipack.base_product
+        multipack.cached_weight_grams = base_product.weight_grams * multipack.quantity
+        multipack.cached_purchase_price = (
+            base_product.purchase_price * multipack.quantity
+        )
+        multipack.cached_vat_rate_id = base_product.vat_rate_id
+        multipack.cached_brand_id = base_product.brand_id
+        multipack.cached_manufacturer_id = base_product.manufacturer_id
+        multipack.cached_hs_code = base_product.hs_code
+        multipack.cached_is_flammable = base_product.is_flammable
+        multipack.cached_values_updated_at = updated_at
+        multipacks.append(multipack)
+    MultipackProduct.objects.bulk_update(multipacks, CACHED_FIELDS, batch_size=500)
+
+
+def populate_combination_values(apps, updated_at):
+    CombinationProduct = apps.get_model("inventory", "CombinationProduct")
+    combinations = []
+    for combination in CombinationProduct.objects.all():
+        products = list(
+            combination.products.values(
+                "weight_grams",
+                "purchase_price",
+                "vat_rate_id",
+                "vat_rate__percentage",
+                "brand_id",
+                "manufacturer_id",
+                "hs_code",
+                "is_flammable",
+            )
+        )
+        combination.cached_values_updated_at = updated_at
+        combinations.append(combination)
+        if not products:
+            combination.cached_weight_grams = 0
+            combination.cached_purchase_price = 0
+            continue
+        first = products[0]
+        combination.cached_weight_grams = sum(p["weight_grams"] for p in products)
+        combination.cached_purchase_price = sum(p["purchase_price"] for p in products)
+        combination.cached_vat_rate_id = max(
+            products, key=lambda p: p["vat_rate__percentage"]
+        )["vat_rate_id"]
+        combination.cached_brand_id = first["brand_id"]
+        combination.cached_manufacturer_id = first["manufacturer_id"]
+        combination.cached_hs_code = first["hs_code"]
+        combination.cached_is_flammable = any(p["is_flammable"] for p in products)
+    CombinationProduct.objects.bulk_update(combinations, CACHED_FIELDS, batch_size=500)
+
+
+def populate_composite_values(apps, schema_editor):
+    # Matches MultipackProduct.get_composite_values and
+    # CombinationProduct.get_composite_values.
+    updated_at = timezone.now()
+    populate_multipack_values(apps, updated_at)
+    populate_combination_values(apps, updated_at)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0034_baseproduct_display_name"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_composite_values, migrations.RunPython.noop),
+    ]
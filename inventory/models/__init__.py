@@ -11,6 +11,7 @@ from .product import (
     MultipackProduct,
     Product,
     new_product_sku,
+    new_product_skus,
     new_range_sku,
 )
 from .product_attribute import (
@@ -25,6 +26,8 @@ from .product_attribute import (
     VATRate,
 )
 from .product_image import ProductImage, ProductImageLink, ProductRangeImageLink
+from .product_loader import ProductLoader
+from .product_lookup import ProductCodeLookup
 from .product_range import ProductRange
 from .stock_change import StockLevelHistory
 from .supplier import Supplier, SupplierContact
@@ -47,9 +50,11 @@ __all__ = [
     "Product",
     "ProductBayHistory",
     "ProductBayLink",
+    "ProductCodeLookup",
     "ProductExport",
     "ProductImage",
     "ProductImageLink",
+    "ProductLoader",
     "ProductRangeImageLink",
     "ProductRange",
     "StockLevelHistory",
@@ -59,5 +64,6 @@ __all__ = [
     "VariationOption",
     "VariationOptionValue",
     "new_product_sku",
+    "new_product_skus",
     "new_range_sku",
 ]
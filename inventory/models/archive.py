@@ -1,15 +1,42 @@
 """Methods for archiving products."""
 
+from dataclasses import dataclass, field
+
+from django.db import transaction
 from django.db.models import Count, Q
+from django.utils import timezone
 
 from linnworks.models import StockManager
 
-from .product import BaseProduct
+from .product import BaseProduct, CombinationProduct, MultipackProduct
+
+
+@dataclass
+class ArchiveSummary:
+    """Record of the products updated by an archive run."""
+
+    products: list = field(default_factory=list)
+    multipacks: list = field(default_factory=list)
+    combinations: list = field(default_factory=list)
+
+    def __str__(self):
+        return (
+            f"Archived {len(self.products)} products, "
+            f"{len(self.multipacks)} multipacks and "
+            f"{len(self.combinations)} combinations."
+        )
+
+    @property
+    def total(self):
+        """Return the number of products archived."""
+        return len(self.products) + len(self.multipacks) + len(self.combinations)
 
 
 class Archiver:
     """Provides methods for archiving products."""
 
+    STOCK_LEVEL_BATCH_SIZE = 100
+
     @classmethod
     def get_product_queryset(cls):
         """Return products that are not archived, EOL and not in any active FBA orders."""
@@ -30,14 +57,17 @@ class Archiver:
     @classmethod
     def filter_out_of_stock_products(cls, qs):
         """Return a queryset of products in qs that are out of stock."""
-        chunks = [qs[i : i + 100] for i in range(0, qs.count(), 100)]
+        product_ids = list(qs.values_list("id", flat=True))
         to_archive = []
-        for chunk in chunks:
-            chunk_stock_levels = StockManager.get_stock_levels(chunk)
-            for product in chunk:
-                if chunk_stock_levels[product.sku].available == 0:
-                    to_archive.append(product.id)
-        return qs.filter(id__in=to_archive)
+        for i in range(0, len(product_ids), cls.STOCK_LEVEL_BATCH_SIZE):
+            batch = BaseProduct.objects.filter(
+                id__in=product_ids[i : i + cls.STOCK_LEVEL_BATCH_SIZE]
+            )
+            batch_stock_levels = StockManager.get_stock_levels(batch)
+            for product_id, sku in batch.values_list("id", "sku"):
+                if batch_stock_levels[sku].available == 0:
+                    to_archive.append(product_id)
+        return BaseProduct.objects.filter(id__in=to_archive)
 
     @classmethod
     def get_archivable_products(cls):
@@ -48,6 +78,51 @@ class Archiver:
 
     @classmethod
     def archive_products(cls):
-        """Update archivable products."""
-        for product in cls.get_archivable_products():
-            product.set_archived()
+        """
+        Update archivable products.
+
+        Any combination or multipack products containing an archived product will
+        also be marked archived. Stock levels are requested from Linnworks before
+        the transaction is opened, and the products are checked again inside it in
+        case they changed while the stock levels were requested.
+
+        Returns:
+            ArchiveSummary: The SKUs of the products that were archived.
+        """
+        product_ids = list(cls.get_archivable_products().values_list("id", flat=True))
+        with transaction.atomic():
+            return cls._archive(product_ids)
+
+    @classmethod
+    def _archive(cls, product_ids):
+        product_ids = list(
+            cls.get_product_queryset()
+            .filter(id__in=product_ids)
+            .values_list("id", flat=True)
+        )
+        multipacks = (
+            MultipackProduct.objects.filter(base_product__id__in=product_ids)
+            .exclude(id__in=product_ids)
+            .exclude(is_archived=True, is_end_of_line=True)
+        )
+        combinations = (
+            CombinationProduct.objects.filter(products__id__in=product_ids)
+            .exclude(id__in=product_ids)
+            .exclude(is_archived=True, is_end_of_line=True)
+            .order_by()
+            .distinct()
+        )
+        summary = ArchiveSummary()
+        archive_ids = set(product_ids)
+        for qs, skus in (
+            (BaseProduct.objects.filter(id__in=product_ids), summary.products),
+            (multipacks, summary.multipacks),
+            (combinations, summary.combinations),
+        ):
+            for product_id, sku in qs.values_list("id", "sku"):
+                archive_ids.add(product_id)
+                skus.append(sku)
+        BaseProduct.objects.filter(id__in=archive_ids).update(
+            is_archived=True, is_end_of_line=True, modified_at=timezone.now()
+        )
+        return summary
@@ -1,14 +1,26 @@
 """Models for products."""
 
 import random
+import re
 import string
 from itertools import chain
 
 from django.apps import apps
-from django.contrib.postgres.search import SearchVector
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+    TrigramSimilarity,
+)
 from django.db import models, transaction
+from django.db.models import DEFERRED
+from django.db.models.functions import Coalesce, Greatest
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.functional import cached_property
 from polymorphic.managers import PolymorphicManager, PolymorphicQuerySet
 from polymorphic.models import PolymorphicModel
 
@@ -23,10 +35,25 @@ from .product_attribute import (
     VATRate,
 )
 from .product_image import ProductImage, ProductImageLink, ProductRangeImageLink
+from .product_lookup import ProductCodeLookup
 from .product_range import ProductRange
 from .supplier import Supplier
 
 UNIQUE_SKU_ATTEMPTS = 100
+PRODUCT_SKU_LOCK_ID = 52901
+
+SEARCH_CONFIG = "simple"
+
+BULK_UPDATE_BATCH_SIZE = 500
+
+
+def search_vector(sku, barcode, range_sku, supplier_sku, range_name):
+    """Return the full text search vector for the values of a product."""
+    return (
+        SearchVector(sku, barcode, weight="A", config=SEARCH_CONFIG)
+        + SearchVector(range_sku, supplier_sku, weight="B", config=SEARCH_CONFIG)
+        + SearchVector(range_name, weight="C", config=SEARCH_CONFIG)
+    )
 
 
 class EndOfLineReason(models.Model):
@@ -83,39 +110,140 @@ class ProductQueryset(PolymorphicQuerySet):
         """Return a queryset of active products."""
         return self.filter(is_archived=False)
 
+    def update_display_names(self):
+        """Refresh the stored display names of products in the queryset."""
+        from .product_loader import ProductLoader
+
+        products = ProductLoader.load(self.values_list("pk", flat=True))
+        for product in products:
+            product.display_name = product.full_name
+        BaseProduct.objects.bulk_update(
+            products, ["display_name"], batch_size=BULK_UPDATE_BATCH_SIZE
+        )
+
+    def update_search_document(self):
+        """Refresh the stored full text search document of products in the queryset."""
+        product_range = ProductRange.objects.filter(pk=models.OuterRef("product_range"))
+        return self.update(
+            search_document=search_vector(
+                "sku",
+                "barcode",
+                models.Subquery(product_range.values("sku")),
+                "supplier_sku",
+                models.Subquery(product_range.values("name")),
+            )
+        )
+
 
 class ProductManager(PolymorphicManager):
     """Manager for Product models."""
 
     queryset_class = ProductQueryset
 
-    SEARCH_FIELDS = (
-        "product_range__name",
-        "product_range__sku",
-        "sku",
-        "supplier_sku",
-        "barcode",
-    )
+    TRIGRAM_SEARCH_FIELDS = ("sku",)
+    BULK_CREATE_BATCH_SIZE = 500
+
+    def bulk_create_products(self, products):
+        """
+        Insert multiple new products of the manager's model.
+
+        Django's bulk_create does not support multi-table inheritance, so the
+        base product rows are bulk inserted first and the child rows are then
+        inserted in batches using the new base product IDs.
 
-    def text_search(self, search_term, archived=None):
+        Args:
+            products (list): Unsaved instances of a direct subclass of BaseProduct.
+
+        Returns:
+            list: The saved products.
+        """
+        if self.model._meta.get_parent_list() != [BaseProduct]:
+            raise ValueError(f"Cannot bulk create {self.model.__name__} instances.")
+        content_type = ContentType.objects.get_for_model(
+            self.model, for_concrete_model=False
+        )
+        base_fields = [
+            field.attname
+            for field in BaseProduct._meta.concrete_fields
+            if not field.primary_key
+        ]
+        base_products = []
+        for product in products:
+            product.polymorphic_ctype = content_type
+            base_products.append(
+                BaseProduct(**{field: getattr(product, field) for field in base_fields})
+            )
+        BaseProduct.objects.bulk_create(
+            base_products, batch_size=self.BULK_CREATE_BATCH_SIZE
+        )
+        parent_link = self.model._meta.get_ancestor_link(BaseProduct)
+        for product, base_product in zip(products, base_products):
+            product.id = base_product.id
+            setattr(product, parent_link.attname, base_product.id)
+            product.created_at = base_product.created_at
+            product.modified_at = base_product.modified_at
+        fields = self.model._meta.local_concrete_fields
+        for i in range(0, len(products), self.BULK_CREATE_BATCH_SIZE):
+            self._insert(
+                products[i : i + self.BULK_CREATE_BATCH_SIZE],
+                fields=fields,
+                using=self.db,
+            )
+        for product in products:
+            product._state.adding = False
+            product._state.db = self.db
+        BaseProduct.objects.filter(
+            id__in=[product.id for product in products]
+        ).update_search_document()
+        ProductCodeLookup.invalidate(
+            *(
+                code
+                for product in products
+                for code in (product.sku, product.supplier_sku, product.barcode)
+            )
+        )
+        return products
+
+    def text_search(self, search_term, archived=None, similar_barcodes=False):
         """
         Text search for product models.
 
-        Matches on product.sku, product.supplier_sku, product.barcode,
-        product.product_range.name and product.product_range.sku.
+        Matches words or word prefixes in product.sku, product.supplier_sku,
+        product.barcode, product.product_range.name and product.product_range.sku
+        using the stored search document. Product SKUs are also matched by trigram
+        similarity. Results are annotated with and ordered by rank.
 
         Args:
             search_term (str): The text to search for.
 
         Kwargs:
-            end_of_line (bool|None) default None: If True only end of line products
-                will be returned, if False no end of line products will be returned,
-                otherwise no filtering will be done based on end of line status.
+            archived (bool|None) default None: If True only archived products
+                will be returned, if False no archived products will be returned,
+                otherwise no filtering will be done based on archived status.
+            similar_barcodes (bool) default False: If True barcodes are also
+                matched by trigram similarity, so mistyped barcodes are found.
         """
+        search_query = self.search_query(search_term)
+        if search_query is None:
+            return self.none()
+        trigram_fields = self.TRIGRAM_SEARCH_FIELDS
+        if similar_barcodes:
+            trigram_fields += ("barcode",)
+        similarity = Greatest(
+            *(TrigramSimilarity(field, search_term) for field in trigram_fields),
+            models.Value(0.0),
+        )
+        match = models.Q(search_document=search_query)
+        for field in trigram_fields:
+            match |= models.Q(**{f"{field}__trigram_similar": search_term})
         qs = (
-            self.annotate(search=SearchVector(*self.SEARCH_FIELDS))
-            .filter(search=search_term)
+            self.filter(match)
+            .annotate(
+                rank=Coalesce(SearchRank("search_document", search_query), 0.0)
+                + Coalesce(similarity, 0.0)
+            )
             .select_related("product_range")
+            .order_by("-rank")
         )
         if archived is True:
             qs = qs.filter(is_archived=True)
@@ -123,6 +251,18 @@ class ProductManager(PolymorphicManager):
             qs = qs.exclude(is_archived=True)
         return qs
 
+    @staticmethod
+    def search_query(search_term):
+        """Return a prefix matching search query for search_term or None."""
+        words = re.findall(r"\w+", search_term)
+        if not words:
+            return None
+        return SearchQuery(
+            " & ".join(f"{word}:*" for word in words),
+            search_type="raw",
+            config=SEARCH_CONFIG,
+        )
+
 
 class BaseProduct(PolymorphicModel):
     """Base model for products."""
@@ -204,8 +344,21 @@ class BaseProduct(PolymorphicModel):
         PackingRequirement, related_name="products"
     )
 
+    search_document = SearchVectorField(null=True, editable=False)
+    display_name = models.TextField(blank=True, default="", editable=False)
+
     objects = ProductManager.from_queryset(ProductQueryset)()
 
+    # Memoised by variation() and listing_attributes() or set by ProductLoader.
+    _loaded_variation = None
+    _loaded_listing_attributes = None
+    # Field values as loaded from or last saved to the database, set by from_db.
+    _loaded_values = None
+
+    SEARCH_FIELDS = ("sku", "barcode", "supplier_sku", "product_range_id")
+    DISPLAY_NAME_FIELDS = ("product_range_id", "supplier_sku")
+    CODE_FIELDS = ("sku", "supplier_sku", "barcode")
+
     class Meta:
         """Meta class for the BaseProduct model."""
 
@@ -216,6 +369,17 @@ class BaseProduct(PolymorphicModel):
             models.Index(fields=["supplier_sku"]),
             models.Index(fields=["barcode"]),
             models.Index(fields=["supplier_barcode"]),
+            GinIndex(fields=["search_document"], name="baseproduct_search_doc_idx"),
+            GinIndex(
+                fields=["sku"],
+                name="baseproduct_sku_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["barcode"],
+                name="baseproduct_barcode_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
         ]
         ordering = ("product_range", "is_archived", "is_end_of_line", "range_order")
         base_manager_name = "objects"
@@ -223,11 +387,115 @@ class BaseProduct(PolymorphicModel):
     def __str__(self):
         return f"{self.sku}: {self.full_name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Create a product loaded from the database, recording its field values."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Save the product with its stored search and display values.
+
+        The search document and display name are calculated before saving, so they
+        are written in the same query as the product, and only if the fields they
+        are calculated from have changed. Changes to the product's range or
+        variation are written by ProductRange and VariationOptionValue.
+        """
+        codes_changed = self.has_changed(*self.CODE_FIELDS)
+        previous_codes = self._previous_codes() if codes_changed else []
+        changed_fields = set()
+        if self.has_changed(*self.SEARCH_FIELDS):
+            self.search_document = self.get_search_vector()
+            changed_fields.add("search_document")
+        if self.has_changed(*self.DISPLAY_NAME_FIELDS):
+            self.clear_attribute_cache()
+            if self._state.adding:
+                # A new product has no variation values to query.
+                self._loaded_variation = {}
+            self.display_name = self.full_name
+            changed_fields.add("display_name")
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], *changed_fields}
+        super().save(*args, **kwargs)
+        if "search_document" in changed_fields:
+            # The saved search document is an expression until it is reloaded.
+            self.__dict__.pop("search_document", None)
+        self._record_loaded_values()
+        if codes_changed:
+            ProductCodeLookup.invalidate(
+                *previous_codes, self.sku, self.supplier_sku, self.barcode
+            )
+
+    def _record_loaded_values(self, fields=None):
+        if fields is None:
+            deferred_fields = self.get_deferred_fields()
+            attnames = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if field.attname not in deferred_fields
+            ]
+            self._loaded_values = {}
+        else:
+            attnames = [self._meta.get_field(field).attname for field in fields]
+        self._loaded_values = {
+            **(self._loaded_values or {}),
+            **{attname: getattr(self, attname) for attname in attnames},
+        }
+
+    def has_changed(self, *attnames):
+        """Return True if any of the fields have changed since they were loaded."""
+        if self._state.adding or self._loaded_values is None:
+            return True
+        return any(
+            self._loaded_values.get(attname, DEFERRED) is DEFERRED
+            or getattr(self, attname) != self._loaded_values[attname]
+            for attname in attnames
+        )
+
+    def _previous_codes(self):
+        if self._state.adding:
+            return []
+        loaded = self._loaded_values or {}
+        codes = [loaded.get(attname, DEFERRED) for attname in self.CODE_FIELDS]
+        if DEFERRED in codes:
+            return ProductCodeLookup.product_codes(self.pk)
+        return [code for code in codes if code]
+
+    def get_search_vector(self):
+        """Return the product's full text search vector as an expression."""
+        return search_vector(
+            models.Value(self.sku),
+            models.Value(self.barcode),
+            models.Value(self.product_range.sku),
+            models.Value(self.supplier_sku),
+            models.Value(self.product_range.name),
+        )
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        """Reload the product from the database and clear memoised values."""
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._record_loaded_values(fields)
+        self.clear_attribute_cache()
+
+    def clear_attribute_cache(self):
+        """Clear the memoised full name, variation and listing attributes."""
+        self._loaded_variation = None
+        self._loaded_listing_attributes = None
+        self.__dict__.pop("full_name", None)
+
+    def update_display_name(self):
+        """Refresh the product's stored display name."""
+        self.clear_attribute_cache()
+        self.display_name = self.full_name
+        BaseProduct.objects.filter(pk=self.pk).update(display_name=self.display_name)
+
     def get_absolute_url(self):
         """Return the absolute url of the object."""
         return reverse("inventory:edit_product", kwargs={"pk": self.pk})
 
-    @property
+    @cached_property
     def full_name(self):
         """Return the product name with any extensions."""
         return " - ".join([self.product_range.name] + self.name_extensions())
@@ -248,13 +516,48 @@ class BaseProduct(PolymorphicModel):
 
     def variation(self):
         """Return the product's variation product options as a dict."""
-        options = self.variation_option_values.all().order_by("variation_option")
-        return {option.variation_option.name: option.value for option in options}
+        if self._loaded_variation is None:
+            values = self._get_prefetched("variation_option_values")
+            if values is None:
+                values = self.variation_option_values.select_related(
+                    "variation_option"
+                ).order_by("variation_option", "variation_option_id")
+            else:
+                values = sorted(
+                    values,
+                    key=lambda value: (
+                        value.variation_option.ordering,
+                        value.variation_option_id,
+                    ),
+                )
+            self._loaded_variation = {
+                value.variation_option.name: value.value for value in values
+            }
+        return dict(self._loaded_variation)
 
     def listing_attributes(self):
         """Return the product's listing product options as a dict."""
-        options = self.listing_attribute_values.all().order_by("listing_attribute")
-        return {option.listing_attribute.name: option.value for option in options}
+        if self._loaded_listing_attributes is None:
+            values = self._get_prefetched("listing_attribute_values")
+            if values is None:
+                values = self.listing_attribute_values.select_related(
+                    "listing_attribute"
+                ).order_by("listing_attribute", "listing_attribute_id")
+            else:
+                values = sorted(
+                    values,
+                    key=lambda value: (
+                        value.listing_attribute.ordering,
+                        value.listing_attribute_id,
+                    ),
+                )
+            self._loaded_listing_attributes = {
+                value.listing_attribute.name: value.value for value in values
+            }
+        return dict(self._loaded_listing_attributes)
+
+    def _get_prefetched(self, related_name):
+        return getattr(self, "_prefetched_objects_cache", {}).get(related_name)
 
     def attributes(self):
         """Return a combined dict of variation options and listing attributes."""
@@ -264,19 +567,11 @@ class BaseProduct(PolymorphicModel):
 
     def variable_options(self):
         """Return list of Product Options which are variable for the range."""
-        return list(
-            self.variation_option_values.values_list(
-                "variation_option__name", flat=True
-            )
-        )
+        return list(self.variation().keys())
 
     def variation_values(self):
         """Return a list of the product's variation option values."""
-        return list(
-            self.variation_option_values.all()
-            .values_list("value", flat=True)
-            .order_by("variation_option", "value")
-        )
+        return list(self.variation().values())
 
     def get_primary_image(self):
         """Return the primary image for the product or None if no image is available."""
@@ -358,6 +653,33 @@ class Product(BaseProduct):
         verbose_name = "Product"
         verbose_name_plural = "Products"
 
+    COMPOSITE_VALUE_FIELDS = (
+        "weight_grams",
+        "purchase_price",
+        "vat_rate_id",
+        "brand_id",
+        "manufacturer_id",
+        "hs_code",
+        "is_flammable",
+    )
+
+    def save(self, *args, **kwargs):
+        """
+        Save the product.
+
+        Multipacks and combinations containing the product are refreshed if any of
+        the values they take from it have changed.
+        """
+        refresh_composites = not self._state.adding and self.has_changed(
+            *self.COMPOSITE_VALUE_FIELDS
+        )
+        super().save(*args, **kwargs)
+        if refresh_composites:
+            for composite_product in chain(
+                self.multipacks.all(), self.combination_products.all()
+            ):
+                composite_product.refresh_composite_values()
+
     def name_extensions(self):
         """Return additions to the product name."""
         extensions = super().name_extensions()
@@ -383,82 +705,230 @@ class InitialVariation(Product):
             data[f.name] = getattr(self, f.name)
         return data
 
-    def _create_variation(self, variation):
+    def _new_variation(self, sku):
         product_kwargs = self._to_dict()
-        product_kwargs["sku"] = new_product_sku()
+        product_kwargs["sku"] = sku
         del product_kwargs["images"]
         del product_kwargs["additional_suppliers"]
         del product_kwargs["packing_requirements"]
-        product = Product(**product_kwargs)
-        product.save()
-        product.packing_requirements.set(self.packing_requirements.all())
-        for option, value in variation.items():
-            variation_option = apps.get_model(
-                "inventory", "VariationOption"
-            ).objects.get(name=option)
-            VariationOptionValue(
-                product=product, variation_option=variation_option, value=value
-            ).save()
-        return product
+        return Product(**product_kwargs)
+
+    @staticmethod
+    def _get_variation_options(variations):
+        variation_option_model = apps.get_model("inventory", "VariationOption")
+        names = {option for variation in variations for option in variation}
+        variation_options = variation_option_model.objects.in_bulk(
+            names, field_name="name"
+        )
+        if missing := names - variation_options.keys():
+            raise variation_option_model.DoesNotExist(
+                f"Variation options not found: {', '.join(sorted(missing))}"
+            )
+        return variation_options
 
     @transaction.atomic
     def create_variations(self, variations):
         """Create variation products."""
-        created_variations = []
-        for variation in variations:
-            new_variation = self._create_variation(variation)
-            created_variations.append(new_variation)
-        return created_variations
+        variation_options = self._get_variation_options(variations)
+        lock_product_skus()
+        products = Product.objects.bulk_create_products(
+            [self._new_variation(sku) for sku in new_product_skus(len(variations))]
+        )
+        packing_requirement_ids = list(
+            self.packing_requirements.values_list("id", flat=True)
+        )
+        BaseProduct.packing_requirements.through.objects.bulk_create(
+            [
+                BaseProduct.packing_requirements.through(
+                    baseproduct_id=product.id,
+                    packingrequirement_id=packing_requirement_id,
+                )
+                for product in products
+                for packing_requirement_id in packing_requirement_ids
+            ]
+        )
+        VariationOptionValue.objects.bulk_create(
+            [
+                VariationOptionValue(
+                    product=product,
+                    variation_option=variation_options[option],
+                    value=value,
+                )
+                for product, variation in zip(products, variations)
+                for option, value in variation.items()
+            ]
+        )
+        BaseProduct.objects.filter(
+            id__in=[product.id for product in products]
+        ).update_display_names()
+        return products
 
 
-class MultipackProduct(BaseProduct):
-    """Model for multipack items."""
+class CompositeProduct(models.Model):
+    """
+    Abstract model for products made up of other products.
 
-    base_product = models.ForeignKey(
-        Product, on_delete=models.PROTECT, related_name="multipacks"
+    Values calculated from a composite product's component products are stored on
+    the composite product so they can be read without querying the components. They
+    are refreshed when a component product, multipack or combination product link
+    is saved.
+
+    Subclasses define get_composite_values, returning the values calculated from
+    their component products keyed by field attribute.
+    """
+
+    cached_weight_grams = models.PositiveIntegerField(
+        blank=True, null=True, editable=False
     )
-    quantity = models.PositiveIntegerField()
-    name = models.CharField(max_length=50)
+    cached_purchase_price = models.DecimalField(
+        decimal_places=2, max_digits=8, blank=True, null=True, editable=False
+    )
+    cached_vat_rate = models.ForeignKey(
+        VATRate,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        blank=True,
+        null=True,
+        editable=False,
+    )
+    cached_brand = models.ForeignKey(
+        Brand,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        blank=True,
+        null=True,
+        editable=False,
+    )
+    cached_manufacturer = models.ForeignKey(
+        Manufacturer,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        blank=True,
+        null=True,
+        editable=False,
+    )
+    cached_hs_code = models.CharField(
+        max_length=50, blank=True, null=True, editable=False
+    )
+    cached_is_flammable = models.BooleanField(default=False, editable=False)
+    cached_values_updated_at = models.DateTimeField(
+        blank=True, null=True, editable=False
+    )
+
+    class Meta:
+        """Meta class for CompositeProduct."""
+
+        abstract = True
+
+    def set_composite_values(self):
+        """Recalculate the values of the product's cached fields without saving."""
+        values = self.get_composite_values()
+        values["cached_values_updated_at"] = timezone.now()
+        for attr, value in values.items():
+            setattr(self, attr, value)
+        return values
+
+    def refresh_composite_values(self):
+        """Recalculate and save the values of the product's cached fields."""
+        values = self.set_composite_values()
+        type(self).objects.filter(pk=self.pk).update(**values)
+
+    def composite_values_are_current(self):
+        """Return True if the cached values match the component products."""
+        if self.cached_values_updated_at is None:
+            return False
+        return all(
+            getattr(self, attr) == value
+            for attr, value in self.get_composite_values().items()
+        )
+
+    def _get_composite_value(self, attr):
+        if self.cached_values_updated_at is None:
+            self.refresh_composite_values()
+        return getattr(self, attr)
 
     @property
     def weight_grams(self):
-        """Return the weight of the multipack product."""
-        return self.base_product.weight_grams * self.quantity
+        """Return the weight of the product."""
+        return self._get_composite_value("cached_weight_grams")
 
     @property
     def purchase_price(self):
-        """Return the purchase price of the multipack product."""
-        return self.base_product.purchase_price * self.quantity
+        """Return the purchase price of the product."""
+        return self._get_composite_value("cached_purchase_price")
+
+    @property
+    def vat_rate(self):
+        """Return the product's VAT rate."""
+        return self._get_composite_value("cached_vat_rate")
 
     @property
     def brand(self):
-        """Return the mutlipack proudct's brand."""
-        return self.base_product.brand
+        """Return the product's brand."""
+        return self._get_composite_value("cached_brand")
 
     @property
     def manufacturer(self):
-        """Return the mutlipack proudct's manufacturer."""
-        return self.base_product.manufacturer
+        """Return the product's manufacturer."""
+        return self._get_composite_value("cached_manufacturer")
 
     @property
-    def vat_rate(self):
-        """Return the mutlipack proudct's VAT rate."""
-        return self.base_product.vat_rate
+    def hs_code(self):
+        """Return the product's HS code."""
+        return self._get_composite_value("cached_hs_code")
 
     @property
-    def hs_code(self):
-        """Return the mutlipack proudct's HS code."""
-        return self.base_product.hs_code
+    def is_flammable(self):
+        """Return True if the product is flammable, else False."""
+        return self._get_composite_value("cached_is_flammable")
+
+
+class MultipackProduct(BaseProduct, CompositeProduct):
+    """Model for multipack items."""
+
+    base_product = models.ForeignKey(
+        Product, on_delete=models.PROTECT, related_name="multipacks"
+    )
+    quantity = models.PositiveIntegerField()
+    name = models.CharField(max_length=50)
+
+    def save(self, *args, **kwargs):
+        """Save the multipack, refreshing the values taken from its base product."""
+        if self.has_changed("base_product_id", "quantity"):
+            values = self.set_composite_values()
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], *values}
+        super().save(*args, **kwargs)
+
+    def get_composite_values(self):
+        """Return the values of the multipack calculated from its base product."""
+        base_product = (
+            Product.objects.filter(pk=self.base_product_id)
+            .values(
+                "weight_grams",
+                "purchase_price",
+                "vat_rate_id",
+                "brand_id",
+                "manufacturer_id",
+                "hs_code",
+                "is_flammable",
+            )
+            .get()
+        )
+        return {
+            "cached_weight_grams": base_product["weight_grams"] * self.quantity,
+            "cached_purchase_price": base_product["purchase_price"] * self.quantity,
+            "cached_vat_rate_id": base_product["vat_rate_id"],
+            "cached_brand_id": base_product["brand_id"],
+            "cached_manufacturer_id": base_product["manufacturer_id"],
+            "cached_hs_code": base_product["hs_code"],
+            "cached_is_flammable": base_product["is_flammable"],
+        }
 
     @property
     def product_bay_links(self):
         """Return a queryset of linked product bays."""
-        return self.base_product.product_bay_links
-
-    @property
-    def is_flammable(self):
-        """Return True if the multipack is flammable, else False."""
-        return self.base_product.is_flammable
+        return ProductBayLink.objects.filter(product__pk=self.base_product_id)
 
 
 class CombinationProductLink(models.Model):
@@ -486,8 +956,19 @@ class CombinationProductLink(models.Model):
     def __str__(self):
         return f"{self.combination_product.sku} contains {self.quantity} {self.product.sku}"
 
+    def save(self, *args, **kwargs):
+        """Save the link and refresh the combination product's values."""
+        super().save(*args, **kwargs)
+        self.combination_product.refresh_composite_values()
+
+    def delete(self, *args, **kwargs):
+        """Delete the link and refresh the combination product's values."""
+        value = super().delete(*args, **kwargs)
+        self.combination_product.refresh_composite_values()
+        return value
+
 
-class CombinationProduct(BaseProduct):
+class CombinationProduct(BaseProduct, CompositeProduct):
     """Model for combination items."""
 
     class Meta:
@@ -505,50 +986,53 @@ class CombinationProduct(BaseProduct):
     def _product_ids(self):
         return self.products.values_list("pk", flat=True)
 
-    @property
-    def product_bay_links(self):
-        """Return a queryset of all linked product bays."""
-        return ProductBayLink.objects.filter(product__pk__in=self._product_ids())
+    def get_composite_values(self):
+        """
+        Return the values of the combination calculated from its products.
 
-    @property
-    def vat_rate(self):
-        """Return the highest combined product VAT rate."""
-        return (
-            self.products.select_related("vat_rate")
-            .order_by("-vat_rate__percentage")
-            .first()
-            .vat_rate
+        The weight and purchase price are the totals of the products' values and the
+        VAT rate is the highest of the products' VAT rates. Other values are taken
+        from the first product.
+        """
+        products = list(
+            self.products.values(
+                "weight_grams",
+                "purchase_price",
+                "vat_rate_id",
+                "vat_rate__percentage",
+                "brand_id",
+                "manufacturer_id",
+                "hs_code",
+                "is_flammable",
+            )
         )
+        if not products:
+            return {
+                "cached_weight_grams": 0,
+                "cached_purchase_price": 0,
+                "cached_vat_rate_id": None,
+                "cached_brand_id": None,
+                "cached_manufacturer_id": None,
+                "cached_hs_code": None,
+                "cached_is_flammable": False,
+            }
+        first = products[0]
+        return {
+            "cached_weight_grams": sum(p["weight_grams"] for p in products),
+            "cached_purchase_price": sum(p["purchase_price"] for p in products),
+            "cached_vat_rate_id": max(
+                products, key=lambda p: p["vat_rate__percentage"]
+            )["vat_rate_id"],
+            "cached_brand_id": first["brand_id"],
+            "cached_manufacturer_id": first["manufacturer_id"],
+            "cached_hs_code": first["hs_code"],
+            "cached_is_flammable": any(p["is_flammable"] for p in products),
+        }
 
     @property
-    def brand(self):
-        """Return the product's brand."""
-        return self.products.first().brand
-
-    @property
-    def manufacturer(self):
-        """Return the product's manufacturer."""
-        return self.products.first().manufacturer
-
-    @property
-    def hs_code(self):
-        """Return the product's HS code."""
-        return self.products.first().hs_code
-
-    @property
-    def weight_grams(self):
-        """Return the combined product weight."""
-        return sum((self.products.all().values_list("weight_grams", flat=True)))
-
-    @property
-    def purchase_price(self):
-        """Return the combined product purchase_price."""
-        return sum((self.products.all().values_list("purchase_price", flat=True)))
-
-    @property
-    def is_flammable(self):
-        """Return True if the combination product is flammable, else False."""
-        return self.products.filter(is_flammable=True).exists()
+    def product_bay_links(self):
+        """Return a queryset of all linked product bays."""
+        return ProductBayLink.objects.filter(product__pk__in=self._product_ids())
 
 
 def generate_sku():
@@ -565,27 +1049,81 @@ def generate_range_sku():
     return f"RNG_{generate_sku()}"
 
 
-def unique_sku(existing_skus, sku_function):
-    """Generate a unique SKU."""
+def unique_skus(queryset, sku_function, count):
+    """
+    Generate unique SKUs.
+
+    Candidate SKUs are generated in batches and checked against queryset with a
+    single query per batch. The SKUs are not reserved, so a concurrent caller may be
+    given the same SKUs until they are saved.
+
+    Args:
+        queryset (QuerySet): Instances with SKUs that may not be returned.
+        sku_function (Callable): Function returning a new SKU.
+        count (int): The number of SKUs to return.
+
+    Returns:
+        list[str]: count SKUs not used by any instance in queryset.
+    """
+    skus = []
     remaining_attempts = UNIQUE_SKU_ATTEMPTS
-    while True:
-        sku = sku_function()
-        if sku not in existing_skus:
-            return sku
+    while len(skus) < count:
+        candidates = {sku_function() for _ in range(count - len(skus))}
+        candidates.difference_update(skus)
+        existing_skus = set(
+            queryset.filter(sku__in=candidates).values_list("sku", flat=True)
+        )
+        skus.extend(candidates - existing_skus)
         remaining_attempts -= 1
-        if remaining_attempts == 0:
+        if len(skus) < count and remaining_attempts == 0:
             raise Exception(
-                f"Did not generate a unique SKU in {UNIQUE_SKU_ATTEMPTS} attemtps."
+                f"Did not generate {count} unique SKUs in "
+                f"{UNIQUE_SKU_ATTEMPTS} attempts."
             )
+    return skus
+
+
+def lock_product_skus():
+    """
+    Hold the product SKU lock until the current transaction ends.
+
+    SKUs returned by new_product_skus while the lock is held are reserved for the
+    transaction, as long as other callers inserting products with new SKUs also
+    hold the lock.
+
+    Raises:
+        transaction.TransactionManagementError: If called outside a transaction.
+    """
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        raise transaction.TransactionManagementError(
+            "The product SKU lock must be held in a transaction."
+        )
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [PRODUCT_SKU_LOCK_ID])
+
+
+def new_product_skus(count):
+    """
+    Return a list of new product SKUs.
+
+    The SKUs are only reserved if the caller holds lock_product_skus until the
+    products using them are saved.
+    """
+    return unique_skus(
+        queryset=BaseProduct.objects.all(), sku_function=generate_sku, count=count
+    )
 
 
 def new_product_sku():
     """Return a new product SKU."""
-    existing_skus = set(Product.objects.values_list("sku", flat=True).distinct())
-    return unique_sku(existing_skus=existing_skus, sku_function=generate_sku)
+    return new_product_skus(1)[0]
 
 
 def new_range_sku():
     """Return a new product range SKU."""
-    existing_skus = set(ProductRange.ranges.values_list("sku", flat=True).distinct())
-    return unique_sku(existing_skus=existing_skus, sku_function=generate_range_sku)
+    return unique_skus(
+        queryset=ProductRange.objects.all(),
+        sku_function=generate_range_sku,
+        count=1,
+    )[0]
@@ -76,6 +76,20 @@ class VariationOptionValue(models.Model):
             f"{self.variation_option.name}"
         )
 
+    def save(self, *args, **kwargs):
+        """Save the value and refresh the product's display name."""
+        super().save(*args, **kwargs)
+        self._refresh_product()
+
+    def delete(self, *args, **kwargs):
+        """Delete the value and refresh the product's display name."""
+        value = super().delete(*args, **kwargs)
+        self._refresh_product()
+        return value
+
+    def _refresh_product(self):
+        self.product.update_display_name()
+
 
 class ListingAttributeValue(models.Model):
     """Model for product listing attribute values."""
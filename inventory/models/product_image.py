@@ -1,12 +1,12 @@
 """Models for storing product images."""
 
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 
-from django.db import models, transaction
+from django.db import connections, models, transaction
 from django.db.models import Max
 from django.utils import timezone
-from imagekit.cachefiles.strategies import Optimistic
 from imagekit.models import ImageSpecField, ProcessedImageField
 from imagekit.processors import Anchor, ResizeCanvas, Thumbnail
 
@@ -53,18 +53,46 @@ class SquareThumbnail:
         return img
 
 
+class Deferred:
+    """
+    Cache file strategy that leaves rendition generation to a background task.
+
+    Renditions are generated by ProductImage.generate_renditions, which is queued
+    when an image is uploaded.
+    """
+
+    def on_source_saved(self, file):
+        """Do not generate renditions when the source image is saved."""
+
+    def should_verify_existence(self, file):
+        """Assume renditions exist."""
+        return False
+
+
 class ProductImageManager(models.Manager):
     """Model manager for the ProductImage model."""
 
+    HASH_CHUNK_SIZE = 64 * 1024
+    HASH_WORKERS = 4
+
     def add_image(self, uploaded_file, hash_string=None):
-        """Add an image to the database."""
+        """Add an image to the database and queue generation of its renditions."""
+        from inventory import tasks
+
         if hash_string is None:
             hash_string = self.get_hash(uploaded_file)
         uploaded_file.name = str(uuid4())
         image = self.model(hash=hash_string, image_file=uploaded_file)
         image.save()
+        transaction.on_commit(
+            lambda: tasks.generate_image_renditions.delay(image.pk), using=self.db
+        )
         return image
 
+    def missing_renditions(self):
+        """Return a queryset of images whose renditions have not been generated."""
+        return self.filter(renditions_generated_at__isnull=True)
+
     def get_or_add_image(self, uploaded_file):
         """Check if an image exists in the database and return or create it."""
         hash_string = self.get_hash(uploaded_file)
@@ -73,12 +101,53 @@ class ProductImageManager(models.Manager):
         except self.model.DoesNotExist:
             return self.add_image(uploaded_file=uploaded_file, hash_string=hash_string)
 
+    def get_or_add_images(self, uploaded_files):
+        """
+        Return an image for each distinct uploaded file, creating any that are new.
+
+        Uploads are hashed in parallel and matched against existing images in a
+        single query. Files duplicating an earlier upload are skipped.
+
+        Args:
+            uploaded_files (iterable[django.core.files.uploadedfile.UploadedFile]):
+                The uploaded images.
+
+        Returns:
+            list[inventory.models.ProductImage]: The images in upload order.
+        """
+        uploaded_files = list(uploaded_files)
+        uploads = {}
+        for uploaded_file, hash_string in zip(
+            uploaded_files, self.get_hashes(uploaded_files)
+        ):
+            uploads.setdefault(hash_string, uploaded_file)
+        existing = self.in_bulk(list(uploads.keys()), field_name="hash")
+        images = []
+        for hash_string, uploaded_file in uploads.items():
+            image = existing.get(hash_string)
+            if image is None:
+                image = self.add_image(
+                    uploaded_file=uploaded_file, hash_string=hash_string
+                )
+            images.append(image)
+        return images
+
     def get_hash(self, uploaded_file):
-        """Return the hash of an uploaded image."""
+        """Return the hash of an uploaded image, reading it in chunks."""
         ctx = hashlib.md5()
-        ctx.update(uploaded_file.read())
+        for chunk in uploaded_file.chunks(chunk_size=self.HASH_CHUNK_SIZE):
+            ctx.update(chunk)
+        uploaded_file.seek(0)
         return ctx.hexdigest()
 
+    def get_hashes(self, uploaded_files):
+        """Return the hashes of several uploaded images, hashing them in parallel."""
+        if len(uploaded_files) < 2:
+            return [self.get_hash(uploaded_file) for uploaded_file in uploaded_files]
+        workers = min(self.HASH_WORKERS, len(uploaded_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_hash, uploaded_files))
+
 
 class ProductImage(models.Model):
     """Model for storing product images."""
@@ -93,18 +162,21 @@ class ProductImage(models.Model):
         processors=[SquareCrop()],
         format="JPEG",
         options={"quality": 80},
-        cachefile_strategy=Optimistic,
+        cachefile_strategy=Deferred,
     )
     thumbnail = ImageSpecField(
         source="image_file",
         processors=[SquareThumbnail()],
         format="JPEG",
         options={"quality": 60},
-        cachefile_strategy=Optimistic,
+        cachefile_strategy=Deferred,
     )
     hash = models.CharField(
         max_length=32, blank=True, null=True, unique=True, db_index=True
     )
+    renditions_generated_at = models.DateTimeField(
+        blank=True, null=True, editable=False
+    )
     created_at = models.DateTimeField(default=timezone.now, editable=False)
     modified_at = models.DateTimeField(auto_now=True)
 
@@ -126,6 +198,42 @@ class ProductImage(models.Model):
         self.image_file.delete()
         return super().delete(*args, **kwargs)
 
+    @property
+    def renditions_ready(self):
+        """Return True if the square image and thumbnail have been generated."""
+        return self.renditions_generated_at is not None
+
+    @property
+    def square_image_url(self):
+        """Return the URL of the square image, or the original until it exists."""
+        if not self.renditions_ready:
+            return self.image_file.url
+        return self.square_image.url
+
+    @property
+    def thumbnail_url(self):
+        """Return the URL of the thumbnail, or the original until it exists."""
+        if not self.renditions_ready:
+            return self.image_file.url
+        return self.thumbnail.url
+
+    def generate_renditions(self):
+        """Generate the square image and thumbnail and record that they exist."""
+        try:
+            for rendition in (self.square_image, self.thumbnail):
+                rendition.generate(force=True)
+        finally:
+            self.image_file.close()
+        self.renditions_generated_at = timezone.now()
+        ProductImage.objects.filter(pk=self.pk).update(
+            renditions_generated_at=self.renditions_generated_at
+        )
+
+    def ensure_renditions(self):
+        """Generate the square image and thumbnail if they do not yet exist."""
+        if not self.renditions_ready:
+            self.generate_renditions()
+
     def delete_thumbnail(self, silent=False):
         """Delete the thumbnail image from storage."""
         try:
@@ -146,6 +254,9 @@ class ProductImage(models.Model):
 class BaseImageLinkManager(models.Manager):
     """Base manager for image link models."""
 
+    APPEND_POSITION = 99999
+    BATCH_SIZE = 500
+
     def get_highest_image_position(self, product_id):
         """
         Return the highest position number for a product's images or None if no images exist.
@@ -169,23 +280,88 @@ class BaseImageLinkManager(models.Manager):
             image_order (list[int]): The IDs of the product's images in the new order.
 
         Raises:
-            Exception: _description_
+            Exception: If image_order does not contain exactly the product's images.
         """
-        image_links = self._get_image_links(product_pk)
-        if not set(image_links.values_list("image__pk", flat=True)) == set(image_order):
+        link_ids = dict(self._get_image_links(product_pk).values_list("image_id", "id"))
+        if set(link_ids) != set(image_order) or len(image_order) != len(link_ids):
             raise Exception("Did not get expected image IDs.")
-        for link in image_links:
-            link.position = image_order.index(link.image.pk)
-            link.save()
+        self.set_positions(
+            {link_ids[image_pk]: i for i, image_pk in enumerate(image_order)}
+        )
+
+    def set_positions(self, positions):
+        """
+        Set the position of several image links in a single query.
+
+        Args:
+            positions (dict[int, int]): Positions for image links, keyed by link ID.
+        """
+        now = timezone.now()
+        links = [
+            self.model(pk=link_pk, position=position, modified_at=now)
+            for link_pk, position in positions.items()
+        ]
+        self.bulk_update(links, ["position", "modified_at"], batch_size=self.BATCH_SIZE)
 
-    @transaction.atomic
     def normalize_image_positions(self, product_pk):
         """Make image positions continuous from zero."""
-        links = self._get_image_links(product_pk).order_by("position")
-        for i, link in enumerate(links):
-            if link.position != i:
-                link.position = i
-                link.save()
+        self.normalize_positions([product_pk])
+
+    def normalize_positions(self, product_pks):
+        """
+        Make image positions continuous from zero for several products.
+
+        Positions are renumbered with a window function in a single UPDATE. Links
+        sharing a position keep the order in which they were created.
+
+        Args:
+            product_pks (iterable[int]): The PKs of the products to update.
+        """
+        product_pks = list(product_pks)
+        if not product_pks:
+            return
+        connection = connections[self.db]
+        quote = connection.ops.quote_name
+        opts = self.model._meta
+        table = quote(opts.db_table)
+        pk = quote(opts.pk.column)
+        product = quote(opts.get_field(self.product_field).column)
+        position = quote(opts.get_field("position").column)
+        modified_at = quote(opts.get_field("modified_at").column)
+        sql = f"""
+            UPDATE {table}
+            SET {position} = ranked.new_position, {modified_at} = %s
+            FROM (
+                SELECT {pk} AS link_id, ROW_NUMBER() OVER (
+                    PARTITION BY {product} ORDER BY {position}, {pk}
+                ) - 1 AS new_position
+                FROM {table}
+                WHERE {product} = ANY(%s)
+            ) AS ranked
+            WHERE {table}.{pk} = ranked.link_id
+            AND {table}.{position} <> ranked.new_position
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [timezone.now(), product_pks])
+
+    @transaction.atomic
+    def remove_image(self, product_pk, image_pk):
+        """Remove an image from a product and close the gap in image positions."""
+        self._get_image_links(product_pk).get(image__pk=image_pk).delete()
+        self.normalize_positions([product_pk])
+
+    def _add_links(self, product_pks, images):
+        links = [
+            self.model(
+                **{self.product_field + "_id": product_pk},
+                image=image,
+                position=self.APPEND_POSITION + i,
+            )
+            for i, image in enumerate(images)
+            for product_pk in product_pks
+        ]
+        self.bulk_create(links, batch_size=self.BATCH_SIZE)
+        self.normalize_positions(product_pks)
 
     def _get_image_links(self, product_pk):
         return self.filter(**{self.product_field + "__pk": product_pk})
@@ -205,12 +381,8 @@ class ProductImageLinkManager(BaseImageLinkManager):
             uploaded_images (iterable[django.core.files.uploadedfile.InMemoryUploadedFile]):
                 List of images
         """
-        for i, image in enumerate(uploaded_images):
-            db_image = ProductImage.objects.get_or_add_image(image)
-            for product in products:
-                self.model(product=product, image=db_image, position=99999 + i).save()
-        for product in products:
-            self.normalize_image_positions(product.pk)
+        images = ProductImage.objects.get_or_add_images(uploaded_images)
+        self._add_links([product.pk for product in products], images)
 
 
 class ProductRangeImageLinkManager(BaseImageLinkManager):
@@ -228,14 +400,8 @@ class ProductRangeImageLinkManager(BaseImageLinkManager):
             uploaded_images (iterable[django.core.files.uploadedfile.InMemoryUploadedFile]):
                 The images to add.
         """
-        for image in uploaded_images:
-            db_image = ProductImage.objects.get_or_add_image(image)
-            self.model(
-                product_range=product_range,
-                image=db_image,
-                position=999999999,
-            ).save()
-        self.normalize_image_positions(product_range.pk)
+        images = ProductImage.objects.get_or_add_images(uploaded_images)
+        self._add_links([product_range.pk], images)
 
 
 class BaseImageLink(models.Model):
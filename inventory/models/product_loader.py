@@ -0,0 +1,119 @@
+"""Load products with their related objects in a fixed number of queries."""
+
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+
+from .product import (
+    BaseProduct,
+    CombinationProduct,
+    InitialVariation,
+    MultipackProduct,
+    Product,
+)
+from .product_attribute import ListingAttributeValue, VariationOptionValue
+
+
+class ProductLoader:
+    """
+    Load fully populated products by ID or SKU.
+
+    Products are loaded as their concrete subclass, with the related objects used by
+    each subclass selected or prefetched, in one query per subclass. Variations and
+    listing attributes for all the products are loaded in one query each and are
+    attached to the products as dicts, so variation(), listing_attributes() and
+    attributes() do not query the database.
+    """
+
+    SELECT_RELATED = ("product_range", "supplier", "package_type")
+    SUBCLASS_SELECT_RELATED = {
+        Product: ("vat_rate", "brand", "manufacturer"),
+        InitialVariation: ("vat_rate", "brand", "manufacturer"),
+        MultipackProduct: (
+            "base_product",
+            "cached_vat_rate",
+            "cached_brand",
+            "cached_manufacturer",
+        ),
+        CombinationProduct: ("cached_vat_rate", "cached_brand", "cached_manufacturer"),
+    }
+    SUBCLASS_PREFETCH_RELATED = {
+        Product: ("product_bay_links__bay",),
+        InitialVariation: ("product_bay_links__bay",),
+    }
+
+    @classmethod
+    def load(cls, product_ids):
+        """
+        Return loaded products by ID.
+
+        Args:
+            product_ids (Iterable[int]): The IDs of the products to load.
+
+        Returns:
+            list[inventory.models.BaseProduct]: The products in the order of
+                product_ids. IDs not matching a product are skipped.
+        """
+        product_ids = list(dict.fromkeys(product_ids))
+        products = cls._load(pk__in=product_ids)
+        return [products[pk] for pk in product_ids if pk in products]
+
+    @classmethod
+    def load_skus(cls, skus):
+        """
+        Return loaded products by SKU.
+
+        Args:
+            skus (Iterable[str]): The SKUs of the products to load.
+
+        Returns:
+            dict[str, inventory.models.BaseProduct]: The products keyed by SKU. SKUs
+                not matching a product are skipped.
+        """
+        products = cls._load(sku__in=set(skus))
+        return {product.sku: product for product in products.values()}
+
+    @classmethod
+    def _load(cls, **lookup):
+        subclass_ids = defaultdict(list)
+        for product_id, ctype_id in (
+            BaseProduct.objects.non_polymorphic()
+            .filter(**lookup)
+            .values_list("pk", "polymorphic_ctype_id")
+            .order_by()
+        ):
+            subclass_ids[ctype_id].append(product_id)
+        products = {}
+        for ctype_id, product_ids in subclass_ids.items():
+            model = ContentType.objects.get_for_id(ctype_id).model_class()
+            queryset = (
+                model.objects.non_polymorphic()
+                .filter(pk__in=product_ids)
+                .select_related(
+                    *cls.SELECT_RELATED, *cls.SUBCLASS_SELECT_RELATED.get(model, ())
+                )
+                .prefetch_related(*cls.SUBCLASS_PREFETCH_RELATED.get(model, ()))
+            )
+            products.update((product.pk, product) for product in queryset)
+        cls._attach_attributes(products)
+        return products
+
+    @classmethod
+    def _attach_attributes(cls, products):
+        variations = defaultdict(dict)
+        for product_id, name, value in (
+            VariationOptionValue.objects.filter(product__pk__in=products.keys())
+            .order_by("variation_option", "variation_option_id")
+            .values_list("product_id", "variation_option__name", "value")
+        ):
+            variations[product_id][name] = value
+        listing_attributes = defaultdict(dict)
+        for product_id, name, value in (
+            ListingAttributeValue.objects.filter(product__pk__in=products.keys())
+            .order_by("listing_attribute", "listing_attribute_id")
+            .values_list("product_id", "listing_attribute__name", "value")
+        ):
+            listing_attributes[product_id][name] = value
+        for product_id, product in products.items():
+            product._loaded_variation = variations[product_id]
+            product._loaded_listing_attributes = listing_attributes[product_id]
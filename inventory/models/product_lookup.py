@@ -0,0 +1,130 @@
+"""Fast lookup of products by SKU, supplier SKU or barcode."""
+
+from collections import defaultdict
+
+from django.apps import apps
+from django.core.cache import caches
+from django.db.models import Q
+
+
+class ProductCodeLookup:
+    """
+    Resolve scanned or typed product codes to product IDs.
+
+    Maps each product's SKU, supplier SKU and barcode to the IDs of the products
+    using it. The index is held in the product_lookup cache and is invalidated
+    for a product's codes whenever the product is saved. Codes missing from the
+    cache are resolved from the database in a single query and cached. Codes not
+    matching any product are cached for MISS_TIMEOUT seconds only, so a code
+    scanned before its product is saved is not unknown for long.
+    """
+
+    CACHE_NAME = "product_lookup"
+    KEY_PREFIX = "product_code"
+    TIMEOUT = 60 * 60 * 24
+    MISS_TIMEOUT = 30
+    CODE_FIELDS = ("sku", "supplier_sku", "barcode")
+
+    @classmethod
+    def cache(cls):
+        """Return the cache holding the index."""
+        return caches[cls.CACHE_NAME]
+
+    @classmethod
+    def key(cls, code):
+        """Return the cache key for a product code."""
+        return f"{cls.KEY_PREFIX}:{code}"
+
+    @classmethod
+    def resolve(cls, codes):
+        """
+        Return a dict of product IDs matching each code.
+
+        Args:
+            codes (Iterable[str]): SKUs, supplier SKUs or barcodes to resolve.
+
+        Returns:
+            dict[str, list[int]]: The IDs of the products matching each code.
+                Codes not matching any product map to an empty list.
+        """
+        codes = {code.strip() for code in codes if code and code.strip()}
+        if not codes:
+            return {}
+        keys = {cls.key(code): code for code in codes}
+        cached = cls.cache().get_many(keys.keys())
+        resolved = {keys[key]: product_ids for key, product_ids in cached.items()}
+        missing = codes - resolved.keys()
+        if missing:
+            found = cls._query(missing)
+            cls.cache().set_many(
+                {cls.key(code): found[code] for code in missing if found[code]},
+                cls.TIMEOUT,
+            )
+            cls.cache().set_many(
+                {cls.key(code): [] for code in missing if not found[code]},
+                cls.MISS_TIMEOUT,
+            )
+            resolved.update({code: found[code] for code in missing})
+        return resolved
+
+    @classmethod
+    def product_ids(cls, codes):
+        """Return a set of IDs of products matching any of codes."""
+        return {
+            product_id
+            for product_ids in cls.resolve(codes).values()
+            for product_id in product_ids
+        }
+
+    @classmethod
+    def invalidate(cls, *codes):
+        """Remove product codes from the index."""
+        codes = {code for code in codes if code}
+        if codes:
+            cls.cache().delete_many([cls.key(code) for code in codes])
+
+    @classmethod
+    def product_codes(cls, product_id):
+        """Return the codes currently saved for a product."""
+        values = (
+            cls._product_model()
+            .objects.filter(pk=product_id)
+            .values_list(*cls.CODE_FIELDS)
+            .first()
+        )
+        return [code for code in values or () if code]
+
+    @classmethod
+    def warm(cls):
+        """Load codes for all products into the index."""
+        index = defaultdict(list)
+        for product_id, *codes in (
+            cls._product_model().objects.values_list("id", *cls.CODE_FIELDS).order_by()
+        ):
+            for code in set(codes):
+                if code:
+                    index[cls.key(code)].append(product_id)
+        cls.cache().set_many(dict(index), cls.TIMEOUT)
+        return len(index)
+
+    @classmethod
+    def _query(cls, codes):
+        found = defaultdict(list)
+        lookup = Q()
+        for field in cls.CODE_FIELDS:
+            lookup |= Q(**{f"{field}__in": codes})
+        rows = (
+            cls._product_model()
+            .objects.filter(lookup)
+            .values_list("id", *cls.CODE_FIELDS)
+            .order_by()
+        )
+        for product_id, *product_codes in rows:
+            for code in set(product_codes):
+                if code in codes:
+                    found[code].append(product_id)
+        return found
+
+    @staticmethod
+    def _product_model():
+        return apps.get_model("inventory", "BaseProduct")
@@ -35,6 +35,29 @@ class ProductRangeQueryset(models.QuerySet):
             ),
         ).filter(active_product_count=0)
 
+    def containing(self, products, ranked=False):
+        """
+        Return ranges containing any of products.
+
+        Args:
+            products (QuerySet): Products to find the ranges of.
+            ranked (bool): If True products must be annotated with a rank, as by
+                BaseProduct.objects.text_search, and the ranges are annotated with
+                the highest rank of their products and ordered by it. Otherwise
+                ranges are ordered by name.
+        """
+        if products.query.is_empty():
+            return self.none()
+        range_products = products.filter(product_range=models.OuterRef("pk"))
+        if not ranked:
+            return self.filter(models.Exists(range_products)).order_by("name")
+        best_rank = range_products.order_by("-rank").values("rank")[:1]
+        return (
+            self.annotate(rank=models.Subquery(best_rank))
+            .filter(rank__isnull=False)
+            .order_by("-rank", "name")
+        )
+
     def end_of_line(self):
         """Return a queryset of end of line product ranges."""
         return (
@@ -124,6 +147,12 @@ class ProductRange(models.Model):
     def __str__(self):
         return f"{self.sku}: {self.name}"
 
+    def save(self, *args, **kwargs):
+        """Save the product range and refresh its products' stored values."""
+        super().save(*args, **kwargs)
+        self.products.all().update_search_document()
+        self.products.all().update_display_names()
+
     def get_absolute_url(self):
         """Return the absolute url for the product range."""
         return reverse("inventory:product_range", kwargs={"range_pk": self.pk})
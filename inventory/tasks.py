@@ -0,0 +1,17 @@
+"""Tasks for the inventory app."""
+
+from celery import shared_task
+
+from inventory import models
+
+
+@shared_task
+def generate_image_renditions(image_pk):
+    """
+    Generate the square image and thumbnail for a product image.
+
+    Args:
+        image_pk (int): ID of the ProductImage to generate renditions for.
+    """
+    image = models.ProductImage.objects.get(pk=image_pk)
+    image.generate_renditions()
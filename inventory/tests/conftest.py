@@ -14,6 +14,7 @@ pytest_factoryboy.register(factories.PackageTypeFactory)
 pytest_factoryboy.register(factories.BrandFactory)
 pytest_factoryboy.register(factories.ManufacturerFactory)
 pytest_factoryboy.register(factories.VATRateFactory)
+pytest_factoryboy.register(factories.PackingRequirementFactory)
 pytest_factoryboy.register(factories.SupplierFactory)
 pytest_factoryboy.register(factories.SupplierContactFactory)
 pytest_factoryboy.register(factories.ProductRangeFactory)
@@ -0,0 +1,39 @@
+import pytest
+from django.core.management import call_command
+
+from inventory import models
+
+
+@pytest.fixture
+def out_of_date_multipack(multipack_product_factory):
+    multipack = multipack_product_factory.create()
+    models.Product.objects.filter(pk=multipack.base_product_id).update(
+        weight_grams=1234
+    )
+    return multipack
+
+
+@pytest.mark.django_db
+def test_reports_out_of_date_products(out_of_date_multipack, capsys):
+    call_command("check_composite_products")
+    assert "Found 1 out of date composite products." in capsys.readouterr().out
+    out_of_date_multipack.refresh_from_db()
+    assert out_of_date_multipack.cached_weight_grams != 1234 * 3
+
+
+@pytest.mark.django_db
+def test_does_not_report_current_products(
+    multipack_product_factory, combination_product_link_factory, capsys
+):
+    multipack_product_factory.create()
+    combination_product_link_factory.create()
+    call_command("check_composite_products")
+    assert "Found 0 out of date composite products." in capsys.readouterr().out
+
+
+@pytest.mark.django_db
+def test_fix_option_refreshes_values(out_of_date_multipack, capsys):
+    call_command("check_composite_products", fix=True)
+    assert "Refreshed 1 out of date composite products." in capsys.readouterr().out
+    out_of_date_multipack.refresh_from_db()
+    assert out_of_date_multipack.cached_weight_grams == 1234 * 3
@@ -0,0 +1,49 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from inventory.management.commands import generate_image_renditions
+
+
+@pytest.mark.django_db
+def test_generates_missing_renditions(product_image_factory):
+    image = product_image_factory.create()
+    call_command("generate_image_renditions", workers=1)
+    image.refresh_from_db()
+    assert image.renditions_ready is True
+
+
+@pytest.mark.django_db
+@patch("inventory.models.product_image.ProductImage.generate_renditions")
+def test_skips_ready_images(mock_generate_renditions, product_image_factory):
+    product_image_factory.create(renditions_generated_at=timezone.now())
+    call_command("generate_image_renditions", workers=1)
+    mock_generate_renditions.assert_not_called()
+
+
+@pytest.mark.django_db
+@patch("inventory.management.commands.generate_image_renditions.Command.generate")
+def test_all_option_includes_ready_images(mock_generate, product_image_factory):
+    mock_generate.return_value = {}
+    image = product_image_factory.create()
+    image.generate_renditions()
+    call_command("generate_image_renditions", workers=1, all=True)
+    mock_generate.assert_called_once_with([image.pk], 1)
+
+
+@pytest.mark.django_db
+@patch("inventory.models.product_image.ProductImage.generate_renditions")
+def test_generate_renditions_returns_error(mock_generate_renditions, product_image):
+    mock_generate_renditions.side_effect = OSError("Missing file")
+    error = generate_image_renditions.generate_renditions(product_image.pk)
+    assert error == "OSError: Missing file"
+
+
+@pytest.mark.django_db
+@patch("inventory.management.commands.generate_image_renditions.generate_renditions")
+def test_generate_collects_errors(mock_generate_renditions):
+    mock_generate_renditions.side_effect = [None, "OSError: Missing file"]
+    errors = generate_image_renditions.Command.generate([1, 2], workers=1)
+    assert errors == {2: "OSError: Missing file"}
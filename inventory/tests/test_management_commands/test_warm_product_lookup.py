@@ -0,0 +1,9 @@
+from unittest.mock import patch
+
+from inventory.management.commands import warm_product_lookup
+
+
+@patch("inventory.management.commands.warm_product_lookup.ProductCodeLookup")
+def test_warm_product_lookup(mock_lookup):
+    warm_product_lookup.Command().handle()
+    mock_lookup.warm.assert_called_once_with()
@@ -3,7 +3,7 @@ from unittest import mock
 import pytest
 
 from inventory.models import BaseProduct
-from inventory.models.archive import Archiver
+from inventory.models.archive import Archiver, ArchiveSummary
 
 
 @pytest.fixture
@@ -124,11 +124,145 @@ def test_get_archivable_products_calls_filter_out_of_stock_products(
     )
 
 
+@pytest.fixture
+def mock_get_archivable_products():
+    with mock.patch(
+        "inventory.models.archive.Archiver.get_archivable_products"
+    ) as mock_get_archivable_products:
+        yield mock_get_archivable_products
+
+
+@pytest.mark.django_db
+def test_filter_out_of_stock_products_batches_stock_level_requests(
+    mock_stock_manager, product_factory
+):
+    products = product_factory.create_batch(3)
+    mock_stock_manager.get_stock_levels.return_value = {
+        product.sku: mock.Mock(available=0) for product in products
+    }
+    qs = BaseProduct.objects.filter(id__in=[product.id for product in products])
+    with mock.patch.object(Archiver, "STOCK_LEVEL_BATCH_SIZE", 2):
+        returned_products = Archiver.filter_out_of_stock_products(qs)
+    assert mock_stock_manager.get_stock_levels.call_count == 2
+    assert set(returned_products) == set(products)
+
+
 @pytest.mark.django_db
-@mock.patch("inventory.models.archive.Archiver.get_archivable_products")
-def test_archivable_products_set_archive_method_is_called(mock_get_archivable_products):
-    products = [mock.Mock(), mock.Mock(), mock.Mock()]
-    mock_get_archivable_products.return_value = products
+def test_archive_products_archives_products(
+    mock_get_archivable_products, product_factory
+):
+    product = product_factory.create(is_end_of_line=True, is_archived=False)
+    mock_get_archivable_products.return_value = BaseProduct.objects.filter(
+        id=product.id
+    )
     Archiver.archive_products()
-    for product in products:
-        product.set_archived.assert_called_once_with()
+    product.refresh_from_db()
+    assert product.is_archived is True
+    assert product.is_end_of_line is True
+
+
+@pytest.mark.django_db
+def test_archive_products_does_not_archive_other_products(
+    mock_get_archivable_products, product_factory
+):
+    product = product_factory.create(is_end_of_line=True, is_archived=False)
+    mock_get_archivable_products.return_value = BaseProduct.objects.none()
+    Archiver.archive_products()
+    product.refresh_from_db()
+    assert product.is_archived is False
+
+
+@pytest.mark.django_db
+def test_archive_products_archives_multipacks(
+    mock_get_archivable_products, product_factory, multipack_product_factory
+):
+    product = product_factory.create(is_end_of_line=True, is_archived=False)
+    multipack = multipack_product_factory.create(base_product=product)
+    mock_get_archivable_products.return_value = BaseProduct.objects.filter(
+        id=product.id
+    )
+    Archiver.archive_products()
+    multipack.refresh_from_db()
+    assert multipack.is_archived is True
+    assert multipack.is_end_of_line is True
+
+
+@pytest.mark.django_db
+def test_archive_products_archives_combinations(
+    mock_get_archivable_products,
+    product_factory,
+    combination_product_factory,
+    combination_product_link_factory,
+):
+    product = product_factory.create(is_end_of_line=True, is_archived=False)
+    combination = combination_product_factory.create()
+    combination_product_link_factory.create(
+        product=product, combination_product=combination
+    )
+    mock_get_archivable_products.return_value = BaseProduct.objects.filter(
+        id=product.id
+    )
+    Archiver.archive_products()
+    combination.refresh_from_db()
+    assert combination.is_archived is True
+    assert combination.is_end_of_line is True
+
+
+@pytest.mark.django_db
+def test_archive_products_returns_summary(
+    mock_get_archivable_products,
+    product_factory,
+    multipack_product_factory,
+    combination_product_factory,
+    combination_product_link_factory,
+):
+    product = product_factory.create(is_end_of_line=True, is_archived=False)
+    multipack = multipack_product_factory.create(base_product=product)
+    combination = combination_product_factory.create()
+    combination_product_link_factory.create(
+        product=product, combination_product=combination
+    )
+    mock_get_archivable_products.return_value = BaseProduct.objects.filter(
+        id=product.id
+    )
+    summary = Archiver.archive_products()
+    assert isinstance(summary, ArchiveSummary)
+    assert summary.products == [product.sku]
+    assert summary.multipacks == [multipack.sku]
+    assert summary.combinations == [combination.sku]
+    assert summary.total == 3
+
+
+@pytest.mark.django_db
+def test_archive_products_does_not_archive_products_changed_during_stock_check(
+    mock_get_archivable_products, product_factory
+):
+    product = product_factory.create(is_end_of_line=True, is_archived=False)
+
+    def get_archivable_products():
+        BaseProduct.objects.filter(id=product.id).update(is_end_of_line=False)
+        return BaseProduct.objects.filter(id=product.id)
+
+    mock_get_archivable_products.side_effect = get_archivable_products
+    summary = Archiver.archive_products()
+    product.refresh_from_db()
+    assert product.is_archived is False
+    assert summary.total == 0
+
+
+@mock.patch("inventory.models.archive.transaction")
+def test_archive_products_checks_stock_outside_transaction(
+    mock_transaction, mock_get_archivable_products
+):
+    manager = mock.Mock()
+    manager.attach_mock(mock_get_archivable_products, "get_archivable_products")
+    manager.attach_mock(mock_transaction.atomic, "atomic")
+    with mock.patch.object(Archiver, "_archive"):
+        Archiver.archive_products()
+    calls = [call[0] for call in manager.mock_calls]
+    assert calls.index("get_archivable_products") < calls.index("atomic")
+
+
+def test_archive_summary_str():
+    summary = ArchiveSummary(products=["A", "B"], multipacks=["C"], combinations=[])
+    assert str(summary) == "Archived 2 products, 1 multipacks and 0 combinations."
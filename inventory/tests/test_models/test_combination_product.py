@@ -436,3 +436,55 @@ def test_is_flammable_property(combination_product, combination_product_link_fac
         combination_product=combination_product, product__is_flammable=True
     )
     assert combination_product.is_flammable is True
+
+
+@pytest.mark.django_db
+def test_values_are_refreshed_when_links_change(
+    combination_product, combination_product_link_factory
+):
+    links = combination_product_link_factory.create_batch(
+        2, combination_product=combination_product, product__weight_grams=100
+    )
+    combination_product.refresh_from_db()
+    assert combination_product.cached_weight_grams == 200
+    links[0].delete()
+    combination_product.refresh_from_db()
+    assert combination_product.cached_weight_grams == 100
+
+
+@pytest.mark.django_db
+def test_values_are_refreshed_when_a_product_is_saved(
+    combination_product, combination_product_link_factory
+):
+    link = combination_product_link_factory.create(
+        combination_product=combination_product, product__is_flammable=False
+    )
+    link.product.is_flammable = True
+    link.product.save()
+    combination_product.refresh_from_db()
+    assert combination_product.is_flammable is True
+
+
+@pytest.mark.django_db
+def test_values_are_read_without_queries(
+    combination_product, combination_product_link_factory, django_assert_num_queries
+):
+    combination_product_link_factory.create_batch(
+        3, combination_product=combination_product
+    )
+    combination_product = models.CombinationProduct.objects.get(
+        pk=combination_product.pk
+    )
+    with django_assert_num_queries(0):
+        combination_product.weight_grams
+        combination_product.purchase_price
+        combination_product.hs_code
+        combination_product.is_flammable
+
+
+@pytest.mark.django_db
+def test_values_without_products(combination_product):
+    combination_product.refresh_composite_values()
+    assert combination_product.weight_grams == 0
+    assert combination_product.brand is None
+    assert combination_product.is_flammable is False
@@ -2,7 +2,9 @@ import datetime as dt
 from decimal import Decimal
 
 import pytest
+from django.db import connection
 from django.db.utils import IntegrityError
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from inventory import models
@@ -419,7 +421,8 @@ def variation_options(variation_option_factory):
 class TestCreateVariationMethod:
     @pytest.fixture
     def created_variation(self, variation_options, initial_variation):
-        return initial_variation._create_variation({"Colour": "Red", "Size": "Large"})
+        variation = {"Colour": "Red", "Size": "Large"}
+        return initial_variation.create_variations([variation])[0]
 
     @pytest.mark.django_db
     def test_sets_sku(self, initial_variation, created_variation):
@@ -520,3 +523,66 @@ def test_create_variations_method(variation_options, initial_variation):
     assert models.VariationOptionValue.objects.filter(
         product=created_variations[1], variation_option__name="Size", value="Medium"
     ).exists()
+
+
+@pytest.mark.django_db
+def test_create_variations_creates_products(variation_options, initial_variation):
+    variations = [{"Colour": "Red"}, {"Colour": "Blue"}]
+    created_variations = initial_variation.create_variations(variations)
+    for variation in created_variations:
+        product = models.BaseProduct.objects.get(id=variation.id)
+        assert type(product) is models.Product
+        assert product.sku == variation.sku
+        assert product.purchase_price == initial_variation.purchase_price
+
+
+@pytest.mark.django_db
+def test_create_variations_sets_unique_skus(variation_options, initial_variation):
+    variations = [{"Colour": "Red"}, {"Colour": "Blue"}, {"Colour": "Green"}]
+    created_variations = initial_variation.create_variations(variations)
+    skus = {variation.sku for variation in created_variations}
+    assert len(skus) == 3
+    assert initial_variation.sku not in skus
+
+
+@pytest.mark.django_db
+def test_create_variations_holds_sku_lock(variation_options, initial_variation):
+    with CaptureQueriesContext(connection) as queries:
+        initial_variation.create_variations([{"Colour": "Red"}])
+    assert any("pg_advisory_xact_lock" in query["sql"] for query in queries)
+
+
+@pytest.mark.django_db
+def test_create_variations_sets_packing_requirements(
+    variation_options, initial_variation, packing_requirement_factory
+):
+    packing_requirements = packing_requirement_factory.create_batch(2)
+    initial_variation.packing_requirements.set(packing_requirements)
+    created_variations = initial_variation.create_variations(
+        [{"Colour": "Red"}, {"Colour": "Blue"}]
+    )
+    for variation in created_variations:
+        assert set(variation.packing_requirements.all()) == set(packing_requirements)
+
+
+@pytest.mark.django_db
+def test_create_variations_sets_search_document(variation_options, initial_variation):
+    variation = initial_variation.create_variations([{"Colour": "Red"}])[0]
+    assert variation in models.BaseProduct.objects.text_search(variation.sku)
+
+
+@pytest.mark.django_db
+def test_create_variations_raises_for_missing_variation_option(
+    variation_options, initial_variation
+):
+    with pytest.raises(models.VariationOption.DoesNotExist):
+        initial_variation.create_variations([{"Material": "Wood"}])
+
+
+@pytest.mark.django_db
+def test_create_variations_query_count_does_not_scale(
+    variation_options, initial_variation, django_assert_max_num_queries
+):
+    variations = [{"Colour": str(i), "Size": str(i)} for i in range(60)]
+    with django_assert_max_num_queries(12):
+        initial_variation.create_variations(variations)
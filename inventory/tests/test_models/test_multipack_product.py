@@ -374,11 +374,12 @@ def test_hs_code_property(multipack_product):
 
 
 @pytest.mark.django_db
-def test_product_bay_links_property(multipack_product):
-    assert (
-        multipack_product.product_bay_links
-        == multipack_product.base_product.product_bay_links
+def test_product_bay_links_property(multipack_product, product_bay_link_factory):
+    bay_links = product_bay_link_factory.create_batch(
+        2, product=multipack_product.base_product
     )
+    product_bay_link_factory.create()
+    assert set(multipack_product.product_bay_links) == set(bay_links)
 
 
 @pytest.mark.django_db
@@ -391,3 +392,67 @@ def test_is_flammable_property(multipack_product_factory):
         base_product__is_flammable=True
     )
     assert flammable_product.is_flammable is True
+
+
+@pytest.mark.django_db
+def test_values_are_stored_on_save(multipack_product):
+    assert multipack_product.cached_values_updated_at is not None
+    multipack_product = models.MultipackProduct.objects.get(pk=multipack_product.pk)
+    assert multipack_product.cached_weight_grams == (
+        multipack_product.base_product.weight_grams * multipack_product.quantity
+    )
+    assert (
+        multipack_product.cached_vat_rate_id
+        == multipack_product.base_product.vat_rate_id
+    )
+
+
+@pytest.mark.django_db
+def test_values_are_read_without_queries(multipack_product, django_assert_num_queries):
+    multipack_product = models.MultipackProduct.objects.get(pk=multipack_product.pk)
+    with django_assert_num_queries(0):
+        multipack_product.weight_grams
+        multipack_product.purchase_price
+        multipack_product.hs_code
+        multipack_product.is_flammable
+
+
+@pytest.mark.django_db
+def test_values_are_refreshed_when_base_product_is_saved(multipack_product):
+    base_product = multipack_product.base_product
+    base_product.weight_grams = 250
+    base_product.is_flammable = True
+    base_product.save()
+    multipack_product.refresh_from_db()
+    assert multipack_product.weight_grams == 250 * multipack_product.quantity
+    assert multipack_product.is_flammable is True
+
+
+@pytest.mark.django_db
+def test_values_are_refreshed_when_quantity_changes(multipack_product):
+    multipack_product.quantity = 10
+    multipack_product.save()
+    multipack_product.refresh_from_db()
+    assert multipack_product.purchase_price == (
+        multipack_product.base_product.purchase_price * 10
+    )
+
+
+@pytest.mark.django_db
+def test_missing_values_are_calculated(multipack_product):
+    models.MultipackProduct.objects.filter(pk=multipack_product.pk).update(
+        cached_values_updated_at=None, cached_hs_code=None
+    )
+    multipack_product.refresh_from_db()
+    assert multipack_product.hs_code == multipack_product.base_product.hs_code
+    multipack_product.refresh_from_db()
+    assert multipack_product.cached_values_updated_at is not None
+
+
+@pytest.mark.django_db
+def test_composite_values_are_current_method(multipack_product):
+    assert multipack_product.composite_values_are_current() is True
+    models.Product.objects.filter(pk=multipack_product.base_product_id).update(
+        hs_code="999999"
+    )
+    assert multipack_product.composite_values_are_current() is False
@@ -415,3 +415,122 @@ class TestGetPrimaryImageMethod:
         self, product, range_images
     ):
         assert product.get_primary_image() == range_images[0].image
+
+
+@pytest.mark.django_db
+def test_attribute_methods_are_memoised(variant, django_assert_num_queries):
+    variant.refresh_from_db()
+    variant.attributes()
+    variant.full_name
+    with django_assert_num_queries(0):
+        variant.variation()
+        variant.listing_attributes()
+        variant.variation_values()
+        variant.variable_options()
+        variant.full_name
+
+
+@pytest.mark.django_db
+def test_attribute_methods_use_prefetched_values(variant, django_assert_num_queries):
+    product = (
+        models.Product.objects.filter(pk=variant.pk)
+        .select_related("product_range")
+        .prefetch_related(
+            "variation_option_values__variation_option",
+            "listing_attribute_values__listing_attribute",
+        )
+        .get()
+    )
+    with django_assert_num_queries(0):
+        assert product.variation() == {"Colour": "Green", "Size": "Medium"}
+        assert product.listing_attributes() == {"Design": "Cat", "Shape": "Round"}
+        assert product.full_name == variant.full_name
+
+
+@pytest.mark.django_db
+def test_refresh_from_db_clears_memoised_values(variant):
+    variant.variation()
+    models.VariationOptionValue.objects.filter(product=variant).update(value="Red")
+    variant.refresh_from_db()
+    assert variant.variation_values() == ["Red", "Red"]
+
+
+@pytest.mark.django_db
+def test_adding_variation_value_clears_memoised_values(
+    product, variation_option_value_factory
+):
+    assert product.variation() == {}
+    variation_option_value_factory.create(
+        product=product, variation_option__name="Colour", value="Green"
+    )
+    assert product.variation() == {"Colour": "Green"}
+
+
+@pytest.mark.django_db
+def test_display_name_is_set_on_save(variant):
+    variant.refresh_from_db()
+    assert variant.display_name == variant.full_name
+
+
+@pytest.mark.django_db
+def test_display_name_is_updated_when_variation_values_change(variant):
+    value = variant.variation_option_values.get(variation_option__name="Colour")
+    value.value = "Blue"
+    value.save()
+    variant.refresh_from_db()
+    assert variant.display_name.startswith("Variation Product - Blue - Medium")
+
+
+@pytest.mark.django_db
+def test_display_name_is_updated_when_range_is_renamed(variant):
+    product_range = variant.product_range
+    product_range.name = "Renamed Range"
+    product_range.save()
+    variant.refresh_from_db()
+    assert variant.display_name.startswith("Renamed Range - Green - Medium")
+
+
+@pytest.mark.django_db
+def test_saving_unchanged_product_runs_only_updates(variant, django_assert_num_queries):
+    product = models.Product.objects.get(pk=variant.pk)
+    with django_assert_num_queries(2):
+        product.save()
+    product.refresh_from_db()
+    assert product.display_name == variant.full_name
+
+
+@pytest.mark.django_db
+def test_saving_product_sets_search_document(product):
+    product.sku = "NEW-SKU-123"
+    product.save()
+    assert product in models.BaseProduct.objects.text_search("NEW-SKU-123")
+
+
+@pytest.mark.django_db
+def test_display_name_is_updated_when_supplier_sku_changes(variant):
+    product = models.Product.objects.get(pk=variant.pk)
+    product.supplier_sku = "SUP-999"
+    product.save()
+    product.refresh_from_db()
+    assert product.display_name.endswith("SUP-999")
+
+
+@pytest.mark.django_db
+def test_display_name_is_updated_when_range_changes(variant, product_range_factory):
+    product = models.Product.objects.get(pk=variant.pk)
+    product.product_range = product_range_factory.create(name="Other Range")
+    product.save()
+    product.refresh_from_db()
+    assert product.display_name.startswith("Other Range - Green - Medium")
+
+
+@pytest.mark.django_db
+def test_update_display_names_queryset_method(product_factory):
+    products = product_factory.create_batch(3)
+    models.BaseProduct.objects.update(display_name="")
+    models.BaseProduct.objects.filter(
+        pk__in=[product.pk for product in products]
+    ).update_display_names()
+    for product in products:
+        product.refresh_from_db()
+        assert product.display_name == product.full_name
@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
 from imagekit.cachefiles import ImageCacheFile
 from imagekit.models.fields.files import ProcessedImageFieldFile
 
@@ -14,6 +15,7 @@ from stcadmin import settings
 @pytest.fixture
 def product_image(product_image_factory):
     product_image = product_image_factory.create()
+    product_image.generate_renditions()
     product_image.full_clean()
     return product_image
 
@@ -229,3 +231,152 @@ class TestGetOrAddImageMethod:
         mock_add_image.assert_called_once_with(
             uploaded_file=uploaded_file, hash_string=test_image_hash
         )
+
+
+def test_get_hash_reads_file_in_chunks(uploaded_file, test_image_hash):
+    with patch.object(uploaded_file, "read", wraps=uploaded_file.read) as mock_read:
+        hash = models.ProductImage.objects.get_hash(uploaded_file)
+    assert hash == test_image_hash
+    for call in mock_read.call_args_list:
+        assert call.args == (models.ProductImage.objects.HASH_CHUNK_SIZE,)
+
+
+def test_get_hash_rewinds_file(uploaded_file):
+    models.ProductImage.objects.get_hash(uploaded_file)
+    assert uploaded_file.tell() == 0
+
+
+def test_get_hashes_method(test_image_path, extra_image_paths, test_image_hash):
+    paths = [test_image_path, *extra_image_paths]
+    uploaded_files = []
+    for path in paths:
+        with open(path, "rb") as f:
+            uploaded_files.append(
+                SimpleUploadedFile(name="file_name", content=f.read())
+            )
+    hashes = models.ProductImage.objects.get_hashes(uploaded_files)
+    assert len(hashes) == len(paths)
+    assert hashes[0] == test_image_hash
+    assert len(set(hashes)) == len(paths)
+
+
+class TestGetOrAddImagesMethod:
+    @pytest.fixture
+    def uploaded_files(self, extra_image_paths):
+        uploaded_files = []
+        for path in extra_image_paths:
+            with open(path, "rb") as f:
+                uploaded_files.append(
+                    SimpleUploadedFile(name="file_name", content=f.read())
+                )
+        return uploaded_files
+
+    @pytest.mark.django_db
+    def test_creates_images(self, uploaded_files):
+        images = models.ProductImage.objects.get_or_add_images(uploaded_files)
+        assert len(images) == len(uploaded_files)
+        assert models.ProductImage.objects.count() == len(uploaded_files)
+
+    @pytest.mark.django_db
+    def test_returns_images_in_upload_order(self, uploaded_files):
+        hashes = [models.ProductImage.objects.get_hash(f) for f in uploaded_files]
+        images = models.ProductImage.objects.get_or_add_images(uploaded_files)
+        assert [image.hash for image in images] == hashes
+
+    @pytest.mark.django_db
+    def test_uses_existing_images(
+        self, product_image_factory, uploaded_file, test_image_hash
+    ):
+        existing_image = product_image_factory.create(hash=test_image_hash)
+        images = models.ProductImage.objects.get_or_add_images([uploaded_file])
+        assert images == [existing_image]
+        assert models.ProductImage.objects.count() == 1
+
+    @pytest.mark.django_db
+    def test_skips_duplicate_uploads(self, test_image_path):
+        uploaded_files = []
+        for _ in range(3):
+            with open(test_image_path, "rb") as f:
+                uploaded_files.append(
+                    SimpleUploadedFile(name="file_name", content=f.read())
+                )
+        images = models.ProductImage.objects.get_or_add_images(uploaded_files)
+        assert len(images) == 1
+        assert models.ProductImage.objects.count() == 1
+
+    @pytest.mark.django_db
+    def test_finds_existing_images_in_one_query(
+        self, product_image_factory, uploaded_files, django_assert_num_queries
+    ):
+        for uploaded_file in uploaded_files:
+            product_image_factory.create(
+                hash=models.ProductImage.objects.get_hash(uploaded_file)
+            )
+        with django_assert_num_queries(1):
+            models.ProductImage.objects.get_or_add_images(uploaded_files)
+
+
+class TestRenditions:
+    @pytest.fixture
+    def new_image(self, product_image_factory):
+        return product_image_factory.create()
+
+    @pytest.mark.django_db
+    def test_renditions_are_not_generated_on_save(self, new_image):
+        assert new_image.renditions_ready is False
+        for rendition in (new_image.thumbnail, new_image.square_image):
+            assert rendition.storage.exists(rendition.name) is False
+
+    @pytest.mark.django_db
+    def test_generate_renditions_creates_files(self, new_image):
+        new_image.generate_renditions()
+        for rendition in (new_image.thumbnail, new_image.square_image):
+            assert rendition.storage.exists(rendition.name) is True
+
+    @pytest.mark.django_db
+    def test_generate_renditions_records_readiness(self, new_image):
+        new_image.generate_renditions()
+        assert new_image.renditions_ready is True
+        new_image.refresh_from_db()
+        assert isinstance(new_image.renditions_generated_at, dt.datetime)
+
+    @pytest.mark.django_db
+    @patch("inventory.models.product_image.ProductImage.generate_renditions")
+    def test_ensure_renditions_generates_missing_renditions(
+        self, mock_generate_renditions, new_image
+    ):
+        new_image.ensure_renditions()
+        mock_generate_renditions.assert_called_once_with()
+
+    @pytest.mark.django_db
+    @patch("inventory.models.product_image.ProductImage.generate_renditions")
+    def test_ensure_renditions_skips_ready_renditions(
+        self, mock_generate_renditions, product_image_factory
+    ):
+        image = product_image_factory.create(renditions_generated_at=timezone.now())
+        image.ensure_renditions()
+        mock_generate_renditions.assert_not_called()
+
+    @pytest.mark.django_db
+    def test_rendition_urls_use_original_until_generated(self, new_image):
+        assert new_image.square_image_url == new_image.image_file.url
+        assert new_image.thumbnail_url == new_image.image_file.url
+
+    @pytest.mark.django_db
+    def test_rendition_urls_use_renditions_once_generated(self, new_image):
+        new_image.generate_renditions()
+        assert new_image.square_image_url == new_image.square_image.url
+        assert new_image.thumbnail_url == new_image.thumbnail.url
+
+    @pytest.mark.django_db
+    def test_missing_renditions_method(self, new_image, product_image):
+        assert list(models.ProductImage.objects.missing_renditions()) == [new_image]
+
+    @pytest.mark.django_db
+    def test_add_image_queues_renditions(
+        self, uploaded_file, django_capture_on_commit_callbacks
+    ):
+        with patch("inventory.tasks.generate_image_renditions") as mock_task:
+            with django_capture_on_commit_callbacks(execute=True):
+                image = models.ProductImage.objects.add_image(uploaded_file)
+        mock_task.delay.assert_called_once_with(image.pk)
@@ -2,6 +2,7 @@ import datetime as dt
 
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError
 
 from inventory import models
 
@@ -179,3 +180,157 @@ class TestAddImagesMethod:
             assert models.ProductImageLink.objects.filter(
                 product=product
             ).count() == len(extra_uploaded_images)
+
+    @pytest.mark.django_db
+    def test_raises_for_existing_links(
+        self,
+        product_factory,
+        product_image_link_factory,
+        create_upload_file,
+        test_image_hash,
+    ):
+        product = product_factory.create()
+        other_product = product_factory.create()
+        link = product_image_link_factory.create(
+            product=product, image__hash=test_image_hash, position=0
+        )
+        with pytest.raises(IntegrityError):
+            models.ProductImageLink.objects.add_images(
+                [other_product, product], [create_upload_file()]
+            )
+        assert list(models.ProductImageLink.objects.filter(product=product)) == [link]
+        assert not models.ProductImageLink.objects.filter(
+            product=other_product
+        ).exists()
+
+    @pytest.mark.django_db
+    def test_query_count_does_not_grow_with_products(
+        self,
+        product_factory,
+        product_image_factory,
+        extra_uploaded_images,
+        django_assert_max_num_queries,
+    ):
+        for uploaded_image in extra_uploaded_images:
+            product_image_factory.create(
+                hash=models.ProductImage.objects.get_hash(uploaded_image)
+            )
+        products = product_factory.create_batch(20)
+        with django_assert_max_num_queries(5):
+            models.ProductImageLink.objects.add_images(products, extra_uploaded_images)
+        for product in products:
+            positions = models.ProductImageLink.objects.filter(
+                product=product
+            ).values_list("position", flat=True)
+            assert sorted(positions) == list(range(len(extra_uploaded_images)))
+
+
+@pytest.mark.django_db
+def test_normalize_positions_method(product_image_link_factory, product_factory):
+    products = product_factory.create_batch(3)
+    links = {
+        product: [
+            product_image_link_factory.create(product=product, position=position)
+            for position in (3, 10, 99)
+        ]
+        for product in products
+    }
+    models.ProductImageLink.objects.normalize_positions(
+        [product.pk for product in products]
+    )
+    for product_links in links.values():
+        for i, link in enumerate(product_links):
+            link.refresh_from_db()
+            assert link.position == i
+
+
+@pytest.mark.django_db
+def test_normalize_positions_uses_one_query(
+    product_image_link_factory, product_factory, django_assert_num_queries
+):
+    products = product_factory.create_batch(3)
+    for product in products:
+        product_image_link_factory.create_batch(3, product=product)
+    with django_assert_num_queries(1):
+        models.ProductImageLink.objects.normalize_positions(
+            [product.pk for product in products]
+        )
+
+
+@pytest.mark.django_db
+def test_normalize_positions_does_not_change_other_products(
+    product_image_link_factory, product_factory
+):
+    link = product_image_link_factory.create(position=20)
+    models.ProductImageLink.objects.normalize_positions([product_factory.create().pk])
+    link.refresh_from_db()
+    assert link.position == 20
+
+
+@pytest.mark.django_db
+def test_normalize_positions_keeps_creation_order_for_equal_positions(
+    product_image_link_factory, product_factory
+):
+    product = product_factory.create()
+    links = product_image_link_factory.create_batch(3, product=product, position=7)
+    models.ProductImageLink.objects.normalize_positions([product.pk])
+    for i, link in enumerate(links):
+        link.refresh_from_db()
+        assert link.position == i
+
+
+@pytest.mark.django_db
+def test_set_image_order_uses_one_update(
+    product_factory, product_image_link_factory, django_assert_num_queries
+):
+    product = product_factory.create()
+    links = product_image_link_factory.create_batch(20, product=product)
+    image_order = [link.image.id for link in reversed(links)]
+    # Savepoint, select links, bulk update, release savepoint.
+    with django_assert_num_queries(4):
+        models.ProductImageLink.objects.set_image_order(product.id, image_order)
+
+
+@pytest.mark.django_db
+def test_set_image_order_fails_when_passed_duplicate_image_ids(
+    product_image_link_factory, product_factory
+):
+    product = product_factory.create()
+    links = product_image_link_factory.create_batch(2, product=product)
+    image_order = [links[0].image.id, links[1].image.id, links[0].image.id]
+    with pytest.raises(Exception):
+        models.ProductImageLink.objects.set_image_order(product.id, image_order)
+
+
+@pytest.mark.django_db
+def test_set_positions_method(product_image_link_factory):
+    links = product_image_link_factory.create_batch(3)
+    models.ProductImageLink.objects.set_positions(
+        {links[0].id: 7, links[1].id: 3, links[2].id: 0}
+    )
+    for link, position in zip(links, (7, 3, 0)):
+        link.refresh_from_db()
+        assert link.position == position
+
+
+@pytest.mark.django_db
+def test_remove_image_method(product_factory, product_image_link_factory):
+    product = product_factory.create()
+    links = [
+        product_image_link_factory.create(product=product, position=i) for i in range(3)
+    ]
+    models.ProductImageLink.objects.remove_image(product.id, links[1].image.id)
+    assert not models.ProductImageLink.objects.filter(id=links[1].id).exists()
+    links[2].refresh_from_db()
+    assert links[2].position == 1
+
+
+@pytest.mark.django_db
+def test_remove_image_fails_for_unlinked_image(
+    product_factory, product_image_link_factory
+):
+    link = product_image_link_factory.create()
+    with pytest.raises(models.ProductImageLink.DoesNotExist):
+        models.ProductImageLink.objects.remove_image(
+            product_factory.create().id, link.image.id
+        )
@@ -0,0 +1,96 @@
+import pytest
+
+from inventory import models
+from inventory.models import ProductLoader
+
+
+@pytest.fixture
+def products(
+    product_factory, multipack_product_factory, combination_product_link_factory
+):
+    return [
+        product_factory.create(),
+        multipack_product_factory.create(),
+        combination_product_link_factory.create().combination_product,
+    ]
+
+
+@pytest.fixture
+def variant(
+    product_factory, variation_option_value_factory, listing_attribute_value_factory
+):
+    product = product_factory.create()
+    variation_option_value_factory.create(
+        product=product, variation_option__name="Colour", value="Green"
+    )
+    variation_option_value_factory.create(
+        product=product, variation_option__name="Size", value="Medium"
+    )
+    listing_attribute_value_factory.create(
+        product=product, listing_attribute__name="Shape", value="Round"
+    )
+    return product
+
+
+@pytest.mark.django_db
+def test_load_returns_subclass_instances(products):
+    loaded = ProductLoader.load([product.pk for product in products])
+    assert [type(product) for product in loaded] == [
+        models.Product,
+        models.MultipackProduct,
+        models.CombinationProduct,
+    ]
+
+
+@pytest.mark.django_db
+def test_load_keeps_requested_order(products):
+    product_ids = [product.pk for product in reversed(products)]
+    loaded = ProductLoader.load(product_ids)
+    assert [product.pk for product in loaded] == product_ids
+
+
+@pytest.mark.django_db
+def test_load_skips_missing_ids(products):
+    loaded = ProductLoader.load([products[0].pk, 999999])
+    assert loaded == [products[0]]
+
+
+@pytest.mark.django_db
+def test_load_skus(products):
+    loaded = ProductLoader.load_skus([product.sku for product in products])
+    assert loaded == {product.sku: product for product in products}
+
+
+@pytest.mark.django_db
+def test_load_query_count(products, django_assert_num_queries):
+    product_ids = [product.pk for product in products]
+    ProductLoader.load(product_ids)  # Populate the content type cache.
+    # Subclasses, one per subclass, product bay links, variations, attributes.
+    with django_assert_num_queries(7):
+        loaded = ProductLoader.load(product_ids)
+    with django_assert_num_queries(0):
+        for product in loaded:
+            product.product_range.name
+            product.supplier.name
+            product.package_type.name
+            product.vat_rate.percentage
+            product.brand.name
+            product.weight_grams
+            product.attributes()
+
+
+@pytest.mark.django_db
+def test_load_attaches_variation(variant, django_assert_num_queries):
+    loaded = ProductLoader.load([variant.pk])[0]
+    with django_assert_num_queries(0):
+        assert loaded.variation() == variant.variation()
+        assert sorted(loaded.variation_values()) == ["Green", "Medium"]
+        assert set(loaded.variable_options()) == {"Colour", "Size"}
+
+
+@pytest.mark.django_db
+def test_load_attaches_listing_attributes(variant, django_assert_num_queries):
+    loaded = ProductLoader.load([variant.pk])[0]
+    with django_assert_num_queries(0):
+        assert loaded.listing_attributes() == {"Shape": "Round"}
+        assert loaded.attributes() == variant.attributes()
@@ -0,0 +1,121 @@
+from unittest import mock
+
+import pytest
+
+from inventory.models import ProductCodeLookup
+
+
+@pytest.fixture
+def product(product_factory):
+    return product_factory.create(
+        sku="AAA-AAA-AAA", supplier_sku="SUP-001", barcode="5012345678900"
+    )
+
+
+@pytest.mark.django_db
+def test_resolve_sku(product):
+    assert ProductCodeLookup.resolve(["AAA-AAA-AAA"]) == {"AAA-AAA-AAA": [product.id]}
+
+
+@pytest.mark.django_db
+def test_resolve_supplier_sku(product):
+    assert ProductCodeLookup.resolve(["SUP-001"]) == {"SUP-001": [product.id]}
+
+
+@pytest.mark.django_db
+def test_resolve_barcode(product):
+    assert ProductCodeLookup.resolve(["5012345678900"]) == {
+        "5012345678900": [product.id]
+    }
+
+
+@pytest.mark.django_db
+def test_resolve_missing_code(product):
+    assert ProductCodeLookup.resolve(["MISSING"]) == {"MISSING": []}
+
+
+@pytest.mark.django_db
+def test_resolve_strips_codes(product):
+    assert ProductCodeLookup.resolve([" SUP-001 ", ""]) == {"SUP-001": [product.id]}
+
+
+@pytest.mark.django_db
+def test_resolve_multiple_codes(product_factory, product):
+    other = product_factory.create(supplier_sku="SUP-001")
+    resolved = ProductCodeLookup.resolve(["SUP-001", "AAA-AAA-AAA"])
+    assert sorted(resolved["SUP-001"]) == sorted([product.id, other.id])
+    assert resolved["AAA-AAA-AAA"] == [product.id]
+
+
+@pytest.mark.django_db
+def test_resolve_uses_cache(product, django_assert_num_queries):
+    ProductCodeLookup.resolve(["AAA-AAA-AAA", "MISSING"])
+    with django_assert_num_queries(0):
+        assert ProductCodeLookup.resolve(["AAA-AAA-AAA", "MISSING"]) == {
+            "AAA-AAA-AAA": [product.id],
+            "MISSING": [],
+        }
+
+
+@pytest.mark.django_db
+def test_product_ids(product_factory, product):
+    other = product_factory.create(sku="BBB-BBB-BBB")
+    assert ProductCodeLookup.product_ids(["AAA-AAA-AAA", "BBB-BBB-BBB"]) == {
+        product.id,
+        other.id,
+    }
+
+
+@pytest.mark.django_db
+def test_saving_product_invalidates_changed_code(product):
+    ProductCodeLookup.resolve(["AAA-AAA-AAA"])
+    product.sku = "CCC-CCC-CCC"
+    product.save()
+    assert ProductCodeLookup.resolve(["AAA-AAA-AAA", "CCC-CCC-CCC"]) == {
+        "AAA-AAA-AAA": [],
+        "CCC-CCC-CCC": [product.id],
+    }
+
+
+@pytest.mark.django_db
+def test_creating_product_invalidates_missing_code(product_factory):
+    ProductCodeLookup.resolve(["NEW-CODE"])
+    product = product_factory.create(barcode="NEW-CODE")
+    assert ProductCodeLookup.resolve(["NEW-CODE"]) == {"NEW-CODE": [product.id]}
+
+
+@pytest.mark.django_db
+def test_warm(product, django_assert_num_queries):
+    ProductCodeLookup.cache().clear()
+    ProductCodeLookup.warm()
+    with django_assert_num_queries(0):
+        assert ProductCodeLookup.resolve(["SUP-001"]) == {"SUP-001": [product.id]}
+
+
+@pytest.mark.django_db
+def test_resolve_queries_missing_codes_only(product):
+    ProductCodeLookup.resolve(["AAA-AAA-AAA"])
+    with mock.patch.object(
+        ProductCodeLookup, "_query", wraps=ProductCodeLookup._query
+    ) as mock_query:
+        ProductCodeLookup.resolve(["AAA-AAA-AAA", "SUP-001"])
+    mock_query.assert_called_once_with({"SUP-001"})
+
+
+@pytest.mark.django_db
+def test_missing_codes_are_cached_briefly(product):
+    with mock.patch.object(ProductCodeLookup, "cache") as mock_cache:
+        mock_cache.return_value.get_many.return_value = {}
+        ProductCodeLookup.resolve(["AAA-AAA-AAA", "MISSING"])
+    mock_cache.return_value.set_many.assert_has_calls(
+        [
+            mock.call(
+                {ProductCodeLookup.key("AAA-AAA-AAA"): [product.id]},
+                ProductCodeLookup.TIMEOUT,
+            ),
+            mock.call(
+                {ProductCodeLookup.key("MISSING"): []},
+                ProductCodeLookup.MISS_TIMEOUT,
+            ),
+        ]
+    )
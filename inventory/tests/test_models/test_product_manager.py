@@ -176,3 +176,57 @@ def test_archived_filter(arg, archived, included, product_factory):
     product = product_factory.create(is_archived=archived)
     qs = models.BaseProduct.objects.text_search(product.sku, archived=arg)
     assert (product in qs) is included
+
+
+@pytest.mark.django_db
+def test_text_search_matches_on_sku_prefix(product_factory):
+    product = product_factory.create(sku="ABC-123-XYZ")
+    assert product in models.BaseProduct.objects.text_search("ABC-12")
+
+
+@pytest.mark.django_db
+def test_text_search_matches_on_barcode_prefix(product_factory):
+    product = product_factory.create(barcode="5012345678900")
+    assert product in models.BaseProduct.objects.text_search("501234")
+
+
+@pytest.mark.django_db
+def test_text_search_matches_similar_sku(product_factory):
+    product = product_factory.create(sku="ABC-123-XYZ")
+    assert product in models.BaseProduct.objects.text_search("ABC-123-XYY")
+
+
+@pytest.mark.django_db
+def test_text_search_matches_similar_barcode_only_when_set(product_factory):
+    product = product_factory.create(barcode="5012345678900")
+    assert product not in models.BaseProduct.objects.text_search("5012345678901")
+    assert product in models.BaseProduct.objects.text_search(
+        "5012345678901", similar_barcodes=True
+    )
+
+
+@pytest.mark.django_db
+def test_text_search_matches_renamed_range(product):
+    product.product_range.name = "Renamed Range"
+    product.product_range.save()
+    assert product in models.BaseProduct.objects.text_search("Renamed Range")
+
+
+@pytest.mark.django_db
+def test_text_search_orders_by_rank(product_factory):
+    other_product = product_factory.create(supplier_sku="ABC-123-XYZ")
+    product = product_factory.create(sku="ABC-123-XYZ")
+    qs = models.BaseProduct.objects.text_search("ABC-123-XYZ")
+    assert list(qs)[:2] == [product, other_product]
+
+
+@pytest.mark.django_db
+def test_text_search_returns_nothing_without_words(product):
+    assert models.BaseProduct.objects.text_search("--").exists() is False
+
+
+@pytest.mark.django_db
+def test_update_search_document(product):
+    models.BaseProduct.objects.filter(pk=product.pk).update(search_document=None)
+    models.BaseProduct.objects.filter(pk=product.pk).update_search_document()
+    assert product in models.BaseProduct.objects.text_search(product.sku)
@@ -217,3 +217,30 @@ def test_creating_manager_queryset(status, in_qs, product_range_factory):
     product_range = product_range_factory.create(status=status)
     queryset = models.ProductRange.creating.all()
     assert bool(product_range in queryset) is in_qs
+
+
+@pytest.mark.django_db
+def test_containing_orders_ranges_by_name(product_factory, product_range_factory):
+    second = product_factory.create(product_range__name="Zebra").product_range
+    first = product_factory.create(product_range__name="Aardvark").product_range
+    product_range_factory.create()
+    ranges = models.ProductRange.objects.containing(models.BaseProduct.objects.all())
+    assert list(ranges) == [first, second]
+
+
+@pytest.mark.django_db
+def test_containing_orders_ranges_by_best_product_rank(product_factory):
+    partial = product_factory.create(
+        product_range__name="Aardvark", supplier_sku="ABC-123-XYZ"
+    )
+    exact = product_factory.create(product_range__name="Zebra", sku="ABC-123-XYZ")
+    products = models.BaseProduct.objects.text_search("ABC-123-XYZ")
+    ranges = models.ProductRange.objects.containing(products, ranked=True)
+    assert list(ranges)[:2] == [exact.product_range, partial.product_range]
+
+
+@pytest.mark.django_db
+def test_containing_with_no_products():
+    products = models.BaseProduct.objects.text_search("--")
+    ranges = models.ProductRange.objects.containing(products, ranked=True)
+    assert ranges.exists() is False
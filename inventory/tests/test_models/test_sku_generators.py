@@ -1,6 +1,8 @@
 from unittest import mock
 
 import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 
 from inventory import models
 
@@ -28,44 +30,92 @@ def test_generate_range_sku():
     sku_test(sku[4:])
 
 
-def test_unique_sku_returns_sku_when_not_in_existing_skus():
-    sku = "AAA-BBB-CCC"
-    returned_value = models.product.unique_sku([], mock.Mock(return_value=sku))
-    assert returned_value == sku
+@pytest.mark.django_db
+def test_unique_skus_returns_skus_not_in_queryset(product_factory):
+    product = product_factory.create(sku="AAA-BBB-CCC")
+    skus = ["AAA-BBB-CCC", "BBB-CCC-DDD"]
+    returned_value = models.product.unique_skus(
+        models.BaseProduct.objects.all(), mock.Mock(side_effect=skus), count=1
+    )
+    assert product.sku not in returned_value
+    assert returned_value == ["BBB-CCC-DDD"]
 
 
-def test_unique_sku_retries_sku_generation_when_sku_in_existing_skus():
+@pytest.mark.django_db
+def test_unique_skus_returns_count_skus():
     skus = ["AAA-BBB-CCC", "BBB-CCC-DDD", "CCC-DDD-EEE"]
-    mock_sku_generator = mock.Mock(side_effect=skus)
-    models.product.unique_sku(skus[:-1], mock_sku_generator)
-    assert mock_sku_generator.call_count == len(skus)
+    returned_value = models.product.unique_skus(
+        models.BaseProduct.objects.all(), mock.Mock(side_effect=skus), count=3
+    )
+    assert sorted(returned_value) == skus
+
+
+@pytest.mark.django_db
+def test_unique_skus_does_not_return_duplicates():
+    skus = ["AAA-BBB-CCC", "AAA-BBB-CCC", "BBB-CCC-DDD"]
+    returned_value = models.product.unique_skus(
+        models.BaseProduct.objects.all(), mock.Mock(side_effect=skus), count=2
+    )
+    assert sorted(returned_value) == ["AAA-BBB-CCC", "BBB-CCC-DDD"]
+
+
+@pytest.mark.django_db
+def test_unique_skus_queries_once_per_batch(django_assert_num_queries):
+    with django_assert_num_queries(1):
+        returned_value = models.product.unique_skus(
+            models.BaseProduct.objects.all(), models.product.generate_sku, count=60
+        )
+    assert len(set(returned_value)) == 60
 
 
-def test_unique_sku_errors_after_excessive_calls():
-    sku = "AAA-BBB-CCC"
-    mock_sku_generator = mock.Mock(return_value=sku)
+@pytest.mark.django_db
+def test_unique_skus_errors_after_excessive_calls(product_factory):
+    product = product_factory.create(sku="AAA-BBB-CCC")
+    mock_sku_generator = mock.Mock(return_value=product.sku)
     with pytest.raises(Exception):
-        models.product.unique_sku([sku], mock_sku_generator)
+        models.product.unique_skus(
+            models.BaseProduct.objects.all(), mock_sku_generator, count=1
+        )
 
 
 @pytest.mark.django_db
-@mock.patch("inventory.models.product.unique_sku")
-def test_new_product_sku(mock_unique_sku, product_factory):
-    product = product_factory.create()
-    returned_value = models.product.new_product_sku()
-    mock_unique_sku.assert_called_once_with(
-        existing_skus={product.sku}, sku_function=models.product.generate_sku
-    )
-    assert returned_value == mock_unique_sku.return_value
+@mock.patch("inventory.models.product.unique_skus")
+def test_new_product_skus(mock_unique_skus):
+    mock_unique_skus.return_value = ["AAA-BBB-CCC", "BBB-CCC-DDD"]
+    returned_value = models.product.new_product_skus(2)
+    kwargs = mock_unique_skus.call_args.kwargs
+    assert kwargs["sku_function"] == models.product.generate_sku
+    assert kwargs["count"] == 2
+    assert kwargs["queryset"].model == models.BaseProduct
+    assert returned_value == mock_unique_skus.return_value
+
+
+@pytest.mark.django_db
+def test_new_product_sku():
+    sku_test(models.product.new_product_sku())
 
 
 @pytest.mark.django_db
-@mock.patch("inventory.models.product.unique_sku")
-def test_new_range_sku(mock_unique_sku, product_range_factory):
-    product_range = product_range_factory.create()
+@mock.patch("inventory.models.product.unique_skus")
+def test_new_range_sku(mock_unique_skus):
+    mock_unique_skus.return_value = ["RNG_AAA-BBB-CCC"]
     returned_value = models.product.new_range_sku()
-    mock_unique_sku.assert_called_once_with(
-        existing_skus={product_range.sku},
-        sku_function=models.product.generate_range_sku,
-    )
-    assert returned_value == mock_unique_sku.return_value
+    kwargs = mock_unique_skus.call_args.kwargs
+    assert kwargs["sku_function"] == models.product.generate_range_sku
+    assert kwargs["count"] == 1
+    assert kwargs["queryset"].model == models.ProductRange
+    assert returned_value == "RNG_AAA-BBB-CCC"
+
+
+@pytest.mark.django_db
+def test_lock_product_skus_takes_advisory_lock():
+    with transaction.atomic():
+        with CaptureQueriesContext(connection) as queries:
+            models.product.lock_product_skus()
+    assert "pg_advisory_xact_lock" in queries[0]["sql"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_lock_product_skus_requires_transaction():
+    with pytest.raises(transaction.TransactionManagementError):
+        models.product.lock_product_skus()
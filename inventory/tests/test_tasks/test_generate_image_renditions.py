@@ -0,0 +1,22 @@
+from unittest import mock
+
+import pytest
+
+from inventory.tasks import generate_image_renditions
+
+
+@pytest.fixture
+def mock_product_image():
+    with mock.patch("inventory.tasks.models.ProductImage") as m:
+        yield m
+
+
+def test_generate_image_renditions_gets_image(mock_product_image):
+    generate_image_renditions(55)
+    mock_product_image.objects.get.assert_called_once_with(pk=55)
+
+
+def test_generate_image_renditions_generates_renditions(mock_product_image):
+    generate_image_renditions(55)
+    image = mock_product_image.objects.get.return_value
+    image.generate_renditions.assert_called_once_with()
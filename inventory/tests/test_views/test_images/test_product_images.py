@@ -0,0 +1,54 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+
+from inventory import models
+
+
+@pytest.fixture
+def product(product_factory):
+    return product_factory.create()
+
+
+@pytest.fixture
+def uploaded_file(test_image_path):
+    with open(test_image_path, "rb") as f:
+        return SimpleUploadedFile(name="file_name", content=f.read())
+
+
+@pytest.fixture
+def image(product, uploaded_file):
+    models.ProductImageLink.objects.add_images([product], [uploaded_file])
+    return product.images.get()
+
+
+@pytest.fixture
+def url():
+    return reverse("inventory:product_images")
+
+
+@pytest.fixture
+def post_response(group_logged_in_client, url, product, image):
+    return group_logged_in_client.post(url, {"product_id": product.pk})
+
+
+@pytest.mark.django_db
+def test_status_code(post_response):
+    assert post_response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_new_image_shows_original_until_renditions_exist(post_response, image):
+    content = post_response.content.decode("utf8")
+    assert image.renditions_ready is False
+    assert f'<img src="{image.image_file.url}"' in content
+    assert image.thumbnail.url not in content
+
+
+@pytest.mark.django_db
+def test_shows_thumbnail_when_renditions_exist(
+    group_logged_in_client, url, product, image
+):
+    image.generate_renditions()
+    response = group_logged_in_client.post(url, {"product_id": product.pk})
+    assert f'<img src="{image.thumbnail.url}"' in response.content.decode("utf8")
@@ -78,8 +78,8 @@ def test_formset_in_context(products, get_response):
 @pytest.mark.django_db
 def test_products_exist_in_context(products, mock_stock_manager, get_response):
     products_exist = get_response.context["products_exist"]
-    assert products_exist == mock_stock_manager.products_exist.return_value
-    mock_stock_manager.products_exist.assert_called_once_with(
+    assert products_exist == mock_stock_manager.cached_products_exist.return_value
+    mock_stock_manager.cached_products_exist.assert_called_once_with(
         *[product.sku for product in products]
     )
 
@@ -88,7 +88,7 @@ def test_products_exist_in_context(products, mock_stock_manager, get_response):
 def test_ignores_errors_checking_products_exist(
     products, mock_stock_manager, group_logged_in_client, url
 ):
-    mock_stock_manager.products_exist.side_effect = Exception
+    mock_stock_manager.cached_products_exist.side_effect = Exception
     response = group_logged_in_client.get(url)
     assert response.context["products_exist"] is None
 
@@ -101,7 +101,7 @@ def test_does_not_check_proudcts_exist_when_product_range_is_eol(
     product_range.save()
     response = group_logged_in_client.get(url)
     assert response.context["products_exist"] is None
-    mock_stock_manager.products_exist.assert_not_called()
+    mock_stock_manager.cached_products_exist.assert_not_called()
 
 
 @pytest.mark.django_db
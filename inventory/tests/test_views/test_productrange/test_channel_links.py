@@ -43,22 +43,6 @@ def test_product_range_in_context(product_range, get_response):
 
 
 @pytest.mark.django_db
-def test_products_in_context(products, get_response):
-    assert set(get_response.context["products"]) == set(products)
-
-
-@pytest.mark.django_db
-def test_gets_product_links(mock_stock_manager, products, get_response):
-    skus = sorted([product.sku for product in products])
-    mock_stock_manager.channel_links.assert_called_once_with(*skus)
-
-
-@pytest.mark.django_db
-def test_adds_channel_links_to_products(mock_stock_manager, products, get_response):
-    mock_channel_links = mock_stock_manager.channel_links.return_value.get.return_value
-    mock_stock_manager.channel_links.return_value.get.assert_has_calls(
-        (mock.call(product.sku, []) for product in products)
-    )
-    for product in get_response.context["products"]:
-        assert hasattr(product, "channel_links")
-        assert product.channel_links == mock_channel_links
+def test_does_not_call_linnworks(mock_stock_manager, products, get_response):
+    mock_stock_manager.channel_links.assert_not_called()
+    mock_stock_manager.cached_channel_links.assert_not_called()
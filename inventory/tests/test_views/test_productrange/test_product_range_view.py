@@ -48,29 +48,22 @@ def test_products_in_context(products, get_response):
 
 
 @pytest.mark.django_db
-def test_products_exist_in_context(products, mock_stock_manager, get_response):
-    products_exist = get_response.context["products_exist"]
-    assert products_exist == mock_stock_manager.products_exist.return_value
-    mock_stock_manager.products_exist.assert_called_once_with(
-        *[product.sku for product in products]
-    )
+def test_check_products_exist_in_context(products, get_response):
+    assert get_response.context["check_products_exist"] is True
 
 
 @pytest.mark.django_db
-def test_ignores_errors_checking_products_exist(
-    products, mock_stock_manager, group_logged_in_client, url
+def test_does_not_check_products_exist_when_product_range_is_archived(
+    product_range, products, group_logged_in_client, url
 ):
-    mock_stock_manager.products_exist.side_effect = Exception
+    for product in products:
+        product.is_archived = True
+        product.save()
     response = group_logged_in_client.get(url)
-    assert response.context["products_exist"] is None
+    assert response.context["check_products_exist"] is False
 
 
 @pytest.mark.django_db
-def test_does_not_check_proudcts_exist_when_product_range_is_eol(
-    mock_stock_manager, product_range, group_logged_in_client, url
-):
-    product_range.is_end_of_line = True
-    product_range.save()
-    response = group_logged_in_client.get(url)
-    assert response.context["products_exist"] is None
+def test_does_not_call_linnworks(mock_stock_manager, products, get_response):
     mock_stock_manager.products_exist.assert_not_called()
+    mock_stock_manager.cached_products_exist.assert_not_called()
@@ -0,0 +1,77 @@
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+
+
+@pytest.fixture
+def product_range(product_range_factory):
+    return product_range_factory.create()
+
+
+@pytest.fixture
+def products(product_range, product_factory):
+    return product_factory.create_batch(3, product_range=product_range)
+
+
+@pytest.fixture
+def url(product_range):
+    return reverse("inventory:products_exist", kwargs={"range_pk": product_range.pk})
+
+
+@pytest.fixture
+def get_response(group_logged_in_client, url):
+    return group_logged_in_client.get(url)
+
+
+@pytest.fixture(autouse=True)
+def mock_stock_manager():
+    with mock.patch("inventory.views.productrange.StockManager") as mock_stock_manager:
+        mock_stock_manager.cached_products_exist.return_value = True
+        yield mock_stock_manager
+
+
+@pytest.mark.django_db
+def test_logged_out_get(client, url):
+    assert client.get(url).status_code == 302
+
+
+@pytest.mark.django_db
+def test_logged_in_get(logged_in_client, url):
+    assert logged_in_client.get(url).status_code == 403
+
+
+@pytest.mark.django_db
+def test_returns_products_exist(products, get_response):
+    assert get_response.json() == {"products_exist": True}
+
+
+@pytest.mark.django_db
+def test_checks_product_skus(mock_stock_manager, products, get_response):
+    mock_stock_manager.cached_products_exist.assert_called_once()
+    args = mock_stock_manager.cached_products_exist.call_args.args
+    assert sorted(args) == sorted(product.sku for product in products)
+
+
+@pytest.mark.django_db
+def test_returns_none_on_error(
+    mock_stock_manager, products, group_logged_in_client, url
+):
+    mock_stock_manager.cached_products_exist.side_effect = Exception
+    response = group_logged_in_client.get(url)
+    assert response.json() == {"products_exist": None}
+
+
+@pytest.mark.django_db
+def test_does_not_check_archived_range(
+    mock_stock_manager, product_range, group_logged_in_client, url
+):
+    response = group_logged_in_client.get(url)
+    assert response.json() == {"products_exist": None}
+    mock_stock_manager.cached_products_exist.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_missing_range(group_logged_in_client):
+    url = reverse("inventory:products_exist", kwargs={"range_pk": 999999})
+    assert group_logged_in_client.get(url).status_code == 404
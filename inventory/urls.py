@@ -13,6 +13,11 @@ inventory_urlpatterns = [
         views.ProductRangeView.as_view(),
         name="product_range",
     ),
+    path(
+        "product_range/<int:range_pk>/products_exist/",
+        views.productrange.ProductsExist.as_view(),
+        name="products_exist",
+    ),
     path(
         "locations/<int:range_pk>/", views.LocationFormView.as_view(), name="locations"
     ),
@@ -85,6 +90,11 @@ inventory_urlpatterns = [
         views.productrange.ChannelLinks.as_view(),
         name="channel_links",
     ),
+    path(
+        "channel_links/<int:range_pk>/list/",
+        views.productrange.ChannelLinksList.as_view(),
+        name="channel_links_list",
+    ),
     path(
         "set_product_image_order/",
         views.images.SetProductImageOrder.as_view(),
@@ -166,9 +166,9 @@ class DeleteProductImage(DeleteImage):
 
     def delete_image(self, product_id, image_id):
         """Remove and image from a product."""
-        models.ProductImageLink.objects.get(
-            product__id=product_id, image__id=image_id
-        ).delete()
+        models.ProductImageLink.objects.remove_image(
+            product_pk=product_id, image_pk=image_id
+        )
 
 
 class DeleteProductRangeImage(DeleteImage):
@@ -176,9 +176,9 @@ class DeleteProductRangeImage(DeleteImage):
 
     def delete_image(self, product_id, image_id):
         """Remove an image from a product range."""
-        models.ProductRangeImageLink.objects.get(
-            product_range__id=product_id, image__id=image_id
-        ).delete()
+        models.ProductRangeImageLink.objects.remove_image(
+            product_pk=product_id, image_pk=image_id
+        )
 
 
 @method_decorator(csrf_exempt, name="dispatch")
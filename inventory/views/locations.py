@@ -50,7 +50,9 @@ class LocationFormView(InventoryUserMixin, FormView):
                 "sku", flat=True
             )
             try:
-                context["products_exist"] = StockManager.products_exist(*product_skus)
+                context["products_exist"] = StockManager.cached_products_exist(
+                    *product_skus
+                )
             except Exception:
                 context["products_exist"] = None
         else:
@@ -1,6 +1,8 @@
 """View for Product Range page."""
 
+from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
+from django.views import View
 from django.views.generic.base import TemplateView
 
 from inventory import models
@@ -27,37 +29,65 @@ class ProductRangeView(InventoryUserMixin, TemplateView):
         context_data["product_range"] = self.product_range
         products = self.product_range.products.variations().select_related("supplier")
         context_data["products"] = products
-        if not self.product_range.is_archived():
-            product_skus = products.filter(is_archived=False).values_list(
-                "sku", flat=True
-            )
-            try:
-                context_data["products_exist"] = StockManager.products_exist(
-                    *product_skus
-                )
-            except Exception:
-                context_data["products_exist"] = None
-        else:
-            context_data["products_exist"] = None
+        context_data["check_products_exist"] = not self.product_range.is_archived()
         return context_data
 
 
+class ProductsExist(InventoryUserMixin, View):
+    """Return whether a range's products exist in Linnworks as JSON."""
+
+    def get(self, *args, **kwargs):
+        """Return a JSON response containing products_exist."""
+        product_range = get_object_or_404(
+            models.ProductRange, pk=self.kwargs.get("range_pk")
+        )
+        return JsonResponse({"products_exist": self.products_exist(product_range)})
+
+    def products_exist(self, product_range):
+        """Return True if all products exist in Linnworks, None on error."""
+        if product_range.is_archived():
+            return None
+        product_skus = (
+            product_range.products.variations()
+            .filter(is_archived=False)
+            .values_list("sku", flat=True)
+        )
+        try:
+            return StockManager.cached_products_exist(*product_skus)
+        except Exception:
+            return None
+
+
 class ChannelLinks(InventoryUserMixin, TemplateView):
     """View for showing listing linked to products."""
 
     template_name = "inventory/product_range/channel_links.html"
 
+    def get_context_data(self, *args, **kwargs):
+        """Return context for the template."""
+        context = super().get_context_data(*args, **kwargs)
+        context["product_range"] = get_object_or_404(
+            models.ProductRange, pk=self.kwargs["range_pk"]
+        )
+        return context
+
+
+class ChannelLinksList(InventoryUserMixin, TemplateView):
+    """Return the channel links for a range's products as HTML for AJAX requests."""
+
+    template_name = "inventory/product_range/channel_links_list.html"
+
     def get_context_data(self, *args, **kwargs):
         """Return context for the template."""
         context = super().get_context_data(*args, **kwargs)
         product_range = get_object_or_404(
             models.ProductRange, pk=self.kwargs["range_pk"]
         )
-        products = product_range.products.variations()
+        products = list(product_range.products.variations())
         skus = sorted([product.sku for product in products])
         context["product_range"] = product_range
         try:
-            channel_links = StockManager.channel_links(*skus)
+            channel_links = StockManager.cached_channel_links(*skus)
         except Exception:
             context["products"] = None
         else:
@@ -3,8 +3,9 @@
 from django.views.generic.base import TemplateView
 from django.views.generic.list import ListView
 
+from home.pagination import KeysetPaginationMixin
 from home.views import UserInGroupMixin
-from inventory import forms
+from inventory import forms, models
 
 
 class InventoryUserMixin(UserInGroupMixin):
@@ -19,13 +20,12 @@ class SKUGeneratorView(InventoryUserMixin, TemplateView):
     template_name = "inventory/sku_generator.html"
 
 
-class ProductSearchView(InventoryUserMixin, ListView):
+class ProductSearchView(InventoryUserMixin, KeysetPaginationMixin, ListView):
     """View for product search page."""
 
     template_name = "inventory/product_search/search_page.html"
     form_class = forms.ProductSearchForm
     paginate_by = 30
-    orphans = 3
 
     def get(self, *args, **kwargs):
         """Instanciate the form."""
@@ -36,22 +36,14 @@ class ProductSearchView(InventoryUserMixin, ListView):
         """Return a queryset of orders based on GET data."""
         if self.form.is_valid():
             return self.form.get_queryset()
-        return []
+        return models.ProductRange.ranges.none()
 
     def get_context_data(self, *args, **kwargs):
         """Return the template context."""
         context = super().get_context_data(*args, **kwargs)
         context["form"] = self.form
-        context["page_range"] = self.get_page_range(context["paginator"])
         return context
 
-    def get_page_range(self, paginator):
-        """Return a list of pages to link to."""
-        if paginator.num_pages < 11:
-            return list(range(1, paginator.num_pages + 1))
-        else:
-            return list(range(1, 11)) + [paginator.num_pages]
-
     def get_initial(self):
         """Return the initial values for the product search form."""
         initial = {}
@@ -21,3 +21,12 @@ class SizeChartSizeAdmin(admin.ModelAdmin):
     fields = ("size_chart", "name", "uk_size", "eu_size", "us_size", "au_size", "sort")
     list_display = ("id",) + fields
     list_editable = fields
+
+
+@admin.register(models.LabelDownload)
+class LabelDownloadAdmin(admin.ModelAdmin):
+    """Model admin for LabelDownload model."""
+
+    list_display = ("id", "label_type", "status", "user", "created_at")
+    list_filter = ("label_type", "status")
+    readonly_fields = ("content_hash", "created_at", "completed_at")
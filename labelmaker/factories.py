@@ -2,6 +2,7 @@ import factory
 from factory import fuzzy
 from factory.django import DjangoModelFactory
 
+from home.factories import UserFactory
 from inventory.factories import SupplierFactory
 from labelmaker import models
 
@@ -25,3 +26,15 @@ class SizeChartSizeFactory(DjangoModelFactory):
     eu_size = fuzzy.FuzzyText()
     us_size = fuzzy.FuzzyText()
     au_size = fuzzy.FuzzyText()
+
+
+class LabelDownloadFactory(DjangoModelFactory):
+    class Meta:
+        model = models.LabelDownload
+
+    label_type = models.LabelDownload.PRODUCT
+    label_data = factory.LazyFunction(lambda: [["UK 12", "Pink", "FW987"]])
+    content_hash = factory.LazyAttribute(
+        lambda o: models.LabelDownload.hash_labels(o.label_type, o.label_data)
+    )
+    user = factory.SubFactory(UserFactory)
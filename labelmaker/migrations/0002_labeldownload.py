@@ -0,0 +1,76 @@
+# Generated by Django 5.1.2 on 2026-10-19 13:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("labelmaker", "0001_squashed_0006_alter_sizechart_id_alter_sizechartsize_id"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LabelDownload",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "label_type",
+                    models.CharField(
+                        choices=[
+                            ("product", "product"),
+                            ("address", "address"),
+                            ("small", "small"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("content_hash", models.CharField(db_index=True, max_length=64)),
+                ("label_data", models.JSONField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("in_progress", "In Progress"),
+                            ("complete", "Complete"),
+                            ("errored", "Errored"),
+                        ],
+                        default="in_progress",
+                        max_length=20,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+                ("error_message", models.TextField(blank=True)),
+                (
+                    "download_file",
+                    models.FileField(blank=True, null=True, upload_to="labelmaker"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="label_downloads",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Label Download",
+                "verbose_name_plural": "Label Downloads",
+                "ordering": ("-created_at",),
+                "get_latest_by": "created_at",
+            },
+        ),
+    ]
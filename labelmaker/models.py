@@ -1,9 +1,17 @@
 """Models for size charts."""
 
+import hashlib
+import io
+import json
 from collections import defaultdict
+from datetime import timedelta
 
+import labeler
+from django.conf import settings
+from django.core.files.base import ContentFile
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
 
 from inventory.models import Supplier
 
@@ -84,3 +92,196 @@ class SizeChartSize(models.Model):
             ("USA", self.us_size),
             ("AUS", self.au_size),
         )
+
+
+class LabelDownload(models.Model):
+    """
+    Model for label PDFs rendered in the background.
+
+    Downloads are keyed by a hash of the label type and label text so that
+    identical label jobs requested by a user within REUSE_PERIOD are served from
+    the existing PDF instead of being rendered again. Renders still in progress
+    after RENDER_TIMEOUT are treated as failed.
+
+    Labels can contain customer addresses, so the label text is cleared once the
+    PDF is rendered and downloads are deleted with their PDFs after
+    RETENTION_PERIOD.
+    """
+
+    REUSE_PERIOD = timedelta(minutes=15)
+    RENDER_TIMEOUT = timedelta(minutes=10)
+    RETENTION_PERIOD = timedelta(days=1)
+
+    PRODUCT = "product"
+    ADDRESS = "address"
+    SMALL = "small"
+
+    LABEL_TYPES = {
+        PRODUCT: (labeler.STW046025PO, labeler.DefaultLabelFormat),
+        ADDRESS: (labeler.ThermalAddressLabel4x6Sheet, labeler.AddressLabelFormat),
+        SMALL: (labeler.STW046025PO, labeler.SmallLabelFormat),
+    }
+
+    IN_PROGRESS = "in_progress"
+    COMPLETE = "complete"
+    ERRORED = "errored"
+
+    STATUS_CHOICES = (
+        (IN_PROGRESS, "In Progress"),
+        (COMPLETE, "Complete"),
+        (ERRORED, "Errored"),
+    )
+
+    label_type = models.CharField(
+        max_length=20, choices=[(label_type, label_type) for label_type in LABEL_TYPES]
+    )
+    content_hash = models.CharField(max_length=64, db_index=True)
+    label_data = models.JSONField()
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=IN_PROGRESS
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(blank=True, null=True)
+    error_message = models.TextField(blank=True)
+    download_file = models.FileField(blank=True, null=True, upload_to="labelmaker")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="label_downloads",
+    )
+
+    class Meta:
+        """Meta class for LabelDownload."""
+
+        verbose_name = "Label Download"
+        verbose_name_plural = "Label Downloads"
+        ordering = ("-created_at",)
+        get_latest_by = "created_at"
+
+    class LabelDownloadManager(models.Manager):
+        """Manager for LabelDownload."""
+
+        def get_or_create_download(self, user, label_type, label_data):
+            """
+            Return a download for the labels, rendering them if necessary.
+
+            An existing download of identical labels by the same user, created
+            within REUSE_PERIOD, is returned if it is complete or still rendering
+            within RENDER_TIMEOUT. Otherwise a new download is created and
+            rendered by a Celery task.
+
+            Args:
+                user (User): The user requesting the labels.
+                label_type (str): The key of the label format in LABEL_TYPES.
+                label_data (list[list[str]]): The lines of text for each label.
+
+            Returns:
+                (LabelDownload, bool): The download and whether it was created.
+            """
+            from labelmaker import tasks
+
+            content_hash = self.model.hash_labels(label_type, label_data)
+            now = timezone.now()
+            existing = (
+                self.filter(
+                    user=user,
+                    content_hash=content_hash,
+                    created_at__gte=now - self.model.REUSE_PERIOD,
+                )
+                .filter(
+                    models.Q(status=self.model.COMPLETE)
+                    | models.Q(
+                        status=self.model.IN_PROGRESS,
+                        created_at__gte=now - self.model.RENDER_TIMEOUT,
+                    )
+                )
+                .order_by("-created_at")
+                .first()
+            )
+            if existing is not None:
+                return existing, False
+            download = self.create(
+                user=user,
+                label_type=label_type,
+                content_hash=content_hash,
+                label_data=label_data,
+            )
+            tasks.render_label_pdf.delay(download.pk)
+            return download, True
+
+        def delete_expired(self):
+            """
+            Delete downloads created more than RETENTION_PERIOD ago.
+
+            Returns:
+                int: The number of downloads deleted.
+            """
+            expired = self.filter(
+                created_at__lt=timezone.now() - self.model.RETENTION_PERIOD
+            )
+            count = 0
+            for download in expired.iterator():
+                if download.download_file:
+                    download.download_file.delete(save=False)
+                download.delete()
+                count += 1
+            return count
+
+    objects = LabelDownloadManager()
+
+    def __str__(self):
+        return f"{self.get_label_type_display()} labels {self.created_at}"
+
+    def get_absolute_url(self):
+        """Return the URL of the download's status page."""
+        return reverse("labelmaker:label_download", args=[self.pk])
+
+    def is_timed_out(self):
+        """Return True if the render is in progress after RENDER_TIMEOUT."""
+        return (
+            self.status == self.IN_PROGRESS
+            and self.created_at < timezone.now() - self.RENDER_TIMEOUT
+        )
+
+    @staticmethod
+    def hash_labels(label_type, label_data):
+        """Return a hash identifying the labels."""
+        content = json.dumps([label_type, label_data], separators=(",", ":"))
+        return hashlib.sha256(content.encode("utf8")).hexdigest()
+
+    @classmethod
+    def render_pdf(cls, label_type, label_data):
+        """Return the bytes of a PDF of labels."""
+        label_sheet, label_format = cls.LABEL_TYPES[label_type]
+        sheet = label_sheet(label_format=label_format)
+        canvas = sheet.generate_PDF_from_data(label_data)
+        output = io.BytesIO()
+        canvas._filename = output
+        canvas.save()
+        return output.getvalue()
+
+    def generate_file(self):
+        """Render the labels and save them to download_file."""
+        try:
+            pdf = self.render_pdf(self.label_type, self.label_data)
+        except Exception as e:
+            self.set_error(str(e))
+            raise
+        self.download_file.save(
+            f"labels_{self.content_hash[:16]}.pdf", ContentFile(pdf), save=False
+        )
+        self.set_complete()
+
+    def set_error(self, error_message):
+        """Set the download as complete with error."""
+        self.status = self.ERRORED
+        self.completed_at = timezone.now()
+        self.error_message = error_message
+        self.save()
+
+    def set_complete(self):
+        """Set the download as complete without error and clear the label text."""
+        self.status = self.COMPLETE
+        self.completed_at = timezone.now()
+        self.label_data = []
+        self.save()
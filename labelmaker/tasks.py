@@ -0,0 +1,25 @@
+"""Tasks for the labelmaker app."""
+
+from celery import shared_task
+
+from home.jobs import scheduled_job
+from labelmaker import models
+
+
+@shared_task
+def render_label_pdf(download_pk):
+    """
+    Render the PDF for a label download.
+
+    Args:
+        download_pk (int): ID of the LabelDownload to render.
+    """
+    download = models.LabelDownload.objects.get(pk=download_pk)
+    download.generate_file()
+
+
+@shared_task
+@scheduled_job("delete_expired_label_downloads")
+def delete_expired_label_downloads():
+    """Delete expired label downloads and their PDFs."""
+    models.LabelDownload.objects.delete_expired()
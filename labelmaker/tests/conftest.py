@@ -9,3 +9,4 @@ pytest_factoryboy.register(GroupFactory)
 pytest_factoryboy.register(SupplierFactory)
 pytest_factoryboy.register(factories.SizeChartFactory)
 pytest_factoryboy.register(factories.SizeChartSizeFactory)
+pytest_factoryboy.register(factories.LabelDownloadFactory)
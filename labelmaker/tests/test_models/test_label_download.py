@@ -0,0 +1,188 @@
+import datetime as dt
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from labelmaker import models
+
+
+@pytest.fixture
+def label_data():
+    return [["UK 12", "Pink Cat Slipper", "FW987"], ["Medium", "Grey", "64535"]]
+
+
+@pytest.fixture
+def mock_render_task():
+    with mock.patch("labelmaker.tasks.render_label_pdf") as mock_task:
+        yield mock_task
+
+
+@pytest.fixture
+def label_download(label_download_factory):
+    return label_download_factory.create()
+
+
+@pytest.mark.django_db
+def test_has_in_progress_status_by_default(label_download):
+    assert label_download.status == models.LabelDownload.IN_PROGRESS
+
+
+@pytest.mark.django_db
+def test_get_absolute_url(label_download):
+    assert label_download.get_absolute_url() == reverse(
+        "labelmaker:label_download", args=[label_download.pk]
+    )
+
+
+def test_hash_labels_is_stable(label_data):
+    assert models.LabelDownload.hash_labels(
+        models.LabelDownload.PRODUCT, label_data
+    ) == models.LabelDownload.hash_labels(models.LabelDownload.PRODUCT, label_data)
+
+
+def test_hash_labels_depends_on_label_type(label_data):
+    assert models.LabelDownload.hash_labels(
+        models.LabelDownload.PRODUCT, label_data
+    ) != models.LabelDownload.hash_labels(models.LabelDownload.SMALL, label_data)
+
+
+def test_hash_labels_depends_on_label_data(label_data):
+    assert models.LabelDownload.hash_labels(
+        models.LabelDownload.PRODUCT, label_data
+    ) != models.LabelDownload.hash_labels(models.LabelDownload.PRODUCT, label_data[:1])
+
+
+def test_render_pdf(label_data):
+    pdf = models.LabelDownload.render_pdf(models.LabelDownload.PRODUCT, label_data)
+    assert pdf.startswith(b"%PDF")
+
+
+@pytest.mark.django_db
+def test_get_or_create_download_creates_download(user, label_data, mock_render_task):
+    download, created = models.LabelDownload.objects.get_or_create_download(
+        user=user, label_type=models.LabelDownload.PRODUCT, label_data=label_data
+    )
+    assert created is True
+    assert download.user == user
+    assert download.label_data == label_data
+    assert download.content_hash == models.LabelDownload.hash_labels(
+        models.LabelDownload.PRODUCT, label_data
+    )
+    mock_render_task.delay.assert_called_once_with(download.pk)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "status", [models.LabelDownload.IN_PROGRESS, models.LabelDownload.COMPLETE]
+)
+def test_get_or_create_download_reuses_existing_download(
+    user, label_data, label_download_factory, mock_render_task, status
+):
+    existing = label_download_factory.create(
+        user=user, label_data=label_data, status=status
+    )
+    download, created = models.LabelDownload.objects.get_or_create_download(
+        user=user, label_type=models.LabelDownload.PRODUCT, label_data=label_data
+    )
+    assert created is False
+    assert download == existing
+    mock_render_task.delay.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_get_or_create_download_does_not_reuse_errored_download(
+    user, label_data, label_download_factory, mock_render_task
+):
+    existing = label_download_factory.create(
+        user=user, label_data=label_data, status=models.LabelDownload.ERRORED
+    )
+    download, created = models.LabelDownload.objects.get_or_create_download(
+        user=user, label_type=models.LabelDownload.PRODUCT, label_data=label_data
+    )
+    assert created is True
+    assert download != existing
+
+
+@pytest.mark.django_db
+def test_get_or_create_download_does_not_reuse_another_users_download(
+    user, label_data, label_download_factory, mock_render_task
+):
+    existing = label_download_factory.create(
+        label_data=label_data, status=models.LabelDownload.COMPLETE
+    )
+    download, created = models.LabelDownload.objects.get_or_create_download(
+        user=user, label_type=models.LabelDownload.PRODUCT, label_data=label_data
+    )
+    assert created is True
+    assert download != existing
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "status,age",
+    [
+        (models.LabelDownload.COMPLETE, dt.timedelta(minutes=20)),
+        (models.LabelDownload.IN_PROGRESS, dt.timedelta(minutes=11)),
+    ],
+)
+def test_get_or_create_download_does_not_reuse_old_download(
+    user, label_data, label_download_factory, mock_render_task, status, age
+):
+    existing = label_download_factory.create(
+        user=user, label_data=label_data, status=status
+    )
+    models.LabelDownload.objects.filter(pk=existing.pk).update(
+        created_at=timezone.now() - age
+    )
+    download, created = models.LabelDownload.objects.get_or_create_download(
+        user=user, label_type=models.LabelDownload.PRODUCT, label_data=label_data
+    )
+    assert created is True
+    assert download != existing
+
+
+@pytest.mark.django_db
+def test_is_timed_out(label_download):
+    assert label_download.is_timed_out() is False
+    label_download.created_at = timezone.now() - dt.timedelta(minutes=11)
+    assert label_download.is_timed_out() is True
+    label_download.status = models.LabelDownload.COMPLETE
+    assert label_download.is_timed_out() is False
+
+
+@pytest.mark.django_db
+def test_delete_expired(label_download_factory):
+    expired = label_download_factory.create()
+    expired.generate_file()
+    models.LabelDownload.objects.filter(pk=expired.pk).update(
+        created_at=timezone.now() - dt.timedelta(days=2)
+    )
+    current = label_download_factory.create()
+    storage, name = expired.download_file.storage, expired.download_file.name
+    assert models.LabelDownload.objects.delete_expired() == 1
+    assert list(models.LabelDownload.objects.all()) == [current]
+    assert storage.exists(name) is False
+
+
+@pytest.mark.django_db
+def test_generate_file(label_download):
+    label_download.generate_file()
+    label_download.refresh_from_db()
+    assert label_download.status == models.LabelDownload.COMPLETE
+    assert label_download.completed_at is not None
+    assert label_download.download_file.read().startswith(b"%PDF")
+    assert label_download.label_data == []
+
+
+@pytest.mark.django_db
+def test_generate_file_sets_error(label_download):
+    with mock.patch.object(
+        models.LabelDownload, "render_pdf", side_effect=Exception("Render failed")
+    ):
+        with pytest.raises(Exception):
+            label_download.generate_file()
+    label_download.refresh_from_db()
+    assert label_download.status == models.LabelDownload.ERRORED
+    assert label_download.error_message == "Render failed"
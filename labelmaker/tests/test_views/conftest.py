@@ -1,4 +1,5 @@
 import uuid
+from unittest import mock
 
 import pytest
 from django.contrib.auth.models import Group
@@ -34,9 +35,19 @@ def client_not_in_group(client, create_user, test_password):
 
 
 @pytest.fixture
-def valid_client(client, create_user, test_password):
-    user = create_user()
+def user(create_user):
+    return create_user()
+
+
+@pytest.fixture
+def valid_client(client, user, test_password):
     group, _ = Group.objects.get_or_create(name=LABELMAKER_GROUP_NAME)
     group.user_set.add(user)
     client.login(username=user.username, password=test_password)
     return client
+
+
+@pytest.fixture(autouse=True)
+def mock_render_task():
+    with mock.patch("labelmaker.tasks.render_label_pdf") as mock_task:
+        yield mock_task
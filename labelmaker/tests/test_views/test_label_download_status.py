@@ -0,0 +1,75 @@
+import datetime as dt
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from labelmaker import models
+
+
+@pytest.fixture
+def label_download(label_download_factory, user):
+    return label_download_factory.create(user=user)
+
+
+@pytest.fixture
+def url(label_download):
+    return reverse("labelmaker:label_download", args=[label_download.pk])
+
+
+@pytest.mark.django_db
+def test_cannot_access_logged_out(logged_out_client, url):
+    assert logged_out_client.get(url).status_code == 302
+
+
+@pytest.mark.django_db
+def test_cannot_access_if_not_in_group(client_not_in_group, url):
+    assert client_not_in_group.get(url).status_code == 403
+
+
+@pytest.mark.django_db
+def test_in_progress(valid_client, url, label_download):
+    response = valid_client.get(url)
+    assert response.status_code == 200
+    assert response.context["download"] == label_download
+
+
+@pytest.mark.django_db
+def test_redirects_to_file_when_complete(valid_client, url, label_download):
+    label_download.generate_file()
+    response = valid_client.get(url)
+    assert response.status_code == 302
+    assert response.url == label_download.download_file.url
+
+
+@pytest.mark.django_db
+def test_errored(valid_client, url, label_download):
+    label_download.set_error("Render failed")
+    response = valid_client.get(url)
+    assert response.status_code == 200
+    assert response.context["download"].status == models.LabelDownload.ERRORED
+
+
+@pytest.mark.django_db
+def test_timed_out_render_is_errored(valid_client, url, label_download):
+    models.LabelDownload.objects.filter(pk=label_download.pk).update(
+        created_at=timezone.now() - dt.timedelta(hours=1)
+    )
+    response = valid_client.get(url)
+    assert response.status_code == 200
+    assert response.context["download"].status == models.LabelDownload.ERRORED
+    label_download.refresh_from_db()
+    assert label_download.status == models.LabelDownload.ERRORED
+
+
+@pytest.mark.django_db
+def test_cannot_access_another_users_download(valid_client, label_download_factory):
+    label_download = label_download_factory.create()
+    url = reverse("labelmaker:label_download", args=[label_download.pk])
+    assert valid_client.get(url).status_code == 404
+
+
+@pytest.mark.django_db
+def test_missing_download(valid_client):
+    url = reverse("labelmaker:label_download", args=[999999])
+    assert valid_client.get(url).status_code == 404
@@ -3,6 +3,8 @@ import json
 import pytest
 from django.urls import reverse
 
+from labelmaker import models
+
 
 @pytest.fixture
 def path():
@@ -57,12 +59,46 @@ def test_cannot_get(valid_client, url):
 
 
 @pytest.mark.django_db
-def test_returns_pdf(valid_client, url, post_data):
+def test_creates_download(valid_client, url, post_data, mock_render_task):
+    valid_client.post(url, post_data)
+    download = models.LabelDownload.objects.get()
+    assert download.label_type == models.LabelDownload.PRODUCT
+    mock_render_task.delay.assert_called_once_with(download.pk)
+
+
+@pytest.mark.django_db
+def test_redirects_to_download(valid_client, url, post_data):
     response = valid_client.post(url, post_data)
-    assert response["Content-Type"] == "application/pdf"
+    download = models.LabelDownload.objects.get()
+    assert response.status_code == 302
+    assert response.url == download.get_absolute_url()
+
+
+@pytest.mark.django_db
+def test_reuses_download_for_identical_labels(
+    valid_client, url, post_data, mock_render_task
+):
+    valid_client.post(url, post_data)
+    valid_client.post(url, post_data)
+    assert models.LabelDownload.objects.count() == 1
+    mock_render_task.delay.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_label_data(valid_client, url, post_data, size_chart_sizes):
+    valid_client.post(url, post_data)
+    label_data = models.LabelDownload.objects.get().label_data
+    assert label_data[0][0] == size_chart_sizes[0].name
+    assert label_data[4][0] == f"UK: {size_chart_sizes[2].uk_size}"
+    assert len(label_data) == 6
 
 
 @pytest.mark.django_db
-def test_response_filename(valid_client, url, post_data):
+def test_size_from_other_size_chart(valid_client, url, size_chart_size_factory):
+    size = size_chart_size_factory.create()
+    post_data = {
+        "product_code": "TV001",
+        "data": json.dumps([{"size": size.id, "colour": "Green", "quantity": "1"}]),
+    }
     response = valid_client.post(url, post_data)
-    assert response["Content-Disposition"] == 'filename="labels.pdf"'
+    assert response.status_code == 404
@@ -1,6 +1,8 @@
 import pytest
 from django.urls import reverse
 
+from labelmaker import models
+
 
 @pytest.fixture
 def path():
@@ -33,12 +35,26 @@ def test_cannot_get(valid_client, url):
 
 
 @pytest.mark.django_db
-def test_returns_pdf(valid_client, url, post_data):
-    response = valid_client.post(url, post_data)
-    assert response["Content-Type"] == "application/pdf"
+def test_creates_download(valid_client, url, post_data, mock_render_task):
+    valid_client.post(url, post_data)
+    download = models.LabelDownload.objects.get()
+    assert download.label_type == models.LabelDownload.SMALL
+    mock_render_task.delay.assert_called_once_with(download.pk)
 
 
 @pytest.mark.django_db
-def test_response_filename(valid_client, url, post_data):
+def test_redirects_to_download(valid_client, url, post_data):
     response = valid_client.post(url, post_data)
-    assert response["Content-Disposition"] == 'filename="labels.pdf"'
+    download = models.LabelDownload.objects.get()
+    assert response.status_code == 302
+    assert response.url == download.get_absolute_url()
+
+
+@pytest.mark.django_db
+def test_reuses_download_for_identical_labels(
+    valid_client, url, post_data, mock_render_task
+):
+    valid_client.post(url, post_data)
+    valid_client.post(url, post_data)
+    assert models.LabelDownload.objects.count() == 1
+    mock_render_task.delay.assert_called_once()
@@ -54,6 +54,11 @@ urlpatterns = [
         views.TestProductPDFLabel.as_view(),
         name="test_product_labels",
     ),
+    path(
+        "label_download/<int:pk>/",
+        views.LabelDownloadStatus.as_view(),
+        name="label_download",
+    ),
     path("address_labels/", views.AddressLabelForm.as_view(), name="address_labels"),
     path(
         "address_labels/address_label_pdf/",
@@ -2,9 +2,8 @@
 
 import json
 
-import labeler
 from django import http
-from django.shortcuts import get_object_or_404
+from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse_lazy
 from django.views import View
 from django.views.generic.base import TemplateView
@@ -125,38 +124,61 @@ class CreateProductLabelsWithoutTemplate(LabelmakerUserMixin, TemplateView):
 
 
 class BasePDFLabelView(LabelmakerUserMixin, View):
-    """Base class for views for printable label PDFs."""
+    """
+    Base class for views for printable label PDFs.
+
+    Labels are rendered in the background. POST requests redirect to the status
+    page of a LabelDownload for the requested labels.
+    """
 
     def post(self, *args, **kwargs):
-        """Create HTTP response."""
-        return self.create_label_response(*args, **kwargs)
+        """Redirect to the label download."""
+        return self.create_label_download(*args, **kwargs)
+
+    def create_label_download(self, *args, **kwargs):
+        """Return a redirect to a LabelDownload for the requested labels."""
+        data = self.get_label_data(*args, **kwargs)
+        download, _ = models.LabelDownload.objects.get_or_create_download(
+            user=self.request.user, label_type=self.label_type, label_data=data
+        )
+        return redirect(download.get_absolute_url())
 
     def create_label_response(self, *args, **kwargs):
         """Return an HttpResponse object with the generated label PDF."""
         response = http.HttpResponse(content_type="application/pdf")
         response["Content-Disposition"] = 'filename="labels.pdf"'
-        sheet = self.get_label_sheet(*args, **kwargs)
         data = self.get_label_data(*args, **kwargs)
-        canvas = sheet.generate_PDF_from_data(data)
-        canvas._filename = response
-        self.edit_canvas(canvas)
-        canvas.save()
+        response.write(models.LabelDownload.render_pdf(self.label_type, data))
         return response
 
-    def get_label_sheet(self, *args, **kwargs):
-        """Return a formatted label sheet."""
-        return self.label_sheet(label_format=self.label_format)
 
-    def edit_canvas(self, canvas):
-        """Make changes to the canvas after label generation."""
-        pass
+class LabelDownloadStatus(LabelmakerUserMixin, TemplateView):
+    """Show the status of a label download, redirecting to the PDF when complete."""
+
+    template_name = "labelmaker/label_download_status.html"
+
+    def get(self, *args, **kwargs):
+        """Redirect to the PDF if it is ready, otherwise show the status page."""
+        self.download = get_object_or_404(
+            models.LabelDownload, pk=self.kwargs["pk"], user=self.request.user
+        )
+        if self.download.is_timed_out():
+            self.download.set_error("Rendering timed out.")
+        if self.download.status == self.download.COMPLETE:
+            return redirect(self.download.download_file.url)
+        return super().get(*args, **kwargs)
+
+    def get_context_data(self, *args, **kwargs):
+        """Return context for the template."""
+        context = super().get_context_data(*args, **kwargs)
+        context["download"] = self.download
+        return context
 
 
 class BaseProductPDFLabelView(BasePDFLabelView):
     """Base view for product PDF labels."""
 
-    label_format = labeler.DefaultLabelFormat
-    label_sheet = labeler.STW046025PO
+    label_type = models.LabelDownload.PRODUCT
 
     def read_json(self):
         """Return label data from POST data."""
@@ -201,11 +223,13 @@ class ProductLabelsPDFFromSizeChart(BaseProductPDFLabelView):
 
     def get_label_data_for_size_chart(self, product_code, label_input, size_chart):
         """Return text lines for labels generated from a size chart."""
+        sizes = size_chart.sizechartsize_set.in_bulk()
         label_data = []
         for label in label_input:
-            size = get_object_or_404(
-                models.SizeChartSize, id=label["size"], size_chart=size_chart
-            )
+            try:
+                size = sizes[int(label["size"])]
+            except (KeyError, TypeError, ValueError):
+                raise http.Http404
             colour = label["colour"]
             foriegn_size_data = self.foriegn_size_data(size)
             for _ in range(int(label["quantity"])):
@@ -262,8 +286,7 @@ class AddressLabelForm(LabelmakerUserMixin, TemplateView):
 class AddressLabelPDF(BasePDFLabelView):
     """View for address label PDF creation."""
 
-    label_format = labeler.AddressLabelFormat
-    label_sheet = labeler.ThermalAddressLabel4x6Sheet
+    label_type = models.LabelDownload.ADDRESS
 
     def get_label_data(self, *args, **kwargs):
         """Return list containing lists of lines of text for each label."""
@@ -286,8 +309,7 @@ class SmallLabelForm(LabelmakerUserMixin, TemplateView):
 class SmallLabelPDF(BasePDFLabelView):
     """View for address label PDF creation."""
 
-    label_format = labeler.SmallLabelFormat
-    label_sheet = labeler.STW046025PO
+    label_type = models.LabelDownload.SMALL
 
     def get_label_data(self, *args, **kwargs):
         """Return list containing lists of lines of text for each label."""
@@ -1,12 +1,8 @@
 """Create a linnworks update files."""
 
-import logging
-
 from django.core.management.base import BaseCommand
 
-from linnworks import models
-
-logger = logging.getLogger("management_commands")
+from linnworks import tasks
 
 
 class Command(BaseCommand):
@@ -16,8 +12,4 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         """Import processed orders from Linnworks export files."""
-        try:
-            models.OrderUpdater().update_orders()
-        except Exception as e:
-            logger.exception("Error updating processed orders.")
-            raise e
+        tasks.import_processed_orders()
@@ -1,12 +1,8 @@
 """Create a linnworks update files."""
 
-import logging
-
 from django.core.management.base import BaseCommand
 
-from linnworks import models
-
-logger = logging.getLogger("management_commands")
+from linnworks import tasks
 
 
 class Command(BaseCommand):
@@ -16,8 +12,4 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         """Update order packing records."""
-        try:
-            models.LinnworksOrder.objects.update_packing_records()
-        except Exception as e:
-            logger.exception("Error updating order GUIDs.")
-            raise e
+        tasks.update_packing_records()
@@ -10,6 +10,7 @@ from inventory.models import (
     MultipackProduct,
     Product,
     ProductImageLink,
+    ProductLoader,
     ProductRangeImageLink,
 )
 from inventory.models.product import CombinationProduct
@@ -215,64 +216,17 @@ class LinnworksProductImportFile(BaseImportFile):
     def get_product_ranges(cls):
         """Return a dict of productrange: list(products)."""
         product_ranges = defaultdict(list)
-        products = list(
+        product_ids = list(
             Product.objects.variations()
             .active()
             .complete()
-            .select_related(
-                "product_range",
-                "supplier",
-                "brand",
-                "manufacturer",
-                "package_type",
-                "vat_rate",
-            )
-            .prefetch_related(
-                "product_bay_links",
-                "product_bay_links__bay",
-                "variation_option_values",
-                "variation_option_values__variation_option",
-                "listing_attribute_values",
-                "listing_attribute_values__listing_attribute",
-            )
+            .values_list("pk", flat=True)
         )
-        products.extend(
-            MultipackProduct.objects.variations()
-            .active()
-            .select_related(
-                "product_range",
-                "supplier",
-                "package_type",
-                "base_product",
-                "base_product__brand",
-                "base_product__manufacturer",
-                "base_product__vat_rate",
+        for model in (MultipackProduct, CombinationProduct):
+            product_ids.extend(
+                model.objects.variations().active().values_list("pk", flat=True)
             )
-            .prefetch_related(
-                "variation_option_values",
-                "variation_option_values__variation_option",
-                "listing_attribute_values",
-                "listing_attribute_values__listing_attribute",
-            )
-        )
-        products.extend(
-            CombinationProduct.objects.variations()
-            .active()
-            .select_related(
-                "product_range",
-                "supplier",
-                "package_type",
-            )
-            .prefetch_related(
-                "variation_option_values",
-                "variation_option_values__variation_option",
-                "listing_attribute_values",
-                "listing_attribute_values__listing_attribute",
-                "combination_product_links",
-                "combination_product_links__product",
-            )
-        )
-        for product in products:
+        for product in ProductLoader.load(product_ids):
             product_ranges[product.product_range].append(product)
         return product_ranges
 
@@ -485,3 +439,14 @@ class ImageUpdateFile(BaseImportFile):
             }
             rows.append(row)
         return rows
+
+
+def write_import_files():
+    """Write the product and composition import files to their configured paths."""
+    config = LinnworksConfig.get_solo()
+    inventory_file = LinnworksProductImportFile.create()
+    with open(config.inventory_import_file_path, "w") as f:
+        inventory_file.write(f)
+    composition_file = LinnworksCompostitionImportFile.create()
+    with open(config.composition_import_file_path, "w") as f:
+        composition_file.write(f)
@@ -11,6 +11,7 @@ import linnapi
 from django.db import models, transaction
 from django.utils import timezone
 
+from home import instrumentation
 from home.models import Staff
 from inventory.models import BaseProduct
 from orders.models import Order, ProductSale
@@ -46,7 +47,10 @@ class LinnworksOrderManager(models.Manager):
                 logger.exception(e)
                 continue
             if i > 0 and i % 149 == 0:
-                time.sleep(wait_time)
+                with instrumentation.rate_limit_wait(
+                    instrumentation.LINNWORKS, "get_order_guid"
+                ):
+                    time.sleep(wait_time)
 
     def update_packing_records(self, orders_since=None):
         """Add Linnworks order GUIDs to recent orders."""
@@ -73,7 +77,10 @@ class LinnworksOrderManager(models.Manager):
                 continue
             finally:
                 if i > 0 and i % 149 == 0:
-                    time.sleep(wait_time)
+                    with instrumentation.rate_limit_wait(
+                        instrumentation.LINNWORKS, "get_order_audit_trail"
+                    ):
+                        time.sleep(wait_time)
 
 
 class LinnworksOrder(models.Model):
@@ -317,12 +324,14 @@ class OrderUpdater:
         return self.shipping_services[service_name]
 
 
+@instrumentation.instrument(instrumentation.LINNWORKS)
 @linnapi.linnworks_api_session
 def get_order_guid(order_id):
     """Return the Linnworks order GUID for an order."""
     return linnapi.orders.get_order_guid_by_order_id(order_id)
 
 
+@instrumentation.instrument(instrumentation.LINNWORKS)
 @linnapi.linnworks_api_session
 def get_order_audit_trail(order_guid):
     """Return the audit trail for an order."""
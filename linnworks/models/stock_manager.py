@@ -1,10 +1,13 @@
 """Models managing Linnworks stock levels."""
 
+import hashlib
 from collections import defaultdict
 
 import linnapi
+from django.core.cache import cache
 from django.db import models, transaction
 
+from home import instrumentation
 from inventory.models import BaseProduct, StockLevelHistory
 
 from .config import LinnworksChannel
@@ -28,6 +31,8 @@ class StockManager:
     """Methods for managing Linnworks stock levels."""
 
     LOCATION_ID = "00000000-0000-0000-0000-000000000000"
+    LOOKUP_CACHE_TIMEOUT = 60 * 30
+    NEGATIVE_LOOKUP_CACHE_TIMEOUT = 60
 
     @classmethod
     def get_stock_level(cls, product):
@@ -188,34 +193,78 @@ class StockManager:
     def channel_links(cls, *skus):
         """Return channel linked items for SKUs."""
         links = cls._get_channel_linked_items(*skus)
+        channels = {
+            (channel.source, channel.sub_source): channel
+            for channel in LinnworksChannel.objects.all()
+        }
         output = defaultdict(lambda: defaultdict(list))
         for sku, sku_links in links.items():
-            for channel in LinnworksChannel.objects.all():
-                for link in sku_links:
-                    if (
-                        link.source == channel.source
-                        and link.sub_source == channel.sub_source
-                    ):
-                        link.url = channel.item_link(link.channel_reference_id)
-                        output[sku][channel].append(link)
+            for link in sku_links:
+                channel = channels.get((link.source, link.sub_source))
+                if channel is not None:
+                    link.url = channel.item_link(link.channel_reference_id)
+                    output[sku][channel].append(link)
         return {
-            sku: {channel: links for channel, links in output[sku].items()}
+            sku: {
+                channel: output[sku][channel]
+                for channel in channels.values()
+                if channel in output[sku]
+            }
             for sku in output
         }
 
     @classmethod
+    def cached_products_exist(cls, *skus):
+        """
+        Return products_exist for SKUs, using a cached result when available.
+
+        Results are cached by the set of SKUs, so any change to the SKUs
+        requested is looked up again. Missing products are usually waiting to
+        be processed by Linnworks, so negative results are cached briefly.
+        """
+        key = cls._lookup_cache_key("products_exist", skus)
+        products_exist = cache.get(key)
+        if products_exist is None:
+            products_exist = cls.products_exist(*skus)
+            timeout = (
+                cls.LOOKUP_CACHE_TIMEOUT
+                if products_exist
+                else cls.NEGATIVE_LOOKUP_CACHE_TIMEOUT
+            )
+            cache.set(key, products_exist, timeout)
+        return products_exist
+
+    @classmethod
+    def cached_channel_links(cls, *skus):
+        """Return channel_links for SKUs, using a cached result when available."""
+        key = cls._lookup_cache_key("channel_links", skus)
+        channel_links = cache.get(key)
+        if channel_links is None:
+            channel_links = cls.channel_links(*skus)
+            cache.set(key, channel_links, cls.LOOKUP_CACHE_TIMEOUT)
+        return channel_links
+
+    @staticmethod
+    def _lookup_cache_key(name, skus):
+        digest = hashlib.sha256("\n".join(sorted(skus)).encode("utf8")).hexdigest()
+        return f"stock_manager:{name}:{digest}"
+
+    @classmethod
+    @instrumentation.instrument(instrumentation.LINNWORKS)
     @linnapi.linnworks_api_session
     def _get_stock_item_ids(cls, *skus):
         """Return stock item IDs for one or more SKUs."""
         return linnapi.inventory.get_stock_item_ids_by_sku(*skus)
 
     @classmethod
+    @instrumentation.instrument(instrumentation.LINNWORKS)
     @linnapi.linnworks_api_session
     def _get_stock_level__info_from_linnworks(cls, sku):
         """Return stock level information for a product SKU."""
         return linnapi.inventory.get_stock_level_by_sku(sku=sku)
 
     @classmethod
+    @instrumentation.instrument(instrumentation.LINNWORKS)
     @linnapi.linnworks_api_session
     def _get_multiple_stock_level_info_from_linnworks(cls, *skus):
         """Return stock level information for multiple product SKUs."""
@@ -224,6 +273,7 @@ class StockManager:
         return linnapi.inventory.get_stock_levels_by_skus(*skus)
 
     @classmethod
+    @instrumentation.instrument(instrumentation.LINNWORKS)
     @linnapi.linnworks_api_session
     def _set_stock_level_in_linnworks(
         cls, sku, relative_stock_level_change, change_source=""
@@ -235,6 +285,7 @@ class StockManager:
         )[0]
 
     @classmethod
+    @instrumentation.instrument(instrumentation.LINNWORKS)
     @linnapi.linnworks_api_session
     def _get_stock_level_history(cls, sku):
         return linnapi.inventory.get_stock_level_history_by_sku(
@@ -242,6 +293,7 @@ class StockManager:
         )
 
     @classmethod
+    @instrumentation.instrument(instrumentation.LINNWORKS)
     @linnapi.linnworks_api_session
     def _get_channel_linked_items(cls, *skus):
         return linnapi.inventory.get_channel_skus_by_skus(*skus)
@@ -0,0 +1,43 @@
+"""Tasks for the linnworks app."""
+
+from celery import shared_task
+
+from home.jobs import scheduled_job
+from linnworks import models
+
+
+@shared_task
+@scheduled_job("import_processed_orders")
+def import_processed_orders():
+    """Import processed orders from the latest Linnworks export."""
+    models.OrderUpdater().update_orders()
+
+
+@shared_task
+@scheduled_job("update_stock_level_records")
+def update_stock_level_records():
+    """Import stock levels from the latest Linnworks stock level export."""
+    update = models.StockLevelExportUpdate.objects.create_update()
+    if update is None:
+        raise Exception("No new stock level export to import.")
+
+
+@shared_task
+@scheduled_job("update_order_guids")
+def update_order_guids():
+    """Update records of Linnworks internal GUID order references."""
+    models.LinnworksOrder.objects.update_order_guids()
+
+
+@shared_task
+@scheduled_job("update_packing_records")
+def update_packing_records():
+    """Update order packing records."""
+    models.LinnworksOrder.objects.update_packing_records()
+
+
+@shared_task
+@scheduled_job("create_linnworks_update")
+def create_linnworks_update():
+    """Write the Linnworks product and composition import files."""
+    models.linnworks_import_files.write_import_files()
@@ -82,6 +82,7 @@ class OrderExportDownloadAdmin(admin.ModelAdmin):
         "created_at",
         "completed_at",
         "error_message",
+        "order_count",
         "download_file",
     )
     date_hierarchy = "created_at"
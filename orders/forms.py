@@ -78,6 +78,10 @@ class OrderListFilter(forms.Form):
         }
         return {key: value for key, value in kwargs.items() if value is not None}
 
+    def filter_params(self):
+        """Return the submitted filter values as a JSON serialisable dict."""
+        return {name: self.data.get(name) or "" for name in self.fields}
+
     def get_queryset(self):
         """Return a queryset of orders based on the submitted data."""
         kwargs = self.query_kwargs(self.cleaned_data)
@@ -95,7 +99,6 @@ class OrderListFilter(forms.Form):
                 "country",
                 "country__region",
             )
-            .distinct()
         )
 
 
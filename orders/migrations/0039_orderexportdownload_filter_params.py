@@ -0,0 +1,48 @@
+# Generated by Django 5.1.1 on 2026-10-19 15:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0038_packingmistake"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="orderexportdownload",
+            options={
+                "get_latest_by": "requested_at",
+                "verbose_name": "Order Export Download",
+                "verbose_name_plural": "Order Export Downlaods",
+            },
+        ),
+        migrations.RemoveField(
+            model_name="orderexportdownload",
+            name="order_ids",
+        ),
+        migrations.AddField(
+            model_name="orderexportdownload",
+            name="filter_params",
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AddField(
+            model_name="orderexportdownload",
+            name="order_count",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="orderexportdownload",
+            name="params_hash",
+            field=models.CharField(
+                blank=True, db_index=True, default="", max_length=64
+            ),
+        ),
+        migrations.AddField(
+            model_name="orderexportdownload",
+            name="requested_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.1.1 on 2026-10-19 16:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("orders", "0039_orderexportdownload_filter_params"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(
+                fields=["dispatched_at"], name="order_dispatched_at_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(
+                fields=["recieved_at", "id"], name="order_recieved_at_id_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(
+                condition=models.Q(
+                    ("cancelled", False),
+                    ("dispatched_at__isnull", True),
+                    ("ignored", False),
+                ),
+                fields=["recieved_at"],
+                name="order_undispatched_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="productsale",
+            index=models.Index(
+                fields=["sku", "order"], name="productsale_sku_order_idx"
+            ),
+        ),
+    ]
@@ -5,13 +5,12 @@ import io
 from datetime import datetime, timedelta
 
 from django.contrib.auth import get_user_model
-from django.contrib.postgres.fields import ArrayField
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db import models
 from django.utils import timezone
 from file_exchange.models import FileDownload
 
-from home.models import Staff
+from home.models import ReusableDownload, Staff
 from shipping.models import Country, Currency, ShippingPrice, ShippingService
 
 from .channel import Channel
@@ -116,6 +115,17 @@ class Order(models.Model):
 
         verbose_name = "Order"
         verbose_name_plural = "Orders"
+        indexes = [
+            models.Index(fields=["dispatched_at"], name="order_dispatched_at_idx"),
+            models.Index(fields=["recieved_at", "id"], name="order_recieved_at_id_idx"),
+            models.Index(
+                fields=["recieved_at"],
+                name="order_undispatched_idx",
+                condition=models.Q(
+                    dispatched_at__isnull=True, cancelled=False, ignored=False
+                ),
+            ),
+        ]
 
     def __str__(self):
         return f"Order: {self.order_id}"
@@ -307,10 +317,16 @@ class OrderExporter:
         return f"{price / 100:.2f}"
 
 
-class OrderExportDownload(FileDownload):
-    """Model for managing order exports."""
+class OrderExportDownload(ReusableDownload, FileDownload):
+    """
+    Model for managing order exports.
+
+    The exported orders are selected by the values of an
+    orders.forms.OrderListFilter form, saved in filter_params.
+    """
 
-    order_ids = ArrayField(models.PositiveBigIntegerField())
+    filter_params = models.JSONField(default=dict)
+    order_count = models.PositiveIntegerField(blank=True, null=True)
     download_file = models.FileField(blank=True, null=True)
     user = models.ForeignKey(
         get_user_model(), on_delete=models.CASCADE, related_name="order_downloads"
@@ -321,11 +337,22 @@ class OrderExportDownload(FileDownload):
 
         verbose_name = "Order Export Download"
         verbose_name_plural = "Order Export Downlaods"
-        get_latest_by = "created_at"
+        get_latest_by = "requested_at"
+
+    def get_orders(self):
+        """Return a queryset of the orders to export."""
+        from orders.forms import OrderListFilter
+
+        form = OrderListFilter(self.filter_params)
+        if not form.is_valid():
+            raise ValueError(f"Invalid order filter: {form.errors.as_json()}")
+        return form.get_queryset()
 
     def generate_file(self):
         """Create on order export file."""
         name = f"order_export_{timezone.now().strftime('%Y-%m-%d')}.csv"
-        orders = Order.objects.filter(id__in=self.order_ids)
+        orders = self.get_orders()
         data = OrderExporter().make_csv(orders)
+        self.order_count = orders.count()
+        self.save()
         return SimpleUploadedFile(name=name, content=data.encode("utf8"))
@@ -30,6 +30,9 @@ class ProductSale(models.Model):
         verbose_name = "Product Sale"
         verbose_name_plural = "Product Sales"
         unique_together = ("order", "sku")
+        indexes = [
+            models.Index(fields=["sku", "order"], name="productsale_sku_order_idx"),
+        ]
 
     def total_weight(self):
         """Return the combined weight of this item."""
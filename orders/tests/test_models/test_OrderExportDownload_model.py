@@ -0,0 +1,205 @@
+import datetime as dt
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+
+from home.factories import UserFactory
+from home.locks import CacheLock
+from orders import models
+
+
+@pytest.fixture
+def user():
+    return UserFactory.create()
+
+
+@pytest.fixture
+def filter_params():
+    return {
+        "order_id": "",
+        "country": "",
+        "channel": "",
+        "recieved_from": "",
+        "recieved_to": "",
+        "status": "dispatched",
+    }
+
+
+@pytest.fixture
+def mock_create_download():
+    def create_download(**kwargs):
+        return models.OrderExportDownload.objects.create(**kwargs)
+
+    with mock.patch.object(
+        models.OrderExportDownload.objects,
+        "create_download",
+        side_effect=create_download,
+        create=True,
+    ) as m:
+        yield m
+
+
+@pytest.fixture
+def export_download(user, filter_params):
+    return models.OrderExportDownload.objects.create(
+        user=user,
+        filter_params=filter_params,
+        params_hash=models.OrderExportDownload.hash_params(
+            user=user, filter_params=filter_params
+        ),
+    )
+
+
+@pytest.mark.django_db
+def test_hash_params_is_stable(user, filter_params):
+    assert models.OrderExportDownload.hash_params(
+        user=user, filter_params=filter_params
+    ) == models.OrderExportDownload.hash_params(
+        filter_params=dict(filter_params), user=user
+    )
+
+
+@pytest.mark.django_db
+def test_hash_params_differs_for_different_params(user, filter_params):
+    other_params = dict(filter_params, status="undispatched")
+    assert models.OrderExportDownload.hash_params(
+        user=user, filter_params=filter_params
+    ) != models.OrderExportDownload.hash_params(user=user, filter_params=other_params)
+
+
+@pytest.mark.django_db
+def test_get_or_create_download_creates_download(
+    user, filter_params, mock_create_download
+):
+    download, created = models.OrderExportDownload.get_or_create_download(
+        user=user, filter_params=filter_params
+    )
+    assert created is True
+    assert download.user == user
+    assert download.filter_params == filter_params
+    assert download.params_hash == models.OrderExportDownload.hash_params(
+        user=user, filter_params=filter_params
+    )
+    mock_create_download.assert_called_once()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "status",
+    [models.OrderExportDownload.IN_PROGRESS, models.OrderExportDownload.COMPLETE],
+)
+def test_get_or_create_download_reuses_recent_download(
+    user, filter_params, export_download, mock_create_download, status
+):
+    export_download.status = status
+    export_download.save()
+    download, created = models.OrderExportDownload.get_or_create_download(
+        user=user, filter_params=filter_params
+    )
+    assert created is False
+    assert download == export_download
+    mock_create_download.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_get_or_create_download_updates_requested_at(
+    user, filter_params, export_download, mock_create_download
+):
+    requested_at = timezone.now() - dt.timedelta(minutes=5)
+    export_download.requested_at = requested_at
+    export_download.save()
+    download, _ = models.OrderExportDownload.get_or_create_download(
+        user=user, filter_params=filter_params
+    )
+    download.refresh_from_db()
+    assert download.requested_at > requested_at
+
+
+@pytest.mark.django_db
+def test_get_or_create_download_does_not_reuse_errored_download(
+    user, filter_params, export_download, mock_create_download
+):
+    export_download.status = models.OrderExportDownload.ERRORED
+    export_download.save()
+    download, created = models.OrderExportDownload.get_or_create_download(
+        user=user, filter_params=filter_params
+    )
+    assert created is True
+    assert download != export_download
+
+
+@pytest.mark.django_db
+def test_get_or_create_download_does_not_reuse_old_download(
+    user, filter_params, export_download, mock_create_download
+):
+    models.OrderExportDownload.objects.filter(pk=export_download.pk).update(
+        created_at=timezone.now() - models.OrderExportDownload.REUSE_PERIOD * 2
+    )
+    download, created = models.OrderExportDownload.get_or_create_download(
+        user=user, filter_params=filter_params
+    )
+    assert created is True
+    assert download != export_download
+
+
+@pytest.mark.django_db
+def test_get_or_create_download_does_not_reuse_other_users_download(
+    filter_params, export_download, mock_create_download
+):
+    download, created = models.OrderExportDownload.get_or_create_download(
+        user=UserFactory.create(), filter_params=filter_params
+    )
+    assert created is True
+    assert download != export_download
+
+
+@pytest.mark.django_db
+def test_get_or_create_download_releases_lock(
+    user, filter_params, mock_create_download
+):
+    params_hash = models.OrderExportDownload.hash_params(
+        user=user, filter_params=filter_params
+    )
+    models.OrderExportDownload.get_or_create_download(
+        user=user, filter_params=filter_params
+    )
+    assert CacheLock(key=f"download:{params_hash}", timeout=10).acquire() is True
+
+
+@pytest.mark.django_db
+def test_get_or_create_download_waits_for_lock(
+    user, filter_params, mock_create_download
+):
+    params_hash = models.OrderExportDownload.hash_params(
+        user=user, filter_params=filter_params
+    )
+    CacheLock(key=f"download:{params_hash}", timeout=10).acquire()
+    with mock.patch("home.locks.time") as mock_time:
+        mock_time.monotonic.side_effect = [0, 5, 11]
+        models.OrderExportDownload.get_or_create_download(
+            user=user, filter_params=filter_params
+        )
+    mock_time.sleep.assert_called_once_with(CacheLock.POLL_INTERVAL)
+
+
+@pytest.mark.django_db
+def test_get_orders(export_download, order_factory):
+    dispatched = order_factory.create(dispatched_at=timezone.now())
+    order_factory.create(dispatched_at=None)
+    assert list(export_download.get_orders()) == [dispatched]
+
+
+@pytest.mark.django_db
+def test_get_orders_raises_for_invalid_filter(export_download):
+    export_download.filter_params["country"] = "999999"
+    with pytest.raises(ValueError):
+        export_download.get_orders()
+
+
+@pytest.mark.django_db
+def test_generate_file_sets_order_count(export_download, order_factory):
+    order_factory.create_batch(3, dispatched_at=timezone.now())
+    export_download.generate_file()
+    export_download.refresh_from_db()
+    assert export_download.order_count == 3
@@ -0,0 +1,89 @@
+import datetime as dt
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from home.pagination import KeysetPaginator
+from linnworks.models import LinnworksOrder
+from orders import models
+
+
+@pytest.fixture(autouse=True)
+def orders(order_factory, product_sale_factory):
+    orders = order_factory.create_batch(5, dispatched_at=None)
+    for order in orders:
+        product_sale_factory.create(order=order)
+    return orders
+
+
+@pytest.fixture
+def explain():
+    def _explain(queryset):
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE orders_order, orders_productsale")
+            # The test tables are too small for the planner to choose an index
+            # over a sequential scan.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+    return _explain
+
+
+@pytest.fixture
+def date_from():
+    return timezone.now() - dt.timedelta(days=30)
+
+
+@pytest.mark.django_db
+def test_undispatched_uses_partial_index(explain):
+    plan = explain(models.Order.objects.undispatched())
+    assert "order_undispatched_idx" in plan
+
+
+@pytest.mark.django_db
+def test_urgent_uses_partial_index(explain):
+    plan = explain(models.Order.objects.urgent())
+    assert "order_undispatched_idx" in plan
+
+
+@pytest.mark.django_db
+def test_dispatched_range_uses_dispatched_at_index(explain, date_from):
+    plan = explain(
+        models.Order.objects.filter(
+            dispatched_at__gte=date_from, dispatched_at__lt=timezone.now()
+        )
+    )
+    assert "order_dispatched_at_idx" in plan
+
+
+@pytest.mark.django_db
+def test_recent_orders_uses_dispatched_at_index(explain, date_from):
+    plan = explain(LinnworksOrder.objects.get_recent_orders(date_from))
+    assert "order_dispatched_at_idx" in plan
+
+
+@pytest.mark.django_db
+def test_order_list_uses_recieved_at_index(explain):
+    plan = explain(models.Order.objects.order_by("-recieved_at", "-id")[:51])
+    assert "order_recieved_at_id_idx" in plan
+
+
+@pytest.mark.django_db
+def test_order_list_page_uses_recieved_at_index(explain):
+    paginator = KeysetPaginator(models.Order.objects.order_by("-recieved_at"), 2)
+    cursor = paginator.page().next_cursor
+    plan = explain(paginator.page_queryset(*paginator.decode_cursor(cursor)))
+    assert "order_recieved_at_id_idx" in plan
+
+
+@pytest.mark.django_db
+def test_sold_count_uses_sku_index(explain, date_from):
+    plan = explain(
+        models.ProductSale.objects.filter(
+            sku="ABC-123-TG1",
+            order__dispatched_at__gte=date_from,
+            order__dispatched_at__lt=timezone.now(),
+        )
+    )
+    assert "productsale_sku_order_idx" in plan
@@ -11,7 +11,7 @@ def url():
 @pytest.fixture
 def mock_create_order_export():
     with patch(
-        "orders.views.models.OrderExportDownload.objects.create_download"
+        "orders.views.models.OrderExportDownload.get_or_create_download"
     ) as mock:
         yield mock
 
@@ -54,3 +54,12 @@ def test_invalid_form(url, group_logged_in_client):
 def test_export_created(url, group_logged_in_client, mock_create_order_export):
     group_logged_in_client.post(url)
     mock_create_order_export.assert_called_once()
+
+
+def test_export_created_with_filter_params(
+    url, group_logged_in_client, mock_create_order_export
+):
+    group_logged_in_client.post(url, {"status": "dispatched"})
+    filter_params = mock_create_order_export.call_args.kwargs["filter_params"]
+    assert filter_params["status"] == "dispatched"
+    assert filter_params["country"] == ""
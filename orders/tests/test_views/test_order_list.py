@@ -1,12 +1,10 @@
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 from django.utils import timezone
 from pytest_django.asserts import assertTemplateUsed
 
-from orders import views
-
 
 @pytest.fixture
 def url():
@@ -195,8 +193,21 @@ def test_invalid_form(group_logged_in_client, url):
     assert "country" in response.context["form"].errors
 
 
-def test_page_range():
-    paginator = Mock(num_pages=5)
-    paginator.num_pages = 55
-    page_numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 55]
-    assert views.OrderList().get_page_range(paginator) == page_numbers
+@pytest.mark.django_db
+def test_paginates_with_cursor(order_factory, url, group_logged_in_client):
+    orders = order_factory.create_batch(55)
+    response = group_logged_in_client.get(url)
+    page = response.context["page_obj"]
+    assert len(page) == 50
+    assert page.has_next() is True
+    response = group_logged_in_client.get(url, {"cursor": page.next_cursor})
+    next_page = response.context["page_obj"]
+    assert len(next_page) == 5
+    assert {order.id for order in page} | {order.id for order in next_page} == {
+        order.id for order in orders
+    }
+
+
+def test_invalid_cursor(group_logged_in_client, url):
+    response = group_logged_in_client.get(url, {"cursor": "invalid"})
+    assert response.status_code == 404
@@ -15,6 +15,7 @@ from django.views.generic.edit import CreateView, DeleteView, UpdateView
 from django.views.generic.list import ListView
 
 from home.models import Staff
+from home.pagination import KeysetPaginationMixin
 from home.views import UserInGroupMixin
 from orders import forms, models
 
@@ -109,13 +110,12 @@ class UndispatchedOrders(OrdersUserMixin, TemplateView):
     template_name = "orders/undispatched.html"
 
 
-class OrderList(OrdersUserMixin, ListView):
+class OrderList(OrdersUserMixin, KeysetPaginationMixin, ListView):
     """Display a filterable list of orders."""
 
     template_name = "orders/order_list.html"
     model = models.Order
     paginate_by = 50
-    orphans = 3
     form_class = forms.OrderListFilter
 
     def get(self, *args, **kwargs):
@@ -127,22 +127,14 @@ class OrderList(OrdersUserMixin, ListView):
         """Return a queryset of orders based on GET data."""
         if self.form.is_valid():
             return self.form.get_queryset()
-        return []
+        return self.model.objects.none()
 
     def get_context_data(self, *args, **kwargs):
         """Return the template context."""
         context = super().get_context_data(*args, **kwargs)
         context["form"] = self.form
-        context["page_range"] = self.get_page_range(context["paginator"])
         return context
 
-    def get_page_range(self, paginator):
-        """Return a list of pages to link to."""
-        if paginator.num_pages < 11:
-            return list(range(1, paginator.num_pages + 1))
-        else:
-            return list(range(1, 11)) + [paginator.num_pages]
-
 
 @method_decorator(csrf_exempt, name="dispatch")
 class ExportOrders(OrdersUserMixin, View):
@@ -154,10 +146,8 @@ class ExportOrders(OrdersUserMixin, View):
         """Return an HttpResponse contaning the export or a 404 status."""
         form = self.form_class(self.request.POST)
         if form.is_valid():
-            orders = form.get_queryset()
-            order_ids = list(orders.values_list("id", flat=True))
-            models.OrderExportDownload.objects.create_download(
-                user_id=self.request.user.id, order_ids=order_ids
+            models.OrderExportDownload.get_or_create_download(
+                user=self.request.user, filter_params=form.filter_params()
             )
             return HttpResponse("ok")
         return HttpResponseNotFound()
@@ -179,7 +169,7 @@ class OrderExportStatus(OrdersUserMixin, TemplateView):
         except models.OrderExportDownload.DoesNotExist:
             context["export_record"] = None
         else:
-            context["order_count"] = len(context["export_record"].order_ids)
+            context["order_count"] = context["export_record"].order_count
         return context
 
 
@@ -244,13 +234,12 @@ class PackCountResults(OrdersUserMixin, TemplateView):
 
 
 @method_decorator(csrf_exempt, name="dispatch")
-class PackingMistakes(OrdersUserMixin, ListView):
+class PackingMistakes(OrdersUserMixin, KeysetPaginationMixin, ListView):
     """View for viewing packing mistakes."""
 
     model = models.PackingMistake
     template_name = "orders/packing_mistakes.html"
     paginate_by = 50
-    orphans = 3
     form_class = forms.PackingMistakeFilterForm
 
     def get_context_data(self, *args, **kwargs):
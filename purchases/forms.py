@@ -6,7 +6,7 @@ from django import forms
 from django.db.models import Q
 
 from home.models import Staff
-from inventory.models import BaseProduct
+from inventory.models import BaseProduct, ProductCodeLookup
 from linnworks.models import StockManager
 from purchases import models
 from shipping.models import Country
@@ -27,9 +27,7 @@ class ProductSearchForm(forms.Form):
                 BaseProduct.objects.complete()
                 .active()
                 .filter(
-                    Q(sku=search_term)
-                    | Q(supplier_sku=search_term)
-                    | Q(barcode=search_term)
+                    Q(id__in=ProductCodeLookup.product_ids([search_term]))
                     | Q(product__product_range__name__icontains=search_term)
                     | Q(product__product_range__sku=search_term)
                 )
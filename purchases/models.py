@@ -2,6 +2,7 @@
 
 import csv
 import datetime as dt
+import itertools
 from decimal import Decimal
 from io import StringIO
 
@@ -9,10 +10,12 @@ from django.conf import settings
 from django.core.mail import EmailMessage
 from django.core.validators import MinValueValidator
 from django.db import models, transaction
+from django.db.models.functions import Coalesce, Round
 from django.urls import reverse
 from django.utils import timezone
 from polymorphic.managers import PolymorphicManager
 from polymorphic.models import PolymorphicModel
+from polymorphic.query import PolymorphicQuerySet
 from solo.models import SingletonModel
 
 from home.models import Staff
@@ -116,6 +119,72 @@ class PurchasableShippingService(models.Model):
         verbose_name_plural = "Purchaseable Shipping Services"
 
 
+class BasePurchaseQueryset(PolymorphicQuerySet):
+    """Queryset for the BasePurchase model."""
+
+    def with_report_values(self):
+        """
+        Return non-polymorphic purchases annotated with values for reports.
+
+        Values that depend on the purchase type are read from the child tables
+        with joins, so that purchases of every type are loaded in one query.
+
+        Annotations:
+            type_name: The purchase_type of the purchase's class.
+            product_sku: The SKU of the product purchased, or an empty string.
+            purchase_description: The description of the purchase.
+            price_per_item: The price of each item.
+            amount_to_pay: The amount to pay for the purchase.
+            staff_total: The amount to pay for all purchases by the same staff
+                member in the queryset.
+        """
+        product_description = models.F("productpurchase__product__display_name")
+        shipping_description = models.F(
+            "shippingpurchase__shipping_service__shipping_service__name"
+        )
+        is_product = models.Q(productpurchase__isnull=False)
+        is_shipping = models.Q(shippingpurchase__isnull=False)
+        price_field = models.DecimalField(max_digits=8, decimal_places=2)
+        return (
+            self.non_polymorphic()
+            .select_related("purchased_by")
+            .annotate(
+                type_name=models.Case(
+                    models.When(is_product, then=models.Value("Product")),
+                    models.When(is_shipping, then=models.Value("Shipping")),
+                    default=models.Value("Other"),
+                ),
+                product_sku=Coalesce("productpurchase__product__sku", models.Value("")),
+                purchase_description=models.Case(
+                    models.When(is_product, then=product_description),
+                    models.When(is_shipping, then=shipping_description),
+                    default="otherpurchase__description",
+                    output_field=models.TextField(),
+                ),
+                price_per_item=Coalesce(
+                    "productpurchase__time_of_purchase_item_price",
+                    "shippingpurchase__time_of_purchase_price",
+                    "otherpurchase__price",
+                    output_field=price_field,
+                ),
+                amount_to_pay=Round(
+                    models.F("price_per_item")
+                    * Coalesce(
+                        "productpurchase__time_of_purchase_charge",
+                        models.Value(Decimal(1)),
+                        output_field=price_field,
+                    )
+                    * models.F("quantity"),
+                    2,
+                    output_field=price_field,
+                ),
+                staff_total=models.Window(
+                    models.Sum("amount_to_pay"), partition_by="purchased_by"
+                ),
+            )
+        )
+
+
 class BasePurchase(PolymorphicModel):
     """Base model for purchases."""
 
@@ -134,6 +203,8 @@ class BasePurchase(PolymorphicModel):
     created_at = models.DateTimeField(default=timezone.now)
     modified_at = models.DateTimeField(auto_now=True)
 
+    objects = PolymorphicManager.from_queryset(BasePurchaseQueryset)()
+
 
 class ProductPurchaseManager(PolymorphicManager):
     """Manager for the ProductPurchase model."""
@@ -224,7 +295,7 @@ class ShippingPurchaseManager(PolymorphicManager):
 
     @staticmethod
     def _get_shipping_price(country, shipping_service):
-        return ShippingPrice.objects.find_shipping_price(
+        return ShippingPrice.objects.find_cached_shipping_price(
             country=country, shipping_service=shipping_service
         )
 
@@ -346,31 +417,32 @@ class PurchaseExportReport:
     @classmethod
     def generate_report_text(cls, export):
         """Return io.StringIO containing the report as a .csv."""
-        rows = cls._get_report_data(cls._get_staff_purchases(export))
+        rows = cls._get_report_data(cls._get_purchases(export))
         output = StringIO()
         writer = csv.writer(output)
         writer.writerows(rows)
         return output
 
     @staticmethod
-    def _get_staff_purchases(export):
-        staff_ids = export.purchases.values_list("purchased_by", flat=True)
-        return {
-            staff: export.purchases.filter(purchased_by=staff)
-            for staff in Staff.objects.filter(id__in=staff_ids)
-        }
+    def _get_purchases(export):
+        return (
+            BasePurchase.objects.filter(export=export)
+            .with_report_values()
+            .order_by("purchased_by", "created_at", "id")
+        )
 
     @staticmethod
-    def _get_report_data(staff_purchases):
+    def _get_report_data(purchases):
         rows = []
-        for purchases in staff_purchases.values():
+        for _, staff_purchases in itertools.groupby(
+            purchases, key=lambda purchase: purchase.purchased_by_id
+        ):
+            staff_purchases = list(staff_purchases)
             rows.append(PurchaseExportReport.header)
-            for purchase in purchases:
+            for purchase in staff_purchases:
                 rows.append(PurchaseExportReport._get_purchase_row(purchase))
-            rows.append(
-                ["" for _ in range(6)]
-                + [str(round(sum((_.to_pay()) for _ in purchases), 2))]
-            )
+            staff_total = round(float(staff_purchases[0].staff_total), 2)
+            rows.append(["" for _ in range(6)] + [str(staff_total)])
             rows.append([])
         return rows
 
@@ -378,11 +450,11 @@ class PurchaseExportReport:
     def _get_purchase_row(purchase):
         return [
             str(purchase.purchased_by),
-            purchase.purchase_type,
-            purchase.product.sku if hasattr(purchase, "product") else "",
-            purchase.description,
+            purchase.type_name,
+            purchase.product_sku,
+            purchase.purchase_description,
             purchase.quantity,
             str(purchase.created_at.date()),
-            f"{purchase.item_price:.2f}",
-            f"{purchase.to_pay():.2f}",
+            f"{purchase.price_per_item:.2f}",
+            f"{purchase.amount_to_pay:.2f}",
         ]
@@ -1,5 +1,6 @@
 import pytest_factoryboy
 
+from inventory.factories import VariationOptionValueFactory
 from purchases import factories
 from shipping.factories import CountryFactory
 
@@ -15,3 +16,4 @@ pytest_factoryboy.register(factories.PurchaseExportFactory)
 pytest_factoryboy.register(factories.ProductPurchaseFactory)
 pytest_factoryboy.register(factories.ShippingPurchaseFactory)
 pytest_factoryboy.register(factories.OtherPurchaseFactory)
+pytest_factoryboy.register(VariationOptionValueFactory)
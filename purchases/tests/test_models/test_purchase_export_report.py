@@ -1,3 +1,4 @@
+from decimal import ROUND_HALF_UP, Decimal
 from io import StringIO
 
 import pytest
@@ -38,101 +39,129 @@ def test_header():
     ]
 
 
-@pytest.mark.django_db
-def test_get_purchase_row_with_product_purchase(product_purchase_factory):
-    purchase = product_purchase_factory.create()
-    data = PurchaseExportReport._get_purchase_row(purchase)
-    assert data == [
+def get_report_purchase(purchase):
+    return PurchaseExportReport._get_purchases(purchase.export).get(id=purchase.id)
+
+
+def expected_to_pay(purchase):
+    if purchase.purchase_type == "Product":
+        amount = (
+            purchase.time_of_purchase_item_price
+            * purchase.time_of_purchase_charge
+            * purchase.quantity
+        )
+    else:
+        amount = Decimal(str(purchase.item_price)) * purchase.quantity
+    return amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def expected_row(purchase, sku=""):
+    return [
         str(purchase.purchased_by),
         purchase.purchase_type,
-        purchase.product.sku,
+        sku,
         purchase.description,
         purchase.quantity,
         str(purchase.created_at.date()),
         f"{purchase.item_price:.2f}",
-        f"{purchase.to_pay():.2f}",
+        f"{expected_to_pay(purchase):.2f}",
     ]
 
 
+@pytest.mark.django_db
+def test_get_purchase_row_with_product_purchase(product_purchase_factory):
+    purchase = product_purchase_factory.create()
+    data = PurchaseExportReport._get_purchase_row(get_report_purchase(purchase))
+    assert data == expected_row(purchase, sku=purchase.product.sku)
+
+
+@pytest.mark.django_db
+def test_get_purchase_row_with_product_with_variations(
+    product_purchase_factory, variation_option_value_factory
+):
+    purchase = product_purchase_factory.create()
+    variation_option_value_factory.create(
+        product=purchase.product, variation_option__ordering=1, value="Red"
+    )
+    variation_option_value_factory.create(
+        product=purchase.product, variation_option__ordering=0, value="Large"
+    )
+    data = PurchaseExportReport._get_purchase_row(get_report_purchase(purchase))
+    assert data[3] == purchase.description
+    assert data[3] == (
+        f"{purchase.product.product_range.name} - Large - Red - "
+        f"{purchase.product.supplier_sku}"
+    )
+
+
+@pytest.mark.django_db
+def test_get_purchase_row_with_product_without_supplier_sku(
+    product_purchase_factory,
+):
+    purchase = product_purchase_factory.create(product__supplier_sku=None)
+    data = PurchaseExportReport._get_purchase_row(get_report_purchase(purchase))
+    assert data[3] == purchase.product.product_range.name
+
+
 @pytest.mark.django_db
 def test_get_purchase_row_with_shipping_purchase(shipping_purchase_factory):
     purchase = shipping_purchase_factory.create()
-    data = PurchaseExportReport._get_purchase_row(purchase)
-    assert data == [
-        str(purchase.purchased_by),
-        purchase.purchase_type,
-        "",
-        purchase.description,
-        purchase.quantity,
-        str(purchase.created_at.date()),
-        f"{purchase.item_price:.2f}",
-        f"{purchase.to_pay():.2f}",
-    ]
+    data = PurchaseExportReport._get_purchase_row(get_report_purchase(purchase))
+    assert data == expected_row(purchase)
 
 
 @pytest.mark.django_db
 def test_get_purchase_row_with_other_purchase(other_purchase_factory):
     purchase = other_purchase_factory.create()
-    data = PurchaseExportReport._get_purchase_row(purchase)
-    assert data == [
-        str(purchase.purchased_by),
-        purchase.purchase_type,
-        "",
-        purchase.description,
-        purchase.quantity,
-        str(purchase.created_at.date()),
-        f"{purchase.item_price:.2f}",
-        f"{purchase.to_pay():.2f}",
-    ]
+    data = PurchaseExportReport._get_purchase_row(get_report_purchase(purchase))
+    assert data == expected_row(purchase)
 
 
 @pytest.mark.django_db
-def test_export_data(staff, staff_purchases):
-    data = PurchaseExportReport._get_report_data(staff_purchases)
-    assert data == [
-        PurchaseExportReport.header,
-        PurchaseExportReport._get_purchase_row(staff_purchases[staff[0]][0]),
-        PurchaseExportReport._get_purchase_row(staff_purchases[staff[0]][1]),
-        PurchaseExportReport._get_purchase_row(staff_purchases[staff[0]][2]),
-        [
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            str(round(sum((_.to_pay() for _ in staff_purchases[staff[0]])), 2)),
-        ],
-        [],
-        PurchaseExportReport.header,
-        PurchaseExportReport._get_purchase_row(staff_purchases[staff[1]][0]),
-        PurchaseExportReport._get_purchase_row(staff_purchases[staff[1]][1]),
-        PurchaseExportReport._get_purchase_row(staff_purchases[staff[1]][2]),
-        [
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            str(round(sum((_.to_pay() for _ in staff_purchases[staff[1]])), 2)),
-        ],
-        [],
-        PurchaseExportReport.header,
-        PurchaseExportReport._get_purchase_row(staff_purchases[staff[2]][0]),
-        PurchaseExportReport._get_purchase_row(staff_purchases[staff[2]][1]),
-        PurchaseExportReport._get_purchase_row(staff_purchases[staff[2]][2]),
-        [
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            str(round(sum((_.to_pay() for _ in staff_purchases[staff[2]])), 2)),
-        ],
-        [],
-    ]
+def test_get_purchases_uses_one_query(
+    export,
+    staff_purchases,
+    shipping_purchase_factory,
+    other_purchase_factory,
+    django_assert_num_queries,
+):
+    shipping_purchase_factory.create(export=export)
+    other_purchase_factory.create(export=export)
+    with django_assert_num_queries(1):
+        PurchaseExportReport._get_report_data(
+            PurchaseExportReport._get_purchases(export)
+        )
+
+
+@pytest.mark.django_db
+def test_export_data(export, staff, staff_purchases):
+    data = PurchaseExportReport._get_report_data(
+        PurchaseExportReport._get_purchases(export)
+    )
+    expected = []
+    for staff_member in staff:
+        purchases = sorted(
+            staff_purchases[staff_member], key=lambda _: (_.created_at, _.id)
+        )
+        expected.append(PurchaseExportReport.header)
+        expected.extend(
+            [expected_row(purchase, sku=purchase.product.sku) for purchase in purchases]
+        )
+        total = sum(expected_to_pay(purchase) for purchase in purchases)
+        expected.append(["", "", "", "", "", "", str(round(float(total), 2))])
+        expected.append([])
+    assert data == expected
+
+
+@pytest.mark.django_db
+def test_export_data_excludes_other_exports(
+    export, staff_purchases, product_purchase_factory
+):
+    product_purchase_factory.create()
+    data = PurchaseExportReport._get_report_data(
+        PurchaseExportReport._get_purchases(export)
+    )
+    assert len(data) == 3 * 6
 
 
 @pytest.mark.django_db
@@ -218,10 +218,10 @@ def test_get_shipping_price_method(mock_shipping_price):
     value = models.ShippingPurchaseManager._get_shipping_price(
         shipping_service=shipping_service, country=country
     )
-    mock_shipping_price.objects.find_shipping_price.assert_called_once_with(
+    mock_shipping_price.objects.find_cached_shipping_price.assert_called_once_with(
         country=country, shipping_service=shipping_service
     )
-    assert value == mock_shipping_price.objects.find_shipping_price.return_value
+    assert value == mock_shipping_price.objects.find_cached_shipping_price.return_value
 
 
 def test_calculate_shipping_method(weight):
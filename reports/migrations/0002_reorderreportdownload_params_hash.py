@@ -0,0 +1,35 @@
+# Generated by Django 5.1.1 on 2026-10-19 15:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reports", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="reorderreportdownload",
+            options={
+                "get_latest_by": "requested_at",
+                "ordering": ("-created_at",),
+                "verbose_name": "Reorder Report Download",
+                "verbose_name_plural": "Reorder Report Downlaods",
+            },
+        ),
+        migrations.AddField(
+            model_name="reorderreportdownload",
+            name="params_hash",
+            field=models.CharField(
+                blank=True, db_index=True, default="", max_length=64
+            ),
+        ),
+        migrations.AddField(
+            model_name="reorderreportdownload",
+            name="requested_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
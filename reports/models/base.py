@@ -8,8 +8,10 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db import models
 from file_exchange.models import FileDownload
 
+from home.models import ReusableDownload
 
-class BaseReportDownload(FileDownload):
+
+class BaseReportDownload(ReusableDownload, FileDownload):
     """Base model for report downloads."""
 
     download_file = models.FileField(
@@ -28,7 +28,7 @@ class ReorderReportDownload(BaseReportDownload):
         verbose_name = "Reorder Report Download"
         verbose_name_plural = "Reorder Report Downlaods"
         ordering = ("-created_at",)
-        get_latest_by = "created_at"
+        get_latest_by = "requested_at"
 
     def _get_filename(self):
         date_from = self.date_from.strftime("%Y-%m-%d")
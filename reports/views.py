@@ -68,7 +68,7 @@ class BaseCreateReport(ReportsUserMixin, View):
     model = None
 
     def get_create_download_kwargs(self, form_data):
-        """Return kwargs to be passed to the create_download method."""
+        """Return kwargs to be passed to the get_or_create_download method."""
         return {}
 
     def get_form_data(self):
@@ -86,7 +86,7 @@ class BaseCreateReport(ReportsUserMixin, View):
         try:
             form_data = self.get_form_data()
             create_download_kwargs = self.get_create_download_kwargs(form_data)
-            self.model.objects.create_download(**create_download_kwargs)
+            self.model.get_or_create_download(**create_download_kwargs)
         except Exception:
             return HttpResponseNotFound()
         else:
@@ -132,7 +132,7 @@ class CreateReorderReport(BaseCreateReport):
     model = models.ReorderReportDownload
 
     def get_create_download_kwargs(self, form_data):
-        """Return kwargs to be passed to the create_download method."""
+        """Return kwargs to be passed to the get_or_create_download method."""
         return {
             "user": self.request.user,
             "supplier": form_data["supplier"],
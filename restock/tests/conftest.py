@@ -1,9 +1,16 @@
 import pytest_factoryboy
 
-from inventory.factories import ProductFactory, SupplierFactory
+from fba.factories import FBAOrderFactory
+from inventory.factories import (
+    ProductFactory,
+    SupplierFactory,
+    VariationOptionValueFactory,
+)
 from restock import factories
 
 pytest_factoryboy.register(ProductFactory)
 pytest_factoryboy.register(SupplierFactory)
 pytest_factoryboy.register(factories.ReorderFactory)
 pytest_factoryboy.register(factories.BlacklistedBrandFactory)
+pytest_factoryboy.register(FBAOrderFactory)
+pytest_factoryboy.register(VariationOptionValueFactory)
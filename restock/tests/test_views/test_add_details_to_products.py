@@ -0,0 +1,53 @@
+import pytest
+
+from inventory.models import BaseProduct
+from restock import views
+
+
+@pytest.fixture
+def product(product_factory):
+    return product_factory.create()
+
+
+def get_product(product):
+    return views.add_details_to_products(BaseProduct.objects.filter(id=product.id))[0]
+
+
+@pytest.mark.django_db
+def test_fba_order_count(product, fba_order_factory):
+    fba_order_factory.create_batch(2, product=product, status_not_processed=True)
+    fba_order_factory.create(product=product, status_fulfilled=True)
+    fba_order_factory.create(status_not_processed=True)
+    assert get_product(product).fba_order_count == 2
+
+
+@pytest.mark.django_db
+def test_fba_order_count_without_orders(product):
+    assert get_product(product).fba_order_count == 0
+
+
+@pytest.mark.django_db
+def test_variation_value_list(product, variation_option_value_factory):
+    variation_option_value_factory.create(
+        product=product, variation_option__ordering=1, value="Red"
+    )
+    variation_option_value_factory.create(
+        product=product, variation_option__ordering=0, value="Large"
+    )
+    assert get_product(product).variation_value_list == product.variation_values()
+
+
+@pytest.mark.django_db
+def test_query_count_does_not_depend_on_product_count(
+    product_factory, fba_order_factory, django_assert_num_queries
+):
+    products = product_factory.create_batch(5)
+    for product in products:
+        fba_order_factory.create(product=product, status_not_processed=True)
+    with django_assert_num_queries(3):
+        for product in views.add_details_to_products(
+            BaseProduct.objects.filter(id__in=[product.id for product in products])
+        ):
+            product.supplier
+            product.product_range
+            list(product.additional_suppliers.all())
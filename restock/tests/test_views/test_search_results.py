@@ -36,15 +36,7 @@ def reorder(reorder_factory, product):
 
 
 @pytest.fixture
-def mock_add_details_to_product():
-    with mock.patch(
-        "restock.views.add_details_to_product"
-    ) as mock_add_details_to_product:
-        yield mock_add_details_to_product
-
-
-@pytest.fixture
-def url(mock_add_details_to_product):
+def url():
     return reverse("restock:restock_results")
 
 
@@ -63,13 +55,6 @@ def test_suppliers_in_context(product, get_response):
     assert get_response.context["suppliers"] == {product.supplier: [product]}
 
 
-@pytest.mark.django_db
-def test_calls_add_details_to_product(
-    mock_add_details_to_product, product, get_response
-):
-    mock_add_details_to_product.assert_called_once_with(product)
-
-
 @pytest.mark.django_db
 def test_reorder_counts_in_context(product, reorder, get_response):
     assert get_response.context["reorder_counts"] == {product.id: reorder.count}
@@ -152,3 +137,26 @@ def test_limits_search_results(product_factory, group_logged_in_client, url):
     value = SearchResults().get_products(supplier_sku)
     assert len(value[0]) == 3
     assert value[1] == 4
+
+
+@pytest.mark.django_db
+def test_query_count_does_not_depend_on_product_count(
+    product_factory,
+    reorder_factory,
+    group_logged_in_client,
+    url,
+    django_assert_max_num_queries,
+):
+    products = product_factory.create_batch(3, supplier_sku="AAA")
+    for product in products:
+        reorder_factory.create(product=product, closed=False)
+    group_logged_in_client.get(url, {"product_search": "AAA"})
+    with django_assert_max_num_queries(12) as queries:
+        group_logged_in_client.get(url, {"product_search": "AAA"})
+    query_count = len(queries)
+    for product in product_factory.create_batch(3, supplier_sku="AAA"):
+        reorder_factory.create(product=product, closed=False)
+    group_logged_in_client.get(url, {"product_search": "AAA"})
+    with django_assert_max_num_queries(query_count):
+        response = group_logged_in_client.get(url, {"product_search": "AAA"})
+    assert response.context["result_count"] == 6
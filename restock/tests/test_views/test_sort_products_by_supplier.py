@@ -1,5 +1,3 @@
-from unittest import mock
-
 import pytest
 
 from restock import views
@@ -19,21 +17,10 @@ def products(suppliers, product_factory):
 
 
 @pytest.mark.django_db
-@mock.patch("restock.views.add_details_to_product")
-def test_sort_products_by_supplier(mock_add_details_to_product, suppliers, products):
+def test_sort_products_by_supplier(suppliers, products):
     returned_value = views.sort_products_by_supplier(products)
     assert returned_value == {
         suppliers[0]: [products[0], products[1], products[2]],
         suppliers[1]: [products[3], products[4], products[5]],
         suppliers[2]: [products[6], products[7], products[8]],
     }
-
-
-@pytest.mark.django_db
-@mock.patch("restock.views.add_details_to_product")
-def test_sort_products_by_supplier_sets_product_details(
-    mock_add_details_to_product, products
-):
-    calls = (mock.call(product) for product in products)
-    views.sort_products_by_supplier(products)
-    mock_add_details_to_product.assert_has_calls(calls)
@@ -1,5 +1,3 @@
-from unittest import mock
-
 import pytest
 from django.urls import reverse
 
@@ -20,15 +18,7 @@ def reorder(reorder_factory, product):
 
 
 @pytest.fixture
-def mock_add_details_to_product():
-    with mock.patch(
-        "restock.views.add_details_to_product"
-    ) as mock_add_details_to_product:
-        yield mock_add_details_to_product
-
-
-@pytest.fixture
-def url(mock_add_details_to_product, supplier):
+def url(supplier):
     return reverse("restock:supplier_restock_list", kwargs={"supplier_pk": supplier.pk})
 
 
@@ -44,13 +34,6 @@ def test_uses_template(get_response):
     ]
 
 
-@pytest.mark.django_db
-def test_calls_add_details_to_product(
-    mock_add_details_to_product, reorder, product, get_response
-):
-    mock_add_details_to_product.assert_called_once_with(product)
-
-
 @pytest.mark.django_db
 def test_suppliers_in_context(supplier, reorder, product, get_response):
     assert product in get_response.context["suppliers"][supplier]
@@ -64,3 +47,29 @@ def test_reorder_counts_in_context(reorder, product, get_response):
 @pytest.mark.django_db
 def test_comments_in_context(reorder, product, get_response):
     assert get_response.context["comments"] == {product.id: reorder.comment}
+
+
+@pytest.mark.django_db
+def test_excludes_other_suppliers_reorders(reorder, reorder_factory, get_response):
+    assert list(get_response.context["reorder_counts"]) == [reorder.product_id]
+
+
+@pytest.mark.django_db
+def test_query_count_does_not_depend_on_product_count(
+    supplier,
+    product_factory,
+    reorder_factory,
+    group_logged_in_client,
+    url,
+    django_assert_max_num_queries,
+):
+    group_logged_in_client.get(url)
+    for product in product_factory.create_batch(5, supplier=supplier):
+        reorder_factory.create(product=product, closed=False)
+    with django_assert_max_num_queries(12) as queries:
+        group_logged_in_client.get(url)
+    query_count = len(queries)
+    for product in product_factory.create_batch(5, supplier=supplier):
+        reorder_factory.create(product=product, closed=False)
+    with django_assert_max_num_queries(query_count):
+        group_logged_in_client.get(url)
@@ -2,8 +2,10 @@
 
 from collections import defaultdict
 
+from django.contrib.postgres.expressions import ArraySubquery
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.http import HttpResponseBadRequest, JsonResponse
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
@@ -20,7 +22,12 @@ from django.views.generic import (
 
 from fba.models import FBAOrder
 from home.views import UserInGroupMixin
-from inventory.models import BaseProduct, Supplier
+from inventory.models import (
+    BaseProduct,
+    ProductCodeLookup,
+    Supplier,
+    VariationOptionValue,
+)
 from restock import forms, models
 
 
@@ -34,7 +41,6 @@ def sort_products_by_supplier(products):
     """Return a dict of {supplier:[products]}."""
     suppliers = defaultdict(list)
     for product in products:
-        add_details_to_product(product)
         suppliers[product.supplier].append(product)
     return dict(suppliers)
 
@@ -45,12 +51,48 @@ class RestockView(RestockUserMixin, TemplateView):
     template_name = "restock/restock.html"
 
 
-def add_details_to_product(product):
-    """Add fba order count and last reorder to product objects."""
-    product.fba_order_count = (
-        FBAOrder.objects.awaiting_fulfillment().filter(product=product).count()
+def add_details_to_products(products):
+    """
+    Return products annotated with the details shown on restock lists.
+
+    Annotations:
+        fba_order_count: The number of FBA orders awaiting fulfillment for the
+            product.
+        variation_value_list: The product's variation option values.
+    """
+    fba_order_counts = (
+        FBAOrder.objects.awaiting_fulfillment()
+        .filter(product=OuterRef("pk"))
+        .order_by()
+        .values("product")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    variation_values = (
+        VariationOptionValue.objects.filter(product=OuterRef("pk"))
+        .order_by("variation_option__ordering", "value")
+        .values("value")
+    )
+    return (
+        products.annotate(
+            fba_order_count=Coalesce(Subquery(fba_order_counts), 0),
+            variation_value_list=ArraySubquery(variation_values),
+        )
+        .select_related("supplier", "product_range", "end_of_line_reason")
+        .prefetch_related("additional_suppliers")
     )
-    product.last_reorder = models.Reorder.objects.last_reorder(product)
+
+
+def get_open_reorder_details(reorders):
+    """Return dicts of counts and comments by product ID for open reorders."""
+    reorder_counts = {}
+    comments = {}
+    for product_id, count, comment in reorders.open().values_list(
+        "product_id", "count", "comment"
+    ):
+        reorder_counts[product_id] = count
+        comments[product_id] = comment
+    return reorder_counts, comments
 
 
 class SearchResults(RestockUserMixin, TemplateView):
@@ -66,32 +108,33 @@ class SearchResults(RestockUserMixin, TemplateView):
         search_text = self.request.GET["product_search"]
         products, context["result_count"] = self.get_products(search_text)
         context["result_limit"] = self.RESULT_LIMIT
-        products = products[: self.RESULT_LIMIT]
         context["suppliers"] = sort_products_by_supplier(products)
-        reorders = models.Reorder.objects.filter(product__in=products).open()
-        context["reorder_counts"] = {}
-        context["comments"] = {}
-        for reorder in reorders:
-            context["reorder_counts"][reorder.product.id] = reorder.count
-            context["comments"][reorder.product.id] = reorder.comment
+        context["reorder_counts"], context["comments"] = get_open_reorder_details(
+            models.Reorder.objects.filter(
+                product_id__in=[product.id for product in products]
+            )
+        )
         return context
 
     def get_products(self, search_text):
-        """Return products matching the search string."""
-        search_terms = [_.strip() for _ in search_text.split() if _.strip()]
+        """
+        Return products matching the search string.
+
+        Returns:
+            (list[BaseProduct], int): Up to RESULT_LIMIT matching products and
+                the total number of matches.
+        """
+        product_ids = ProductCodeLookup.product_ids(search_text.split())
         qs = (
             BaseProduct.objects.complete()
             .active()
-            .filter(
-                Q(sku__in=search_terms)
-                | Q(supplier_sku__in=search_terms)
-                | Q(barcode__in=search_terms)
-            )
-            .distinct()
-            .select_related("supplier")
+            .filter(id__in=product_ids)
             .order_by("supplier__name")
         )
-        return qs[: self.RESULT_LIMIT], qs.count()
+        products = list(add_details_to_products(qs)[: self.RESULT_LIMIT])
+        if len(products) < self.RESULT_LIMIT:
+            return products, len(products)
+        return products, qs.count()
 
 
 class RestockList(RestockUserMixin, TemplateView):
@@ -120,21 +163,19 @@ class SupplierRestockList(RestockUserMixin, TemplateView):
         """Return context for the template."""
         context = super().get_context_data(*args, **kwargs)
         supplier = get_object_or_404(Supplier, pk=self.kwargs["supplier_pk"])
-        reorders = models.Reorder.objects.open().select_related(
-            "product", "product__supplier"
+        reorder_counts, comments = get_open_reorder_details(
+            models.Reorder.objects.filter(product__supplier=supplier)
         )
-        product_ids = reorders.values_list("product__id", flat=True)
-        products = models.BaseProduct.objects.filter(
-            id__in=product_ids, supplier=supplier
+        products = list(
+            add_details_to_products(
+                models.BaseProduct.objects.filter(
+                    id__in=list(reorder_counts), supplier=supplier
+                )
+            )
         )
-        for product in products:
-            add_details_to_product(product)
         context["suppliers"] = {supplier: products}
-        context["reorder_counts"] = {}
-        context["comments"] = {}
-        for reorder in reorders:
-            context["reorder_counts"][reorder.product_id] = reorder.count
-            context["comments"][reorder.product_id] = reorder.comment
+        context["reorder_counts"] = reorder_counts
+        context["comments"] = comments
         return context
 
 
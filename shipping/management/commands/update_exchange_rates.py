@@ -4,13 +4,9 @@ Update Exchange Rates managment command.
 Update the exchange rates in the shipping.Currency model.
 """
 
-import logging
-
 from django.core.management.base import BaseCommand
 
-from shipping.models import Currency
-
-logger = logging.getLogger("management_commands")
+from shipping import tasks
 
 
 class Command(BaseCommand):
@@ -20,8 +16,4 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         """Update orders."""
-        try:
-            Currency.objects.update_rates()
-        except Exception as e:
-            logger.exception("Error updating currency exchange rates")
-            raise e
+        tasks.update_exchange_rates()
@@ -4,6 +4,7 @@ import datetime as dt
 import math
 
 import requests
+from django.core.cache import cache
 from django.db import models
 
 
@@ -207,6 +208,9 @@ class ShippingService(models.Model):
 class ShippingPriceManager(models.Manager):
     """Model manager for the ShippingPrice model."""
 
+    PRICE_TABLE_CACHE_KEY = "shipping_price_table"
+    PRICE_TABLE_TIMEOUT = 60 * 60
+
     def find_shipping_price(self, country, shipping_service):
         """Return the shipping price object for a given country and shipping service."""
         try:
@@ -214,6 +218,47 @@ class ShippingPriceManager(models.Manager):
         except ShippingPrice.DoesNotExist:
             return self.get(region=country.region, shipping_service=shipping_service)
 
+    def price_table(self):
+        """
+        Return all shipping prices by shipping service and destination.
+
+        The table is held in the default cache, with each shipping price's weight
+        bands, and cleared whenever a shipping price or weight band is saved or
+        deleted.
+
+        Returns:
+            dict[tuple[int, str, int], ShippingPrice]: Shipping prices keyed by
+                (shipping service ID, "country" or "region", destination ID).
+        """
+        table = cache.get(self.PRICE_TABLE_CACHE_KEY)
+        if table is None:
+            table = {}
+            for shipping_price in self.prefetch_related("weightband_set"):
+                if shipping_price.country_id is not None:
+                    key = ("country", shipping_price.country_id)
+                else:
+                    key = ("region", shipping_price.region_id)
+                table[(shipping_price.shipping_service_id, *key)] = shipping_price
+            cache.set(self.PRICE_TABLE_CACHE_KEY, table, self.PRICE_TABLE_TIMEOUT)
+        return table
+
+    def clear_price_table(self):
+        """Remove the cached shipping price table."""
+        cache.delete(self.PRICE_TABLE_CACHE_KEY)
+
+    def find_cached_shipping_price(self, country, shipping_service):
+        """Return a shipping price for a country and shipping service from the cache."""
+        table = self.price_table()
+        for key in (
+            (shipping_service.id, "country", country.id),
+            (shipping_service.id, "region", country.region_id),
+        ):
+            if key in table:
+                return table[key]
+        raise ShippingPrice.DoesNotExist(
+            f"No shipping price for {shipping_service} to {country}."
+        )
+
 
 class ShippingPrice(models.Model):
     """Model for shipping prices."""
@@ -264,14 +309,26 @@ class ShippingPrice(models.Model):
             location = self.region
         return f"{self.shipping_service} - {location}"
 
+    def save(self, *args, **kwargs):
+        """Save the shipping price and clear the cached price table."""
+        super().save(*args, **kwargs)
+        ShippingPrice.objects.clear_price_table()
+
+    def delete(self, *args, **kwargs):
+        """Delete the shipping price and clear the cached price table."""
+        return_value = super().delete(*args, **kwargs)
+        ShippingPrice.objects.clear_price_table()
+        return return_value
+
     def price(self, weight):
         """Return the shipping price for a given weight in grams."""
         price = 0
         price += self.item_price
         price += self._per_kg_price(weight)
         price += self._per_g_price(weight)
-        if self.weightband_set.count() > 0:
-            price += self._weight_band_price(weight)
+        weight_bands = self.weightband_set.all()
+        if weight_bands:
+            price += self._weight_band_price(weight, weight_bands)
         price += price * (self.fuel_surcharge / 100)
         price += self.item_surcharge
         price += self.covid_surcharge
@@ -284,10 +341,11 @@ class ShippingPrice(models.Model):
     def _per_g_price(self, weight):
         return math.ceil(self.price_per_g * weight)
 
-    def _weight_band_price(self, weight):
-        return self.weightband_set.get(
-            min_weight__lte=weight, max_weight__gte=weight
-        ).price
+    def _weight_band_price(self, weight, weight_bands):
+        for weight_band in weight_bands:
+            if weight_band.min_weight <= weight <= weight_band.max_weight:
+                return weight_band.price
+        raise WeightBand.DoesNotExist(f"No weight band for {weight}g on {self}.")
 
 
 class WeightBand(models.Model):
@@ -307,3 +365,14 @@ class WeightBand(models.Model):
 
     def __str__(self):
         return f"{self.shipping_price} {self.min_weight}g - {self.max_weight}g"
+
+    def save(self, *args, **kwargs):
+        """Save the weight band and clear the cached price table."""
+        super().save(*args, **kwargs)
+        ShippingPrice.objects.clear_price_table()
+
+    def delete(self, *args, **kwargs):
+        """Delete the weight band and clear the cached price table."""
+        return_value = super().delete(*args, **kwargs)
+        ShippingPrice.objects.clear_price_table()
+        return return_value
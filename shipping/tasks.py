@@ -0,0 +1,13 @@
+"""Tasks for the shipping app."""
+
+from celery import shared_task
+
+from home.jobs import scheduled_job
+from shipping import models
+
+
+@shared_task
+@scheduled_job("update_exchange_rates")
+def update_exchange_rates():
+    """Update currency exchange rates."""
+    models.Currency.objects.update_rates()
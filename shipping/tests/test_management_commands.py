@@ -2,14 +2,13 @@ from unittest.mock import patch
 
 import pytest
 
+from home.jobs import JobLock, JobLockedError
 from shipping.management import commands
 
 
 @pytest.fixture
 def mock_currency():
-    with patch(
-        "shipping.management.commands.update_exchange_rates.Currency"
-    ) as mock_currency:
+    with patch("shipping.tasks.models.Currency") as mock_currency:
         yield mock_currency
 
 
@@ -27,3 +26,11 @@ def test_error(mock_currency):
         commands.update_exchange_rates.Command().handle()
     mock_currency.objects.update_rates.assert_called_once()
     assert len(mock_currency.mock_calls) == 1
+
+
+@pytest.mark.django_db
+def test_takes_job_lock(mock_currency):
+    JobLock("update_exchange_rates", timeout=60).acquire()
+    with pytest.raises(JobLockedError):
+        commands.update_exchange_rates.Command().handle()
+    mock_currency.objects.update_rates.assert_not_called()
@@ -260,3 +260,146 @@ def test_find_shipping_price_without_match(shipping_service_factory, country_fac
         models.ShippingPrice.objects.find_shipping_price(
             country=country, shipping_service=shipping_service
         )
+
+
+@pytest.mark.django_db
+def test_find_cached_shipping_price(
+    shipping_price_factory, country_factory, shipping_service_factory
+):
+    shipping_service = shipping_service_factory.create()
+    country = country_factory.create()
+    price = shipping_price_factory.create(
+        shipping_service=shipping_service, country=country, region=None
+    )
+    returned = models.ShippingPrice.objects.find_cached_shipping_price(
+        country=country, shipping_service=shipping_service
+    )
+    assert returned == price
+
+
+@pytest.mark.django_db
+def test_find_cached_shipping_price_by_region(
+    shipping_price_factory, country_factory, shipping_service_factory
+):
+    shipping_service = shipping_service_factory.create()
+    country = country_factory.create()
+    price = shipping_price_factory.create(
+        shipping_service=shipping_service, country=None, region=country.region
+    )
+    returned = models.ShippingPrice.objects.find_cached_shipping_price(
+        country=country, shipping_service=shipping_service
+    )
+    assert returned == price
+
+
+@pytest.mark.django_db
+def test_find_cached_shipping_price_without_match(
+    shipping_service_factory, country_factory
+):
+    shipping_service = shipping_service_factory.create()
+    country = country_factory.create()
+    with pytest.raises(models.ShippingPrice.DoesNotExist):
+        models.ShippingPrice.objects.find_cached_shipping_price(
+            country=country, shipping_service=shipping_service
+        )
+
+
+@pytest.mark.django_db
+def test_find_cached_shipping_price_uses_cache(
+    shipping_price_factory,
+    country_factory,
+    shipping_service_factory,
+    django_assert_num_queries,
+):
+    shipping_service = shipping_service_factory.create()
+    country = country_factory.create()
+    shipping_price_factory.create(
+        shipping_service=shipping_service, country=country, region=None
+    )
+    models.ShippingPrice.objects.find_cached_shipping_price(
+        country=country, shipping_service=shipping_service
+    )
+    with django_assert_num_queries(0):
+        models.ShippingPrice.objects.find_cached_shipping_price(
+            country=country, shipping_service=shipping_service
+        )
+
+
+@pytest.mark.django_db
+def test_saving_shipping_price_clears_price_table(
+    shipping_price_factory, country_factory, shipping_service_factory
+):
+    shipping_service = shipping_service_factory.create()
+    country = country_factory.create()
+    models.ShippingPrice.objects.price_table()
+    price = shipping_price_factory.create(
+        shipping_service=shipping_service, country=country, region=None
+    )
+    returned = models.ShippingPrice.objects.find_cached_shipping_price(
+        country=country, shipping_service=shipping_service
+    )
+    assert returned == price
+
+
+@pytest.mark.django_db
+def test_deleting_shipping_price_clears_price_table(
+    shipping_price_factory, country_factory, shipping_service_factory
+):
+    shipping_service = shipping_service_factory.create()
+    country = country_factory.create()
+    price = shipping_price_factory.create(
+        shipping_service=shipping_service, country=country, region=None
+    )
+    models.ShippingPrice.objects.price_table()
+    price.delete()
+    with pytest.raises(models.ShippingPrice.DoesNotExist):
+        models.ShippingPrice.objects.find_cached_shipping_price(
+            country=country, shipping_service=shipping_service
+        )
+
+
+@pytest.mark.django_db
+def test_cached_shipping_price_prices_weight_bands_without_queries(
+    shipping_price_factory,
+    weight_band_factory,
+    country_factory,
+    shipping_service_factory,
+    django_assert_num_queries,
+):
+    shipping_service = shipping_service_factory.create()
+    country = country_factory.create()
+    shipping_price = shipping_price_factory.create(
+        shipping_service=shipping_service, country=country, region=None
+    )
+    weight_band = weight_band_factory.create(
+        shipping_price=shipping_price, min_weight=0, max_weight=500
+    )
+    models.ShippingPrice.objects.price_table()
+    with django_assert_num_queries(0):
+        returned = models.ShippingPrice.objects.find_cached_shipping_price(
+            country=country, shipping_service=shipping_service
+        )
+        price = returned.price(350)
+    assert price >= weight_band.price
+
+
+@pytest.mark.django_db
+def test_saving_weight_band_clears_price_table(
+    shipping_price_factory,
+    weight_band_factory,
+    country_factory,
+    shipping_service_factory,
+):
+    shipping_service = shipping_service_factory.create()
+    country = country_factory.create()
+    shipping_price = shipping_price_factory.create(
+        shipping_service=shipping_service, country=country, region=None
+    )
+    models.ShippingPrice.objects.price_table()
+    weight_band_factory.create(
+        shipping_price=shipping_price, min_weight=0, max_weight=500
+    )
+    returned = models.ShippingPrice.objects.find_cached_shipping_price(
+        country=country, shipping_service=shipping_service
+    )
+    assert len(returned.weightband_set.all()) == 1
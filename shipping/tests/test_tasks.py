@@ -0,0 +1,34 @@
+from unittest.mock import patch
+
+import pytest
+
+from home.models import JobRun
+from shipping import tasks
+
+
+@pytest.fixture
+def mock_models():
+    with patch("shipping.tasks.models") as mock_models:
+        yield mock_models
+
+
+@pytest.mark.django_db
+def test_update_exchange_rates(mock_models):
+    tasks.update_exchange_rates()
+    mock_models.Currency.objects.update_rates.assert_called_once_with()
+
+
+@pytest.mark.django_db
+def test_update_exchange_rates_records_run(mock_models):
+    tasks.update_exchange_rates()
+    job_run = JobRun.objects.get()
+    assert job_run.name == "update_exchange_rates"
+    assert job_run.status == JobRun.SUCCEEDED
+
+
+@pytest.mark.django_db
+def test_update_exchange_rates_records_failure(mock_models):
+    mock_models.Currency.objects.update_rates.side_effect = Exception()
+    with pytest.raises(Exception):
+        tasks.update_exchange_rates()
+    assert JobRun.objects.get().status == JobRun.FAILED
@@ -8,6 +8,7 @@ from tempfile import SpooledTemporaryFile
 
 import toml
 from amapi.session import AmapiSessionUK, AmapiSessionUS
+from celery.schedules import crontab
 from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
 from django.db import models
@@ -84,10 +85,48 @@ CACHES = {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
         },
     },
+    "product_lookup": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://localhost/",
+        "KEY_PREFIX": "product_lookup",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+        },
+    },
+    "profiling": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://localhost/",
+        "KEY_PREFIX": "profiling",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+        },
+    },
+    "locks": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://localhost/",
+        "KEY_PREFIX": "locks",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+        },
+    },
 }
 
 SELECT2_CACHE_BACKEND = "select2"
 
+PROFILING_ENABLED = True
+PROFILING_SAMPLE_RATE = 0.1
+PROFILING_DEFAULT_QUERY_BUDGET = 50
+PROFILING_QUERY_BUDGETS = {
+    "orders:order_list": 30,
+    "fba:order_list": 30,
+    "fba:on_hold": 30,
+    "fba:stopped": 30,
+    "inventory:product_search": 30,
+    "inventory:product_range": 40,
+    "inventory:images": 30,
+    "inventory:locations": 30,
+}
+
 ALLOWED_HOSTS = get_config("ALLOWED_HOSTS")
 CSRF_TRUSTED_ORIGINS = get_config("CSRF_TRUSTED_ORIGINS")
 ADMINS = get_config("ADMINS")
@@ -204,6 +243,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "home.middleware.ProfilingMiddleware",
 ]
 
 INTERNAL_IPS = ["127.0.0.1"]
@@ -302,6 +342,24 @@ LOGGING = {
             "filters": ["add_user_to_log_record"],
             "formatter": "default_formatter",
         },
+        "profiling_file_handler": {
+            "class": "logging.handlers.RotatingFileHandler",
+            "filename": BASE_DIR / "logs" / "profiling.log",
+            "maxBytes": 1_048_576,
+            "backupCount": 2,
+            "level": "WARNING",
+            "formatter": "default_formatter",
+            "delay": True,
+        },
+        "api_calls_file_handler": {
+            "class": "logging.handlers.RotatingFileHandler",
+            "filename": BASE_DIR / "logs" / "api_calls.log",
+            "maxBytes": 10_485_760,
+            "backupCount": 5,
+            "level": "INFO",
+            "formatter": "default_formatter",
+            "delay": True,
+        },
         "stdout": {"class": "logging.StreamHandler", "level": "INFO"},
     },
     "loggers": {
@@ -330,6 +388,16 @@ LOGGING = {
             "level": "ERROR",
             "propagate": False,
         },
+        "profiling": {
+            "handlers": ["profiling_file_handler"],
+            "level": "WARNING",
+            "propagate": False,
+        },
+        "api_calls": {
+            "handlers": ["api_calls_file_handler"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
     "formatters": {
         "default_formatter": {
@@ -379,6 +447,13 @@ LOGIN_REDIRECT_URL = "home:index"
 CELERY_BROKER_URL = get_config("CELERY_BROKER_URL")
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
+CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    "nightly_jobs": {
+        "task": "home.tasks.run_nightly_jobs",
+        "schedule": crontab(hour=2, minute=0),
+    },
+}
 
 SUMMERNOTE_THEME = "bs5"
 
@@ -456,4 +531,21 @@ IMAGEKIT_SPEC_CACHEFILE_NAMER = "stcadmin.settings.imagekit_processor_namer"
 
 if TESTING:
     MEDIA_ROOT = tempfile.mkdtemp()
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "default",
+    }
+    CACHES["product_lookup"] = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "product_lookup",
+    }
+    CACHES["profiling"] = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "profiling",
+    }
+    CACHES["locks"] = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "locks",
+    }
+    PROFILING_SAMPLE_RATE = 0
     IMAGEKIT_DEFAULT_FILE_STORAGE = "django.core.files.storage.FileSystemStorage"
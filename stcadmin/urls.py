@@ -14,6 +14,16 @@ admin.site.site_header = "STC Stores Administration"
 
 app_name = "stcadmin"
 urlpatterns = [
+    path(
+        "admin/profiling/",
+        admin.site.admin_view(home_views.ProfilingReport.as_view()),
+        name="profiling_report",
+    ),
+    path(
+        "admin/api_calls/",
+        admin.site.admin_view(home_views.APICallReport.as_view()),
+        name="api_call_report",
+    ),
     path("admin/", admin.site.urls),
     path("select2/", include("django_select2.urls")),
     path("summernote/", include("django_summernote.urls")),